@@ -0,0 +1,86 @@
+"""
+Compare concave colliders split to triangles and to merged convex parts.
+Part counts and collision test times against a grid of small probes are
+printed for a few shapes.
+
+Run with ``python benchmarks/bench_decomposition.py``.
+"""
+import math
+import timeit
+
+from pygame_colliders import ConcaveCollider, ConvexCollider
+
+REPEAT = 5
+
+
+def _stairs(steps):
+    points = [(0, 0)]
+    for i in range(steps):
+        points += [((i + 1) * 2, i * 2), ((i + 1) * 2, (i + 1) * 2)]
+    points.append((0, steps * 2))
+    return points
+
+
+def _star(count):
+    points = []
+    for i in range(count):
+        angle = 2 * math.pi * i / count
+        radius = 10 + (i % 2) * 5
+        points.append((math.cos(angle) * radius, math.sin(angle) * radius))
+    return points
+
+
+SHAPES = (
+    ("L-shape", [(0, 0), (4, 0), (4, 2), (2, 2), (2, 4), (0, 4)]),
+    ("C-shape", [(3, 3), (5, 3), (5, 4), (4, 4), (4, 5), (5, 5), (5, 6), (3, 6)]),
+    ("stairs(20)", _stairs(20)),
+    ("star(100)", _star(100)),
+)
+
+
+def _probes(collider, count=20):
+    rect = collider._rect
+    probes = []
+    for i in range(count):
+        for j in range(count):
+            x = rect.left + rect.width * i / count
+            y = rect.top + rect.height * j / count
+            size = rect.width / count
+            probes.append(
+                ConvexCollider([(x, y), (x + size, y + size / 2), (x, y + size)])
+            )
+    return probes
+
+
+def _collide_all(collider, probes):
+    for probe in probes:
+        collider.collide(probe)
+
+
+def main():
+    print(
+        f"{'shape':<12}{'triangles':>10}{'convex':>8}"
+        f"{'triangles ms':>14}{'convex ms':>11}{'speedup':>9}"
+    )
+    for name, points in SHAPES:
+        triangles = ConcaveCollider(points)
+        convex = ConcaveCollider(points, decomposition="convex")
+        probes = _probes(triangles)
+        times = []
+        for collider in (triangles, convex):
+            times.append(
+                min(
+                    timeit.repeat(
+                        lambda: _collide_all(collider, probes), number=1, repeat=REPEAT
+                    )
+                )
+            )
+        print(
+            f"{name:<12}{len(triangles._colliders):>10}{len(convex._colliders):>8}"
+            f"{times[0] * 1000:>14.2f}{times[1] * 1000:>11.2f}"
+            f"{times[0] / times[1]:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Measure memory used per collider for a few typical shapes. Colliders of the
+same shape at different positions share the shape so the shared column shows
+what each additional collider costs. The unique column gives every collider
+a slightly different shape and includes the shape itself.
+
+Shapes are shared only when the vertices relative to the top left corner of
+the bounding box are exactly equal. Vertices of the n-gons are rounded to
+multiples of 2 ** -20 so that moving them by whole units stays exact.
+
+Run with ``python benchmarks/bench_memory.py``.
+"""
+import gc
+import math
+import tracemalloc
+
+from pygame_colliders import (
+    CapsuleCollider,
+    CircleCollider,
+    ConcaveCollider,
+    ConvexCollider,
+)
+
+COUNT = 2000
+GRID = 2**20
+
+
+def _ngon(count, radius):
+    # Multiples of 2 ** -20 stay exact at any position used here
+    return [
+        (
+            round(radius * math.cos(2 * math.pi * i / count) * GRID) / GRID,
+            round(radius * math.sin(2 * math.pi * i / count) * GRID) / GRID,
+        )
+        for i in range(count)
+    ]
+
+
+def _c_shape(size):
+    points = [(0, 0), (2, 0), (2, 1), (1, 1), (1, 2), (2, 2), (2, 3), (0, 3)]
+    return [(x * size, y * size) for x, y in points]
+
+
+def _polygon(make_points, cls):
+    def make(i, shared):
+        size = 1 if shared else 1 + i / COUNT
+        points = [(x + i * 10, y) for x, y in make_points(size)]
+        return cls(points)
+
+    return make
+
+
+def _circle(i, shared):
+    return CircleCollider((i * 10, 0), 1 if shared else 1 + i / COUNT)
+
+
+def _capsule(i, shared):
+    length = 4 if shared else 4 + i / COUNT
+    return CapsuleCollider((i * 10, 0), (i * 10 + length, 0), 1)
+
+
+CASES = (
+    ("triangle", _polygon(lambda s: [(0, 0), (4 * s, 0), (0, 4 * s)], ConvexCollider)),
+    (
+        "box",
+        _polygon(
+            lambda s: [(0, 0), (4 * s, 0), (4 * s, 2 * s), (0, 2 * s)], ConvexCollider
+        ),
+    ),
+    ("hexagon", _polygon(lambda s: _ngon(6, 3 * s), ConvexCollider)),
+    ("circle(48)", _polygon(lambda s: _ngon(48, 3 * s), ConvexCollider)),
+    ("C-shape", _polygon(_c_shape, ConcaveCollider)),
+    ("circle", _circle),
+    ("capsule", _capsule),
+)
+
+
+def _bytes_per_collider(make, shared: bool) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    # Colliders are kept alive until measured
+    colliders = [make(i, shared) for i in range(COUNT)]
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del colliders
+    return (after - before) / COUNT
+
+
+def main():
+    print(f"{'shape':<14}{'shared B':>10}{'unique B':>10}")
+    for name, make in CASES:
+        shared = _bytes_per_collider(make, True)
+        unique = _bytes_per_collider(make, False)
+        print(f"{name:<14}{shared:>10.0f}{unique:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
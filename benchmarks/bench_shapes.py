@@ -0,0 +1,84 @@
+"""
+Compare the specialized kernels of axis-aligned rectangles and triangles to
+the generic separating axis test.
+
+Run with ``python benchmarks/bench_shapes.py``.
+"""
+import random
+import timeit
+
+from pygame_colliders import ConvexCollider, Shape
+from pygame_colliders.shape import _POLYGON
+
+PAIRS = 2000
+REPEAT = 5
+
+
+def _box(x, y):
+    w = random.uniform(1, 4)
+    h = random.uniform(1, 4)
+    return ConvexCollider([(x, y), (x + w, y), (x + w, y + h), (x, y + h)])
+
+
+def _triangle(x, y):
+    return ConvexCollider(
+        [
+            (x, y),
+            (x + random.uniform(1, 4), y + random.uniform(0, 1)),
+            (x + random.uniform(0, 1), y + random.uniform(1, 4)),
+        ]
+    )
+
+
+def _slope(x, y):
+    return ConvexCollider([(x, y + 3), (x + 3, y), (x + 4, y + 2), (x + 1, y + 4)])
+
+
+def _pairs(make_a, make_b):
+    pairs = []
+    while len(pairs) < PAIRS:
+        a = make_a(random.uniform(0, 4), random.uniform(0, 4))
+        b = make_b(random.uniform(0, 4), random.uniform(0, 4))
+        # Only pairs passing the bounding box test reach the kernels
+        if a._rect.collide_rect(b._rect):
+            pairs.append((a, b))
+    return pairs
+
+
+def _unclassify(pairs):
+    # Same colliders with private shapes without the classification. Shared
+    # shapes of the other colliders are left alone.
+    for pair in pairs:
+        for collider in pair:
+            shape = Shape(collider.shape.vertices)
+            shape._kind = _POLYGON
+            collider._shape = shape
+
+
+def _collide_all(pairs):
+    for a, b in pairs:
+        a.collide(b)
+
+
+def main():
+    random.seed(0)
+    cases = (
+        ("aabb vs aabb", _pairs(_box, _box)),
+        ("aabb vs polygon", _pairs(_box, _slope)),
+        ("triangle vs triangle", _pairs(_triangle, _triangle)),
+    )
+    print(f"{'case':<22}{'generic ms':>12}{'fast ms':>12}{'speedup':>10}")
+    for name, pairs in cases:
+        fast = min(timeit.repeat(lambda: _collide_all(pairs), number=1, repeat=REPEAT))
+        _unclassify(pairs)
+        generic = min(
+            timeit.repeat(lambda: _collide_all(pairs), number=1, repeat=REPEAT)
+        )
+        print(
+            f"{name:<22}{generic * 1000:>12.2f}{fast * 1000:>12.2f}"
+            f"{generic / fast:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,23 @@
-from .concave import ConcaveCollider
+from .aabb_tree import AABBTree
+from .base import ALL_LAYERS, DEFAULT_CATEGORY
+from .capsule import CapsuleCollider
+from .circle import CircleCollider
+from .concave import ConcaveCollider, ConcaveShape
+from .contacts import ContactCache
 from .convex import ConvexCollider
+from .kinematic import move_and_slide
+from .layers import LayerStats
+from .manifold import Manifold
 from .rect import Rect
+from .shape import Shape
+from .spatial_hash import SpatialHash
+from .static_tree import StaticTree
+from .sweep import SweepHit
+from .sweep_and_prune import SweepAndPrune
+from .triangulation import TriangulationCache
 from .utils import create_collider
 from .vector import Vector2
+from .world import CollisionWorld
 
 try:
     import importlib.metadata as importlib_metadata
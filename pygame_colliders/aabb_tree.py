@@ -0,0 +1,408 @@
+from typing import Dict, Iterator, List, Tuple, Union
+
+from .base import Collider
+from .layers import LayerStats
+from .rect import Rect
+
+
+class _TreeNode:
+    def __init__(self):
+        self.left: float = 0.0
+        self.top: float = 0.0
+        self.right: float = 0.0
+        self.bottom: float = 0.0
+        self.parent: Union["_TreeNode", None] = None
+        self.child1: Union["_TreeNode", None] = None
+        self.child2: Union["_TreeNode", None] = None
+        self.height: int = 0
+        self.collider: Union[Collider, None] = None
+
+    @property
+    def is_leaf(self) -> bool:
+        return self.child1 is None
+
+    def set_union(self, a: "_TreeNode", b: "_TreeNode"):
+        self.left = min(a.left, b.left)
+        self.top = min(a.top, b.top)
+        self.right = max(a.right, b.right)
+        self.bottom = max(a.bottom, b.bottom)
+
+    def overlaps(self, other: "_TreeNode") -> bool:
+        return (
+            self.left <= other.right
+            and self.right >= other.left
+            and self.top <= other.bottom
+            and self.bottom >= other.top
+        )
+
+
+def _perimeter(left: float, top: float, right: float, bottom: float) -> float:
+    return 2.0 * ((right - left) + (bottom - top))
+
+
+def _union_perimeter(a: _TreeNode, b: _TreeNode) -> float:
+    return _perimeter(
+        min(a.left, b.left),
+        min(a.top, b.top),
+        max(a.right, b.right),
+        max(a.bottom, b.bottom),
+    )
+
+
+class AABBTree:
+    """
+    Dynamic bounding volume tree broad phase. Works well when collider sizes
+    vary a lot, from small bullets to level sized terrain.
+
+    Every leaf stores a bounding box fattened by ``margin`` so small moves
+    don't touch the tree at all. When a collider leaves its fattened box it is
+    reinserted and the tree is rebalanced with rotations.
+
+    Example of usage:
+
+    .. code-block:: python
+
+        tree = AABBTree(margin=4)
+        tree.insert(collider_a)
+        tree.insert(collider_b)
+
+        for a, b in tree.pairs():
+            if a.collide(b):
+                print("Collision detected")
+
+    :param margin: Amount to grow the bounding boxes of the leaves to each
+        direction.
+    :type margin: float, int
+    """
+
+    def __init__(self, margin: float = 4.0):
+        if margin < 0:
+            raise ValueError("Margin can't be negative")
+        self._margin = margin
+        self._root: Union[_TreeNode, None] = None
+        self._leaves: Dict[Collider, _TreeNode] = {}
+        self._layer_stats = LayerStats()
+
+    @property
+    def margin(self) -> float:
+        """
+        Amount the leaf bounding boxes are grown to each direction.
+
+        :getter: the margin
+        :type: float, int
+        """
+        return self._margin
+
+    @property
+    def layer_stats(self) -> LayerStats:
+        """
+        Statistics of the pairs culled by collision layers.
+
+        :getter: the statistics
+        :type: LayerStats
+        """
+        return self._layer_stats
+
+    @property
+    def height(self) -> int:
+        """
+        Height of the tree. Empty tree and a tree with a single leaf have
+        height of 0.
+
+        :getter: the height
+        :type: int
+        """
+        if self._root is None:
+            return 0
+        return self._root.height
+
+    def __len__(self) -> int:
+        return len(self._leaves)
+
+    def __contains__(self, collider: Collider) -> bool:
+        return collider in self._leaves
+
+    def __iter__(self) -> Iterator[Collider]:
+        return iter(self._leaves)
+
+    def _fatten(self, node: _TreeNode, rect: Rect):
+        margin = self._margin
+        node.left = rect.left - margin
+        node.top = rect.top - margin
+        node.right = rect.right + margin
+        node.bottom = rect.bottom + margin
+
+    def insert(self, collider: Collider):
+        """
+        Add collider to the tree.
+
+        :param collider: Collider to add.
+        :type collider: Collider
+        """
+        if collider in self._leaves:
+            return
+        leaf = _TreeNode()
+        leaf.collider = collider
+        self._fatten(leaf, collider._rect)
+        self._leaves[collider] = leaf
+        self._insert_leaf(leaf)
+        collider._broadphases.append(self)
+
+    def remove(self, collider: Collider):
+        """
+        Remove collider from the tree.
+
+        :param collider: Collider to remove.
+        :type collider: Collider
+        """
+        leaf = self._leaves.pop(collider)
+        self._remove_leaf(leaf)
+        collider._broadphases.remove(self)
+
+    def update(self, collider: Collider):
+        """
+        Update the tree after collider has moved. Called automatically when a
+        collider is moved. Tree is restructured only when the collider has
+        left its fattened bounding box.
+
+        :param collider: Collider that has moved.
+        :type collider: Collider
+        """
+        leaf = self._leaves[collider]
+        rect = collider._rect
+        if (
+            leaf.left <= rect.left
+            and leaf.top <= rect.top
+            and leaf.right >= rect.right
+            and leaf.bottom >= rect.bottom
+        ):
+            return
+        self._remove_leaf(leaf)
+        self._fatten(leaf, rect)
+        self._insert_leaf(leaf)
+
+    def _insert_leaf(self, leaf: _TreeNode):
+        if self._root is None:
+            self._root = leaf
+            leaf.parent = None
+            return
+
+        # Find the best sibling by walking down the cheapest branch
+        node = self._root
+        while not node.is_leaf:
+            area = _perimeter(node.left, node.top, node.right, node.bottom)
+            combined = _union_perimeter(node, leaf)
+
+            # Cost of creating a new parent for this node and the new leaf
+            cost = 2.0 * combined
+            # Minimum cost of pushing the leaf further down the tree
+            inheritance = 2.0 * (combined - area)
+
+            cost1 = self._descend_cost(node.child1, leaf) + inheritance
+            cost2 = self._descend_cost(node.child2, leaf) + inheritance
+
+            if cost < cost1 and cost < cost2:
+                break
+            node = node.child1 if cost1 < cost2 else node.child2
+
+        sibling = node
+        old_parent = sibling.parent
+        new_parent = _TreeNode()
+        new_parent.parent = old_parent
+        new_parent.set_union(leaf, sibling)
+        new_parent.height = sibling.height + 1
+        new_parent.child1 = sibling
+        new_parent.child2 = leaf
+        sibling.parent = new_parent
+        leaf.parent = new_parent
+
+        if old_parent is None:
+            self._root = new_parent
+        elif old_parent.child1 is sibling:
+            old_parent.child1 = new_parent
+        else:
+            old_parent.child2 = new_parent
+
+        self._refit(leaf.parent)
+
+    @staticmethod
+    def _descend_cost(child: _TreeNode, leaf: _TreeNode) -> float:
+        combined = _union_perimeter(child, leaf)
+        if child.is_leaf:
+            return combined
+        return combined - _perimeter(child.left, child.top, child.right, child.bottom)
+
+    def _remove_leaf(self, leaf: _TreeNode):
+        if leaf is self._root:
+            self._root = None
+            return
+
+        parent = leaf.parent
+        grand_parent = parent.parent
+        sibling = parent.child2 if parent.child1 is leaf else parent.child1
+
+        if grand_parent is None:
+            self._root = sibling
+            sibling.parent = None
+        else:
+            if grand_parent.child1 is parent:
+                grand_parent.child1 = sibling
+            else:
+                grand_parent.child2 = sibling
+            sibling.parent = grand_parent
+            self._refit(grand_parent)
+        leaf.parent = None
+
+    def _refit(self, node: Union[_TreeNode, None]):
+        # Walk back up the tree fixing heights and bounding boxes
+        while node is not None:
+            node = self._balance(node)
+            child1 = node.child1
+            child2 = node.child2
+            node.height = 1 + max(child1.height, child2.height)
+            node.set_union(child1, child2)
+            node = node.parent
+
+    def _balance(self, a: _TreeNode) -> _TreeNode:
+        """
+        Rotate the subtree rooted at ``a`` if it's imbalanced. Returns the new
+        root of the subtree.
+        """
+        if a.is_leaf or a.height < 2:
+            return a
+
+        b = a.child1
+        c = a.child2
+        balance = c.height - b.height
+
+        if balance > 1:
+            return self._rotate_up(a, c, b, a_child_is_first=False)
+        if balance < -1:
+            return self._rotate_up(a, b, c, a_child_is_first=True)
+        return a
+
+    def _rotate_up(
+        self, a: _TreeNode, up: _TreeNode, other: _TreeNode, a_child_is_first: bool
+    ) -> _TreeNode:
+        # Promote ``up`` to the place of ``a``.
+        f = up.child1
+        g = up.child2
+
+        up.child1 = a
+        up.parent = a.parent
+        a.parent = up
+
+        if up.parent is None:
+            self._root = up
+        elif up.parent.child1 is a:
+            up.parent.child1 = up
+        else:
+            up.parent.child2 = up
+
+        # Keep the taller grandchild under ``up`` and hand the other to ``a``
+        if f.height > g.height:
+            keep, give = f, g
+        else:
+            keep, give = g, f
+
+        up.child2 = keep
+        if a_child_is_first:
+            a.child1 = give
+        else:
+            a.child2 = give
+        give.parent = a
+
+        a.set_union(other, give)
+        a.height = 1 + max(other.height, give.height)
+        up.set_union(a, keep)
+        up.height = 1 + max(a.height, keep.height)
+        return up
+
+    def pairs(self) -> Iterator[Tuple[Collider, Collider]]:
+        """
+        Iterate over pairs of colliders whose bounding boxes overlap. Pairs
+        whose collision layers don't match are skipped.
+
+        :return: Iterator of collider pairs
+        :rtype: iterator(tuple(Collider, Collider))
+        """
+        if self._root is None:
+            return
+
+        layer_stats = self._layer_stats
+        # Pairs inside each internal node come from crossing its two subtrees
+        cross_stack: List[Tuple[_TreeNode, _TreeNode]] = []
+        node_stack = [self._root]
+        while node_stack:
+            node = node_stack.pop()
+            if node.is_leaf:
+                continue
+            node_stack.append(node.child1)
+            node_stack.append(node.child2)
+            cross_stack.append((node.child1, node.child2))
+
+            while cross_stack:
+                a, b = cross_stack.pop()
+                if not a.overlaps(b):
+                    continue
+                if a.is_leaf and b.is_leaf:
+                    ca = a.collider
+                    cb = b.collider
+                    if not (ca._category & cb._mask and cb._category & ca._mask):
+                        layer_stats.record(ca, cb)
+                    elif ca._rect.collide_rect(cb._rect):
+                        yield ca, cb
+                elif b.is_leaf or (not a.is_leaf and a.height >= b.height):
+                    cross_stack.append((a.child1, b))
+                    cross_stack.append((a.child2, b))
+                else:
+                    cross_stack.append((a, b.child1))
+                    cross_stack.append((a, b.child2))
+
+    def query_rect(
+        self, rect: Rect, collider: Union[Collider, None] = None
+    ) -> List[Collider]:
+        """
+        Find colliders whose bounding boxes overlap the given rect.
+
+        When ``collider`` is given, colliders whose collision layers don't
+        match with it are skipped.
+
+        :param rect: Area to search.
+        :param collider: Collider to match the collision layers against.
+        :type rect: Rect
+        :type collider: Collider or None
+        :return: Colliders overlapping the area
+        :rtype: list(Collider)
+        """
+        found = []
+        if self._root is None:
+            return found
+
+        left = rect.left
+        top = rect.top
+        right = rect.right
+        bottom = rect.bottom
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if (
+                node.left > right
+                or node.right < left
+                or node.top > bottom
+                or node.bottom < top
+            ):
+                continue
+            if node.is_leaf:
+                other = node.collider
+                if collider is not None and not (
+                    collider._category & other._mask
+                    and other._category & collider._mask
+                ):
+                    continue
+                if rect.collide_rect(other._rect):
+                    found.append(other)
+            else:
+                stack.append(node.child1)
+                stack.append(node.child2)
+        return found
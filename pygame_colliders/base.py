@@ -9,16 +9,112 @@ try:
 except ImportError:
     HAS_PYGAME = False
 
+DEFAULT_CATEGORY = 0x0001
+ALL_LAYERS = 0xFFFFFFFF
+
 
 class Collider:
-    def __init__(self, data: Any = None):
+    # Subclasses list their own attributes too. Anything else can be attached
+    # to the collider with ``data``.
+    __slots__ = (
+        "_rect",
+        "_data",
+        "_category",
+        "_mask",
+        "_broadphases",
+        "_version",
+        "_rotation",
+        "_scale",
+        "__weakref__",
+    )
+
+    def __init__(
+        self,
+        data: Any = None,
+        category: int = DEFAULT_CATEGORY,
+        mask: int = ALL_LAYERS,
+    ):
         self._rect: Union[Rect, None] = None
-        self.points: List[List[Union[float, int]]] = []
         self._data = data
+        self._category = category
+        self._mask = mask
+        self._broadphases: List[Any] = []  # Broad phases tracking this collider
+        self._version = 0
+        self._rotation: float = 0
+        self._scale: float = 1
 
     def _move(self, dx: float, dy: float):
+        if not dx and not dy:
+            return
+
         self._rect.x += dx
         self._rect.y += dy
+        self._changed()
+
+    def _changed(self):
+        self._version += 1
+
+        # Let broad phases update their bookkeeping
+        for broadphase in self._broadphases:
+            broadphase.update(self)
+
+    def _transform(self, rotation: float, scale: float):
+        """
+        Rotate and scale the collider from its untransformed state. Abstract
+        hook called by the ``rotation`` and ``scale`` setters, implemented
+        by every collider class.
+
+        :param rotation: Rotation in degrees.
+        :param scale: Scale factor, always positive.
+        :type rotation: float
+        :type scale: float
+        """
+        raise NotImplementedError
+
+    @property
+    def rotation(self) -> float:
+        """
+        Rotation of the collider in degrees around the center of the bounding
+        box of the unrotated collider. Positive angles turn x axis towards y
+        axis like ``pygame.math.Vector2.rotate()`` does.
+
+        :getter: the rotation
+        :setter: the new rotation
+        :type: float, int
+        """
+        return self._rotation
+
+    @rotation.setter
+    def rotation(self, value: float):
+        self._transform(value, self._scale)
+
+    @property
+    def scale(self) -> float:
+        """
+        Scale factor of the collider around the same center as the rotation.
+
+        :getter: the scale
+        :setter: the new scale, must be positive
+        :type: float, int
+        """
+        return self._scale
+
+    @scale.setter
+    def scale(self, value: float):
+        if value <= 0:
+            raise ValueError("Scale must be positive")
+        self._transform(self._rotation, value)
+
+    @property
+    def version(self) -> int:
+        """
+        Counter increased every time the collider changes. Results computed
+        from the collider can be reused as long as the version stays the same.
+
+        :getter: the version
+        :type: int
+        """
+        return self._version
 
     @property
     def data(self) -> Any:
@@ -28,6 +124,56 @@ class Collider:
     def data(self, value: Any):
         self._data = value
 
+    @property
+    def category(self) -> int:
+        """
+        Collision layer bits this collider belongs to.
+
+        :getter: the category bits
+        :setter: the new category bits
+        :type: int
+        """
+        return self._category
+
+    @category.setter
+    def category(self, value: int):
+        self._category = value
+        self._refilter()
+
+    @property
+    def mask(self) -> int:
+        """
+        Collision layer bits this collider can collide with. Broad phases
+        only pair colliders when both colliders accept each other's category.
+
+        :getter: the mask bits
+        :setter: the new mask bits
+        :type: int
+        """
+        return self._mask
+
+    @mask.setter
+    def mask(self, value: int):
+        self._mask = value
+        self._refilter()
+
+    def can_collide(self, other: "Collider") -> bool:
+        """
+        Check if collision layers of the colliders allow them to collide.
+
+        :param other: Other collider to check.
+        :type other: Collider
+        :return: True if layers do match, False otherwise
+        :rtype: bool
+        """
+        return bool(self._category & other._mask and other._category & self._mask)
+
+    def _refilter(self):
+        # Broad phases caching pairs need to see the new layers
+        for broadphase in self._broadphases[:]:
+            broadphase.remove(self)
+            broadphase.insert(self)
+
     @property
     def x(self) -> float:
         """
@@ -0,0 +1,63 @@
+from typing import Any, Tuple
+
+from .base import ALL_LAYERS, DEFAULT_CATEGORY
+from .rounded import RoundCollider
+
+
+class CapsuleCollider(RoundCollider):
+    """
+    Creates new capsule collider from the end points of its center line and
+    radius. Capsule is the shape of a circle moved along the center line.
+
+    Example of usage:
+
+    .. code-block:: python
+
+        collider = CapsuleCollider((10, 4), (10, 20), 4)
+
+    :param start: Start point of the center line.
+    :param end: End point of the center line.
+    :param radius: Radius of the rounded ends.
+    :type start: tuple(float/int, float/int)
+    :type end: tuple(float/int, float/int)
+    :type radius: float, int
+    """
+
+    __slots__ = ()
+
+    def __init__(
+        self,
+        start: Tuple[float, float],
+        end: Tuple[float, float],
+        radius: float,
+        data: Any = None,
+        category: int = DEFAULT_CATEGORY,
+        mask: int = ALL_LAYERS,
+    ):
+        super().__init__(start, end, radius, data=data, category=category, mask=mask)
+
+    @property
+    def start(self) -> Tuple[float, float]:
+        """
+        Start point of the center line.
+
+        :getter: the coordinates
+        :type: tuple(float/int, float/int)
+        """
+        x, y = self.points[0]
+        return x, y
+
+    @property
+    def end(self) -> Tuple[float, float]:
+        """
+        End point of the center line.
+
+        :getter: the coordinates
+        :type: tuple(float/int, float/int)
+        """
+        x, y = self.points[-1]
+        return x, y
+
+    def __str__(self):
+        (ax, ay), (bx, by) = self.points[0], self.points[-1]
+        return f"Capsule[[{ax}, {ay}], [{bx}, {by}], {self._radius}]"
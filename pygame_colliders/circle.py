@@ -0,0 +1,39 @@
+from typing import Any, Tuple
+
+from .base import ALL_LAYERS, DEFAULT_CATEGORY
+from .rounded import RoundCollider
+
+
+class CircleCollider(RoundCollider):
+    """
+    Creates new circle collider from center point and radius.
+
+    Example of usage:
+
+    .. code-block:: python
+
+        collider = CircleCollider((10, 10), 4)
+
+    :param center: Center point of the circle.
+    :param radius: Radius of the circle.
+    :type center: tuple(float/int, float/int)
+    :type radius: float, int
+    """
+
+    __slots__ = ()
+
+    def __init__(
+        self,
+        center: Tuple[float, float],
+        radius: float,
+        data: Any = None,
+        category: int = DEFAULT_CATEGORY,
+        mask: int = ALL_LAYERS,
+    ):
+        super().__init__(
+            center, center, radius, data=data, category=category, mask=mask
+        )
+
+    def __str__(self):
+        x, y = self.points[0]
+        return f"Circle[[{x}, {y}], {self._radius}]"
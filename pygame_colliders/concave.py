@@ -1,9 +1,25 @@
-from typing import List, Tuple, Any
+from collections import OrderedDict
+from typing import Iterator, List, Sequence, Tuple, Any, Union
 
-from .base import Collider
-from .vector import Vector2
+from .base import ALL_LAYERS, DEFAULT_CATEGORY, Collider
 from .rect import Rect
-from .convex import ConvexCollider
+from .convex import AxisCache, ConvexCollider
+from .manifold import Manifold
+from .part_tree import PartTree
+from .shape import Shape, _rotation, _transformed, intern_shape
+from .sweep import SweepHit
+from .triangulation import TriangulationCache, merge_triangles, triangulate
+
+EAR_CLIPPING = "ear_clipping"
+INDEXED_EAR_CLIPPING = "indexed_ear_clipping"
+TRIANGULATIONS = (EAR_CLIPPING, INDEXED_EAR_CLIPPING)
+
+TRIANGLES = "triangles"
+CONVEX = "convex"
+DECOMPOSITIONS = (TRIANGLES, CONVEX)
+
+# Cache shared by the concave colliders unless given otherwise
+TRIANGULATION_CACHE = TriangulationCache()
 
 
 def is_ccw(points: List[List[float]]):
@@ -54,32 +70,162 @@ def in_tri(point: List[float], tri: List[List[float]]) -> bool:
     return (1.0 - alpha - beta) >= 0
 
 
-class ConcaveCollider(Collider):
+class ConcaveShape:
+    """
+    Immutable concave polygon in local coordinates split to convex parts.
+    The triangulation and the tree over the parts are computed once here and
+    shared by all the colliders of the same shape.
+
+    :param points: Vertices of the polygon in local coordinates.
+    :param triangulation: Algorithm used to split the polygon to triangles,
+        ``"indexed_ear_clipping"`` or ``"ear_clipping"``.
+    :param decomposition: Kind of the convex parts, ``"triangles"`` or
+        ``"convex"``.
+    :type points: list(tuple(float, float))
+    :type triangulation: str
+    :type decomposition: str
     """
-    Creates new concave collider from given list of tuples.
 
-    Example of usage:
+    def __init__(
+        self,
+        points: Sequence[Sequence[float]],
+        triangulation: str = INDEXED_EAR_CLIPPING,
+        decomposition: str = TRIANGLES,
+    ):
+        if triangulation not in TRIANGULATIONS:
+            raise ValueError(
+                f"Unknown triangulation {triangulation!r}, "
+                f"expected one of {TRIANGULATIONS}"
+            )
+        if decomposition not in DECOMPOSITIONS:
+            raise ValueError(
+                f"Unknown decomposition {decomposition!r}, "
+                f"expected one of {DECOMPOSITIONS}"
+            )
+        self._triangulation = triangulation
+        self._decomposition = decomposition
+        self._points: Tuple[Tuple[float, float], ...] = tuple(
+            (x, y) for x, y in points
+        )
+        self._parts: Tuple[Shape, ...] = ()
+        self._part_tree = PartTree(())
+        self._rect = Rect(0, 0, 0, 0)
+        # Untransformed shape and the transformed variants of this shape
+        self._base: Union[ConcaveShape, None] = None
+        self._transforms: Union[OrderedDict, None] = None
 
-    .. code-block:: python
+        self._setup()
 
-        collider_points = [(3, 3), (5, 3), (5, 4), (4, 4), (4, 5), (5, 5), (5, 6), (3, 6)]
-        collider = ConcaveCollider(collider_points)
+    @property
+    def points(self) -> Tuple[Tuple[float, float], ...]:
+        """
+        Vertices of the polygon in local coordinates.
 
-    """
+        :getter: the vertices
+        :type: tuple(tuple(float, float))
+        """
+        return self._points
 
-    def __init__(self, points: List[Tuple[float]], data: Any = None):
-        super().__init__(data=data)
-        self.points = [[x, y] for x, y in points]  # Must be mutable
-        self._vertices: List[Vector2] = []
-        self._colliders: List[ConvexCollider] = []
+    @property
+    def parts(self) -> Tuple[Shape, ...]:
+        """
+        Convex parts of the polygon in the local coordinates of the polygon.
 
-        self._setup()
+        :getter: the parts
+        :type: tuple(Shape)
+        """
+        return self._parts
+
+    @property
+    def triangulation(self) -> str:
+        """
+        Algorithm used to split the shape to triangles,
+        ``"indexed_ear_clipping"`` or ``"ear_clipping"``.
+
+        :getter: the triangulation
+        :type: str
+        """
+        return self._triangulation
+
+    @property
+    def decomposition(self) -> str:
+        """
+        Kind of the convex parts the shape is split to, ``"triangles"`` or
+        ``"convex"``.
+
+        :getter: the decomposition
+        :type: str
+        """
+        return self._decomposition
 
     def _setup(self):
-        # Triangulate before setting up vertices
+        # Parts are made of the point objects of the polygon
+        points = [[x, y] for x, y in self._points]
+        index = {id(p): i for i, p in enumerate(points)}
+        local = self._points
+        self._parts = tuple(
+            intern_shape([local[index[id(p)]] for p in part])
+            for part in self._split(points)
+        )
+        self._setup_rect()
+
+    def _setup_rect(self):
+        self._part_tree = PartTree([part._rect for part in self._parts])
+
+        xs = [x for x, _ in self._points]
+        ys = [y for _, y in self._points]
+        self._rect = Rect(min(xs), min(ys), max(xs) - min(xs), max(ys) - min(ys))
+
+    def transformed(self, rotation: float = 0, scale: float = 1) -> "ConcaveShape":
+        """
+        Rotate and scale the shape around the center of its bounding box.
+        The parts are transformed instead of splitting the shape again and
+        only the tree over the parts is rebuilt. Last
+        ``TRANSFORM_CACHE_SIZE`` variants are remembered by the shape.
+
+        :param rotation: Rotation in degrees. Positive angles turn x axis
+            towards y axis.
+        :param scale: Scale factor, must be positive.
+        :type rotation: float
+        :type scale: float
+        :return: Transformed shape
+        :rtype: ConcaveShape
+        """
+        return _transformed(self, rotation, scale)
+
+    def _transform(self, rotation: float, scale: float, px: float, py: float):
+        c, s = _rotation(rotation)
+        c *= scale
+        s *= scale
+        shape = ConcaveShape.__new__(ConcaveShape)
+        shape._triangulation = self._triangulation
+        shape._decomposition = self._decomposition
+        shape._points = tuple(
+            (px + c * (x - px) - s * (y - py), py + s * (x - px) + c * (y - py))
+            for x, y in self._points
+        )
+        # Parts turn around the pivot of the whole shape
+        shape._parts = tuple(
+            part._transform(rotation, scale, px, py) for part in self._parts
+        )
+        shape._base = None
+        shape._transforms = None
+        shape._setup_rect()
+        return shape
+
+    def _split(self, points: List[List[float]]) -> List[Tuple[List[float], ...]]:
+        if self._triangulation == EAR_CLIPPING:
+            parts = self._ear_clipping(points)
+        else:
+            parts = triangulate(points)
+        if self._decomposition == CONVEX:
+            parts = merge_triangles(points, parts)
+        return parts
+
+    def _ear_clipping(self, points: List[List[float]]) -> List[Tuple[List[float], ...]]:
         triangles = []
 
-        shape = self.points[:]
+        shape = points[:]
         index = self._get_top_left_vertex(shape)
 
         o = is_ccw(make_ear(shape, index))
@@ -108,12 +254,7 @@ class ConcaveCollider(Collider):
                 break
             triangles.append(make_ear(shape, eartip))
             del shape[eartip]
-
-        # Convert triangles to ConvexColliders
-        self._colliders = [ConvexCollider(points) for points in triangles]
-
-        self._setup_vertices()
-        self._setup_rect()
+        return triangles
 
     def _find_ear(self, eartip, i, reflex, shape, tri):
         # Test reflex vertices first.
@@ -150,28 +291,178 @@ class ConcaveCollider(Collider):
                 index = x
         return index
 
-    def _setup_vertices(self):
-        self._vertices = [Vector2(*p) for p in self.points]
+    def __repr__(self):
+        return f"ConcaveShape<{list(self._points)}>"
 
-    def _setup_rect(self):
-        min_x = self._vertices[0].x
-        min_y = self._vertices[0].y
-        max_x = self._vertices[0].x
-        max_y = self._vertices[0].y
-        for vec in self._vertices[1:]:
-            min_x = min(vec._x, min_x)
-            max_x = max(vec._x, max_x)
-            min_y = min(vec._y, min_y)
-            max_y = max(vec._y, max_y)
 
-        self._rect = Rect(min_x, min_y, max_x - min_x, max_y - min_y)
+class ConcaveCollider(Collider):
+    """
+    Creates new concave collider from given list of tuples.
+
+    Example of usage:
+
+    .. code-block:: python
+
+        collider_points = [
+            (3, 3), (5, 3), (5, 4), (4, 4), (4, 5), (5, 5), (5, 6), (3, 6)
+        ]
+        collider = ConcaveCollider(collider_points)
+
+    The polygon is split to triangles with ear clipping. By default
+    (``"indexed_ear_clipping"``) vertices are kept in a linked list and only
+    reflex vertices found from a grid are tested against the ears which is
+    fast for polygons with many vertices. The original algorithm scanning
+    all the vertices is available as ``"ear_clipping"``.
+
+    With ``decomposition="convex"`` the triangles are merged to fewer
+    convex parts which makes collision tests faster. For example an L-shape
+    becomes two rectangles instead of four triangles.
+
+    The split polygon is kept in a :class:`ConcaveShape` remembered in
+    ``triangulation_cache`` with the vertices relative to the top left
+    corner of the bounding box as the key. Colliders of the same shape at
+    different positions then share the shape and it is split only once. By
+    default all colliders share ``TRIANGULATION_CACHE``. Pass None to
+    disable the cache. The key is compared exactly so float coordinates at
+    different positions may round to slightly different keys and miss the
+    cache. Integer coordinates are always exact. Use :meth:`from_shape` to
+    share a shape for sure.
+    """
+
+    __slots__ = ("_shape", "_ox", "_oy")
+
+    def __init__(
+        self,
+        points: List[Tuple[float]],
+        data: Any = None,
+        category: int = DEFAULT_CATEGORY,
+        mask: int = ALL_LAYERS,
+        triangulation: str = INDEXED_EAR_CLIPPING,
+        decomposition: str = TRIANGLES,
+        triangulation_cache: Union[TriangulationCache, None] = TRIANGULATION_CACHE,
+    ):
+        super().__init__(data=data, category=category, mask=mask)
+        # Local origin at the top left corner of the bounding box so that
+        # the same shape at any position is shared
+        ox = min(x for x, _ in points)
+        oy = min(y for _, y in points)
+        local = tuple((x - ox, y - oy) for x, y in points)
+
+        if triangulation_cache is None:
+            shape = ConcaveShape(local, triangulation, decomposition)
+        else:
+            key = (triangulation, decomposition, local)
+            shape = triangulation_cache.get(key)
+            if shape is None:
+                shape = ConcaveShape(local, triangulation, decomposition)
+                triangulation_cache.put(key, shape)
+        self._setup(shape, ox, oy)
+
+    @classmethod
+    def from_shape(
+        cls,
+        shape: ConcaveShape,
+        position: Tuple[float, float] = (0, 0),
+        data: Any = None,
+        category: int = DEFAULT_CATEGORY,
+        mask: int = ALL_LAYERS,
+    ) -> "ConcaveCollider":
+        """
+        Create new concave collider sharing the given shape. The shape is
+        not split again so this is the cheapest way to create many
+        colliders of the same shape.
+
+        :param shape: Shape of the collider.
+        :param position: Position of the local origin of the shape.
+        :param data: Data attached to the collider.
+        :param category: Collision layer bits the collider belongs to.
+        :param mask: Collision layer bits the collider can collide with.
+        :type shape: ConcaveShape
+        :type position: tuple(float, float)
+        :type data: Any
+        :type category: int
+        :type mask: int
+        :return: New collider
+        :rtype: ConcaveCollider
+        """
+        collider = cls.__new__(cls)
+        Collider.__init__(collider, data=data, category=category, mask=mask)
+        collider._setup(shape, position[0], position[1])
+        return collider
+
+    def _setup(self, shape: ConcaveShape, ox: float, oy: float):
+        self._shape = shape
+        self._ox = ox
+        self._oy = oy
+        rect = shape._rect
+        self._rect = Rect(ox + rect.x, oy + rect.y, rect.w, rect.h)
+
+    @property
+    def shape(self) -> ConcaveShape:
+        """
+        Shape of the collider shared with the other colliders of the same
+        shape.
+
+        :getter: the shape
+        :type: ConcaveShape
+        """
+        return self._shape
+
+    @property
+    def _colliders(self) -> List[ConvexCollider]:
+        # All the parts at the position of the collider
+        return [self._part(i) for i in range(len(self._shape._parts))]
+
+    def _part(self, index: int) -> ConvexCollider:
+        # Parts are created at the position of the collider when used and not
+        # kept so that the collider holds only its shape and position
+        return ConvexCollider.from_shape(
+            self._shape._parts[index], (self._ox, self._oy)
+        )
+
+    @property
+    def points(self) -> List[List[float]]:
+        """
+        Vertices of the collider in world coordinates.
+
+        :getter: new list of the vertices
+        :type: list(list(float, float))
+        """
+        ox = self._ox
+        oy = self._oy
+        return [[x + ox, y + oy] for x, y in self._shape._points]
+
+    @property
+    def triangulation(self) -> str:
+        """
+        Algorithm used to split the collider to triangles,
+        ``"indexed_ear_clipping"`` or ``"ear_clipping"``.
+
+        :getter: the triangulation
+        :type: str
+        """
+        return self._shape._triangulation
+
+    @property
+    def decomposition(self) -> str:
+        """
+        Kind of the convex parts the collider is split to, ``"triangles"`` or
+        ``"convex"``.
+
+        :getter: the decomposition
+        :type: str
+        """
+        return self._shape._decomposition
 
-    def collide(self, other) -> bool:
+    def collide(self, other, cache: Union[AxisCache, None] = None) -> bool:
         """
         Check collision against the other collider.
 
         :param other: Other collider to check collision against.
+        :param cache: Dictionary to remember separating axes of the
+            triangles in. See :meth:`ConvexCollider.collide`.
         :type other: Collider
+        :type cache: dict or None
         :return: True if collision happens, False otherwise
         :rtype: bool
         """
@@ -179,40 +470,150 @@ class ConcaveCollider(Collider):
             return False  # Bounding boxes don't collide
         # Concave to concave collision
         if isinstance(other, ConcaveCollider):
-            for collider in self._colliders:
-                if other.collide(collider):
+            for collider, other_collider in self._part_pairs(other):
+                if other_collider.collide(collider, cache):
                     return True
             return False
 
         # Concave to convex collision
-        for collider in self._colliders:
-            if collider.collide(other):
+        for collider in self._query_parts(other._rect):
+            if collider.collide(other, cache):
                 return True
         return False
 
-    def point_collide(self, point: Tuple[float]):
+    def _query_parts(self, rect: Rect) -> List[ConvexCollider]:
+        ox = self._ox
+        oy = self._oy
+        indices = self._shape._part_tree.query_rect(
+            rect.left - ox, rect.top - oy, rect.right - ox, rect.bottom - oy
+        )
+        return [self._part(i) for i in indices]
+
+    def _part_pairs(
+        self, other: "ConcaveCollider"
+    ) -> Iterator[Tuple[ConvexCollider, ConvexCollider]]:
+        # Trees are in the local coordinates of the shapes
+        pairs = self._shape._part_tree.pairs(
+            other._shape._part_tree, self._ox - other._ox, self._oy - other._oy
+        )
+        for i, j in pairs:
+            yield self._part(i), other._part(j)
+
+    def collide_manifold(self, other) -> Union[Manifold, None]:
         """
-        Check if point is within collider.
+        Check collision against the other collider and find out how to
+        separate the colliders. The manifold of the deepest colliding part
+        of the concave collider is returned.
 
-        .. warning:: Not implemented. Returns currently always False
+        :param other: Other collider to check collision against.
+        :type other: Collider
+        :return: Manifold if collision happens, None otherwise
+        :rtype: Manifold or None
+        """
+        if not self._rect.collide_rect(other._rect):
+            return None  # Bounding boxes don't collide
+
+        if isinstance(other, ConcaveCollider):
+            pairs = self._part_pairs(other)
+        else:
+            pairs = ((collider, other) for collider in self._query_parts(other._rect))
+
+        deepest = None
+        for collider, other_collider in pairs:
+            manifold = collider.collide_manifold(other_collider)
+            if manifold is None:
+                continue
+            if deepest is None or manifold.depth > deepest.depth:
+                deepest = manifold
+        return deepest
+
+    def sweep(self, other, dx: float, dy: float) -> Union[SweepHit, None]:
+        """
+        Find when this collider moving by (dx, dy) first touches the other
+        collider. The earliest hit of the convex parts is returned.
+
+        The collider itself isn't moved.
+
+        :param other: Other collider to check collision against.
+        :param dx: Movement along x axis.
+        :param dy: Movement along y axis.
+        :type other: Collider
+        :type dx: float
+        :type dy: float
+        :return: Hit with time of impact in range [0, 1] and contact normal
+            or None if colliders don't touch during the movement
+        :rtype: SweepHit or None
+        """
+        return self._sweep(other, dx, dy, 0.0, 0.0)
+
+    def _sweep(
+        self, other, dx: float, dy: float, ox: float, oy: float
+    ) -> Union[SweepHit, None]:
+        """
+        Sweep test starting from this collider offset by (ox, oy).
+        """
+        # Area the other collider covers relative to this collider during
+        # the movement
+        rect = other._rect
+        left = self._ox + ox
+        top = self._oy + oy
+        indices = self._shape._part_tree.query_rect(
+            rect.left - left - max(dx, 0),
+            rect.top - top - max(dy, 0),
+            rect.right - left - min(dx, 0),
+            rect.bottom - top - min(dy, 0),
+        )
+
+        earliest = None
+        for i in indices:
+            collider = self._part(i)
+            hit = collider._sweep(other, dx, dy, ox, oy)
+            if hit is None:
+                continue
+            if earliest is None or hit.time < earliest.time:
+                earliest = hit
+        if earliest is None:
+            return None
+        return SweepHit(earliest.time, earliest.normal, other)
+
+    def point_collide(self, point: Tuple[float]):
+        """
+        Check if point is within collider. Only the parts whose bounding
+        boxes contain the point are tested.
 
         :param point: Point to test
         :type point: Tuple[float/int, float/int]
         :return: True if point is collider, False otherwise
         :rtype: bool
         """
+        x, y = point
+        rect = self._rect
+        if x < rect.left or x > rect.right or y < rect.top or y > rect.bottom:
+            return False
+
+        for i in self._shape._part_tree.query_point(x - self._ox, y - self._oy):
+            if self._part(i).point_collide(point):
+                return True
         return False
 
+    def _transform(self, rotation: float, scale: float):
+        # Parts and the tree come with the transformed shape
+        base = self._shape._base or self._shape
+        shape = base.transformed(rotation, scale)
+        self._shape = shape
+        self._rotation = rotation
+        self._scale = scale
+        local = shape._rect
+        rect = self._rect
+        rect.x = self._ox + local.x
+        rect.y = self._oy + local.y
+        rect.w = local.w
+        rect.h = local.h
+        self._changed()
+
     def _move(self, dx: float, dy: float):
-        for point, vertex in zip(self.points, self._vertices):
-            point[0] += dx
-            point[1] += dy
-            vertex.x += dx
-            vertex.y += dy
-
-        # Move sub colliders
-        for collider in self._colliders:
-            collider._move(dx, dy)
+        self._ox += dx
+        self._oy += dy
 
         # Move rect
         super()._move(dx, dy)
@@ -0,0 +1,178 @@
+from typing import Any, Callable, Dict, Iterable, List, Tuple, Union
+
+from .base import Collider
+
+PairKey = Tuple[int, int]
+ContactCallback = Union[Callable[[Collider, Collider], Any], None]
+
+
+class _ContactPair:
+    def __init__(self, a: Collider, b: Collider):
+        self.a = a
+        self.b = b
+        self.touching = False
+        self.version_a = -1
+        self.version_b = -1
+        self.axis_cache = {}
+
+
+class ContactCache:
+    """
+    Remembers which pairs of colliders were touching on the previous step and
+    reports only the changes. Result of a pair is reused without running the
+    narrow phase again when the versions of the colliders haven't changed.
+    Pairs that are close but don't touch remember their separating axes so
+    the narrow phase tests the axis that separated them last time first.
+
+    Example of usage:
+
+    .. code-block:: python
+
+        def hit(a, b):
+            print("Collision started")
+
+        cache = ContactCache(on_enter=hit)
+        cache.update(broadphase.pairs())
+
+    :param on_enter: Called with a pair that started touching.
+    :param on_exit: Called with a pair that stopped touching.
+    :param on_stay: Called with a pair that kept touching.
+    :type on_enter: callable(Collider, Collider) or None
+    :type on_exit: callable(Collider, Collider) or None
+    :type on_stay: callable(Collider, Collider) or None
+    """
+
+    def __init__(
+        self,
+        on_enter: ContactCallback = None,
+        on_exit: ContactCallback = None,
+        on_stay: ContactCallback = None,
+    ):
+        self._on_enter = on_enter
+        self._on_exit = on_exit
+        self._on_stay = on_stay
+        self._pairs: Dict[PairKey, _ContactPair] = {}
+        self._narrow_phase_tests = 0
+
+    @property
+    def contacts(self) -> List[Tuple[Collider, Collider]]:
+        """
+        Pairs that were touching on the latest update.
+
+        :getter: the touching pairs
+        :type: list(tuple(Collider, Collider))
+        """
+        return [(pair.a, pair.b) for pair in self._pairs.values() if pair.touching]
+
+    @property
+    def narrow_phase_tests(self) -> int:
+        """
+        Number of narrow phase tests run by the latest update. Pairs reusing
+        the previous result are not counted.
+
+        :getter: the number of tests
+        :type: int
+        """
+        return self._narrow_phase_tests
+
+    def update(
+        self, candidate_pairs: Iterable[Tuple[Collider, Collider]]
+    ) -> Tuple[List[Tuple[Collider, Collider]], List[Tuple[Collider, Collider]]]:
+        """
+        Update the cache with the candidate pairs of the broad phase and emit
+        the callbacks. Pairs missing from the candidates are not touching.
+
+        :param candidate_pairs: Pairs whose bounding boxes do overlap.
+        :type candidate_pairs: iterable(tuple(Collider, Collider))
+        :return: Tuple of pairs that started and stopped touching
+        :rtype: tuple(list(tuple(Collider, Collider)), list(tuple(Collider, Collider)))
+        """
+        old_pairs = self._pairs
+        new_pairs: Dict[PairKey, _ContactPair] = {}
+        entered = []
+        exited = []
+        stayed = []
+        track_stay = self._on_stay is not None
+        self._narrow_phase_tests = 0
+
+        for a, b in candidate_pairs:
+            key, pair, was_touching = self._resolve(old_pairs, a, b)
+            new_pairs[key] = pair
+            a = pair.a
+            b = pair.b
+
+            if pair.touching:
+                if not was_touching:
+                    entered.append((a, b))
+                elif track_stay:
+                    stayed.append((a, b))
+            elif was_touching:
+                exited.append((a, b))
+
+        # Whatever is left of the old pairs isn't overlapping anymore
+        exited.extend((pair.a, pair.b) for pair in old_pairs.values() if pair.touching)
+        self._pairs = new_pairs
+
+        self._emit(entered, stayed, exited)
+        return entered, exited
+
+    def _resolve(
+        self, old_pairs: Dict[PairKey, _ContactPair], a: Collider, b: Collider
+    ) -> Tuple[PairKey, _ContactPair, bool]:
+        # Find the pair from the previous update or create a new one and run
+        # the narrow phase if either of the colliders has changed
+        id_a = id(a)
+        id_b = id(b)
+        if id_a > id_b:
+            a, b = b, a
+            key = (id_b, id_a)
+        else:
+            key = (id_a, id_b)
+
+        pair = old_pairs.pop(key, None)
+        was_touching = False
+        if pair is None:
+            pair = _ContactPair(a, b)
+        else:
+            was_touching = pair.touching
+        if pair.version_a != a._version or pair.version_b != b._version:
+            pair.touching = a.collide(b, pair.axis_cache)
+            pair.version_a = a._version
+            pair.version_b = b._version
+            self._narrow_phase_tests += 1
+        return key, pair, was_touching
+
+    def _emit(
+        self,
+        entered: List[Tuple[Collider, Collider]],
+        stayed: List[Tuple[Collider, Collider]],
+        exited: List[Tuple[Collider, Collider]],
+    ):
+        if self._on_enter is not None:
+            for a, b in entered:
+                self._on_enter(a, b)
+        if self._on_stay is not None:
+            for a, b in stayed:
+                self._on_stay(a, b)
+        if self._on_exit is not None:
+            for a, b in exited:
+                self._on_exit(a, b)
+
+    def remove(self, collider: Collider):
+        """
+        Forget all pairs of the collider without emitting any callbacks.
+
+        :param collider: Collider to forget.
+        :type collider: Collider
+        """
+        self._pairs = {
+            key: pair
+            for key, pair in self._pairs.items()
+            if pair.a is not collider and pair.b is not collider
+        }
+
+    def clear(self):
+        """
+        Forget all pairs without emitting any callbacks.
+        """
+        self._pairs = {}
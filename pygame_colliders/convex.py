@@ -1,47 +1,46 @@
-from typing import List, Tuple, Union, Any
+from typing import Dict, List, Tuple, Union, Any
 
-from .base import Collider
+from .base import ALL_LAYERS, DEFAULT_CATEGORY, Collider
 from .vector import Vector2
 from .rect import Rect
+from .gjk import gjk_intersect
+from .manifold import Manifold, contact_points
+from .shape import _AABB, _TRIANGLE, Shape, intern_shape
+from .sweep import SweepHit, sweep_convex
 
+AxisCache = Dict[Tuple[int, int], Tuple[int, int]]
 
-def _contains(n: float, range_: List[float]) -> bool:
-    """
-    Test that n is within range (ends included). Order of range entries doesn't
-    matter.
-
-    :param n: Value to check.
-    :param range_: Start and end of the range to check.
-    :type n: float
-    :type range_: list(float, float)
-    :return: True if value is inside range, False otherwise
-    :rtype: bool
-    """
-    a, b = range_
-    if b < a:
-        a, b = b, a
-    return (n >= a) and (n <= b)
+SAT = "sat"
+GJK = "gjk"
+ENGINES = (SAT, GJK)
+
+# Colliders with at least this many vertices use GJK by default
+GJK_VERTEX_THRESHOLD = 8
 
 
-def _overlap(a: List[float], b: List[float]) -> bool:
+def _triangle_separates(triangle: "ConvexCollider", other: "ConvexCollider") -> bool:
     """
-    Check if ends of ranges a and b do overlap.
-
-    :param a: First range to check.
-    :param b: Second range to check.
-    :type a: list(float, float)
-    :type b: list(float, float)
-    :return: True if ranges do overlap, False otherwise
-    :rtype: bool
+    Check if any edge of the triangle has all vertices of the other triangle
+    strictly outside of it. Touching triangles are not separated.
     """
-    if _contains(a[0], b):
-        return True
-    if _contains(a[1], b):
-        return True
-    if _contains(b[0], a):
-        return True
-    if _contains(b[1], a):
-        return True
+    shape = triangle._shape
+    winding = shape._winding
+    (ax, ay), (bx, by), (cx, cy) = other._shape._vertices
+    # Edges of the triangle in the local coordinates of the other triangle
+    dx = triangle._ox - other._ox
+    dy = triangle._oy - other._oy
+    p0, p1, p2 = shape._vertices
+    for (px, py), (qx, qy) in ((p0, p1), (p1, p2), (p2, p0)):
+        ex = (qx - px) * winding
+        ey = (qy - py) * winding
+        px += dx
+        py += dy
+        if (
+            ex * (ay - py) < ey * (ax - px)
+            and ex * (by - py) < ey * (bx - px)
+            and ex * (cy - py) < ey * (cx - px)
+        ):
+            return True
     return False
 
 
@@ -56,49 +55,199 @@ class ConvexCollider(Collider):
         collider_points = [(11, 10), (11, 3), (4, 3), (4, 10)]
         collider = ConvexCollider(collider_points)
 
+    Collisions are tested with the separating axis test (``"sat"``) or with
+    GJK (``"gjk"``) which is faster for colliders with many vertices. By
+    default GJK is used for colliders having at least
+    ``GJK_VERTEX_THRESHOLD`` vertices. Pair is tested with GJK if either of
+    the colliders uses it.
+
+    Colliders whose vertices relative to the top left corner of the bounding
+    box are equal share the same :class:`Shape`. The vertices are compared
+    exactly so float coordinates at different positions may round to
+    slightly different shapes that aren't shared. Integer coordinates are
+    always exact. Use :meth:`from_shape` to share a shape for sure.
     """
 
-    def __init__(self, points: List[Tuple[Union[float, int]]], data: Any = None):
-        super().__init__(data=data)
-        self.points = [[x, y] for x, y in points]  # Must be mutable
-        self._vertices: List[Vector2] = []
-        self._edges: List[Vector2] = []
-        self._normals: List[Vector2] = []
-
-        self._setup()
-
-    def _setup(self):
-        self._setup_vertices()
-        self._setup_edges()
-        self._setup_normals()
-        self._setup_rect()
-
-    def _setup_vertices(self):
-        self._vertices = [Vector2(*p) for p in self.points]
-
-    def _setup_edges(self):
-        self._edges = []
-        vec_a = self._vertices[0]
-        for vec_b in self._vertices[1:]:
-            self._edges.append(vec_b - vec_a)
-            vec_a = vec_b
-        self._edges.append(vec_a - self._vertices[0])
-
-    def _setup_normals(self):
-        self._normals = [Vector2(-e.y, e.x) for e in self._edges]
-
-    def _setup_rect(self):
-        min_x = self._vertices[0].x
-        min_y = self._vertices[0].y
-        max_x = self._vertices[0].x
-        max_y = self._vertices[0].y
-        for vec in self._vertices[1:]:
-            min_x = min(vec._x, min_x)
-            max_x = max(vec._x, max_x)
-            min_y = min(vec._y, min_y)
-            max_y = max(vec._y, max_y)
-
-        self._rect = Rect(min_x, min_y, max_x - min_x, max_y - min_y)
+    __slots__ = ("_shape", "_ox", "_oy", "_engine")
+
+    def __init__(
+        self,
+        points: List[Tuple[Union[float, int]]],
+        data: Any = None,
+        category: int = DEFAULT_CATEGORY,
+        mask: int = ALL_LAYERS,
+        engine: Union[str, None] = None,
+    ):
+        super().__init__(data=data, category=category, mask=mask)
+        # Local origin at the top left corner of the bounding box so that
+        # the same shape at any position is shared
+        ox = min(x for x, _ in points)
+        oy = min(y for _, y in points)
+        shape = intern_shape([(x - ox, y - oy) for x, y in points])
+        self._setup(shape, ox, oy, engine)
+
+    @classmethod
+    def from_shape(
+        cls,
+        shape: Shape,
+        position: Tuple[float, float] = (0, 0),
+        data: Any = None,
+        category: int = DEFAULT_CATEGORY,
+        mask: int = ALL_LAYERS,
+        engine: Union[str, None] = None,
+    ) -> "ConvexCollider":
+        """
+        Create new convex collider sharing the given shape. Nothing is
+        computed from the vertices so this is the cheapest way to create
+        many colliders of the same shape.
+
+        :param shape: Shape of the collider.
+        :param position: Position of the local origin of the shape.
+        :param data: Data attached to the collider.
+        :param category: Collision layer bits the collider belongs to.
+        :param mask: Collision layer bits the collider can collide with.
+        :param engine: Narrow phase algorithm, ``"sat"`` or ``"gjk"``.
+        :type shape: Shape
+        :type position: tuple(float, float)
+        :type data: Any
+        :type category: int
+        :type mask: int
+        :type engine: str or None
+        :return: New collider
+        :rtype: ConvexCollider
+        """
+        collider = cls.__new__(cls)
+        Collider.__init__(collider, data=data, category=category, mask=mask)
+        collider._setup(shape, position[0], position[1], engine)
+        return collider
+
+    def _setup(self, shape: Shape, ox: float, oy: float, engine: Union[str, None]):
+        self._shape = shape
+        self._ox = ox
+        self._oy = oy
+        rect = shape._rect
+        self._rect = Rect(ox + rect.x, oy + rect.y, rect.w, rect.h)
+
+        if engine is None:
+            engine = GJK if len(shape._vertices) >= GJK_VERTEX_THRESHOLD else SAT
+        self.engine = engine
+
+    @property
+    def shape(self) -> Shape:
+        """
+        Shape of the collider shared with the other colliders of the same
+        shape.
+
+        :getter: the shape
+        :type: Shape
+        """
+        return self._shape
+
+    @property
+    def points(self) -> List[List[float]]:
+        """
+        Vertices of the collider in world coordinates.
+
+        :getter: new list of the vertices
+        :type: list(list(float, float))
+        """
+        ox = self._ox
+        oy = self._oy
+        return [[x + ox, y + oy] for x, y in self._shape._vertices]
+
+    @property
+    def _vertices(self) -> List[Vector2]:
+        ox = self._ox
+        oy = self._oy
+        return [Vector2(x + ox, y + oy) for x, y in self._shape._vertices]
+
+    @property
+    def _axes(self) -> List[Tuple[float, float]]:
+        return self._shape._axes
+
+    @property
+    def _axis_lengths(self) -> List[float]:
+        return self._shape._axis_lengths
+
+    @property
+    def _axis_ranges(self) -> List[Tuple[float, float]]:
+        # Projections of the shape shifted to the position
+        ox = self._ox
+        oy = self._oy
+        return [
+            (a_min + ax * ox + ay * oy, a_max + ax * ox + ay * oy)
+            for (ax, ay), (a_min, a_max) in zip(
+                self._shape._axes, self._shape._axis_ranges
+            )
+        ]
+
+    @property
+    def _support_angles(self) -> Union[List[float], None]:
+        return self._shape._support_angles
+
+    @property
+    def is_aabb(self) -> bool:
+        """
+        Checks if convex collider is an axis-aligned rectangle. Collisions
+        between such colliders are tested with bounding boxes only.
+
+        :return: True if axis-aligned rectangle, False otherwise
+        :rtype: bool
+        """
+        return self._shape._kind == _AABB
+
+    @property
+    def is_triangle(self) -> bool:
+        """
+        Checks if convex collider is a triangle. Collisions between triangles
+        are tested with a dedicated edge test.
+
+        :return: True if triangle, False otherwise
+        :rtype: bool
+        """
+        return self._shape._kind == _TRIANGLE
+
+    @property
+    def engine(self) -> str:
+        """
+        Narrow phase algorithm used by the collider, ``"sat"`` or ``"gjk"``.
+
+        :getter: the engine
+        :setter: the new engine
+        :type: str
+        """
+        return self._engine
+
+    @engine.setter
+    def engine(self, value: str):
+        if value not in ENGINES:
+            raise ValueError(f"Unknown engine {value!r}, expected one of {ENGINES}")
+        self._engine = value
+
+    def _support_index(self, dx: float, dy: float) -> int:
+        return self._shape._support_index(dx, dy)
+
+    def _support(self, dx: float, dy: float) -> Tuple[float, float]:
+        """
+        Find the vertex furthest to the given direction. The search is done
+        in the local coordinates of the shape, see ``Shape._support``.
+
+        :return: Coordinates of the vertex
+        :rtype: tuple(float, float)
+        """
+        x, y = self._shape._support(dx, dy)
+        return x + self._ox, y + self._oy
+
+    def _project(self, ax: float, ay: float) -> Tuple[float, float]:
+        """
+        Project vertices of the collider to the axis.
+
+        :return: Minimum and maximum of the projection
+        :rtype: tuple(float, float)
+        """
+        min_, max_ = self._shape._project(ax, ay)
+        shift = ax * self._ox + ay * self._oy
+        return min_ + shift, max_ + shift
 
     @property
     def is_clockwise(self) -> bool:
@@ -108,44 +257,240 @@ class ConvexCollider(Collider):
         :return: True if clockwise, False otherwise
         :rtype: bool
         """
+        vertices = self._shape._vertices
         sum_: float = 0
-        prev = first = self._vertices[0]
-        for cur in self._vertices[1:]:
-            sum_ += (cur.x - prev.x) * (cur.y + prev.y)
-            prev = cur
-        # This is required to close the loop.
-        sum_ += (first.x - prev.x) * (first.y + prev.y)
+        prev_x, prev_y = vertices[-1]
+        for x, y in vertices:
+            sum_ += (x - prev_x) * (y + prev_y)
+            prev_x, prev_y = x, y
         return sum_ > 0
 
-    def collide(self, other) -> bool:
+    def collide(self, other, cache: Union[AxisCache, None] = None) -> bool:
         """
         Check collision against the other collider.
 
+        Colliders that stay close to each other without touching are usually
+        separated by the same axis from frame to frame. Passing the same
+        ``cache`` dictionary for the pair on every call makes the test start
+        from the axis that separated the colliders last time.
+
         :param other: Other collider to check collision against.
+        :param cache: Dictionary to remember separating axes in.
         :type other: Collider
+        :type cache: dict or None
         :return: True if collision happens, False otherwise
         :rtype: bool
         """
         # a = self, b = other
-        from .concave import ConcaveCollider  # Late import due cyclic
-
         if not self._rect.collide_rect(other._rect):
             return False  # Bounding boxes don't collide
 
-        if isinstance(other, ConcaveCollider):
-            # Check collision other way around
-            return other.collide(self)
+        if not isinstance(other, ConvexCollider):
+            # Concave and round colliders check collision other way around
+            return other.collide(self, cache)
+
+        result = self._collide_kind(other)
+        if result is not None:
+            return result
+
+        if self._engine == GJK or other._engine == GJK:
+            result = gjk_intersect(self, other)
+            if result is not None:
+                return result
+
+        if cache is None:
+            return self._sat(other) is None
+
+        key = (id(self), id(other))
+        hint = cache.get(key)
+        if hint is not None and self._separated_by(other, hint):
+            return False
+
+        separating = self._sat(other)
+        if separating is None:
+            return True
+        cache[key] = separating
+        return False
+
+    def _collide_kind(self, other: "ConvexCollider") -> Union[bool, None]:
+        # Specialized kernels. Overlapping bounding boxes already rule out
+        # the axes of axis-aligned rectangles. None when neither of the
+        # shapes has a kernel.
+        kind = self._shape._kind
+        other_kind = other._shape._kind
+        if kind == _AABB:
+            return other_kind == _AABB or other._separating_axis(self) is None
+        if other_kind == _AABB:
+            return self._separating_axis(other) is None
+        if kind == _TRIANGLE and other_kind == _TRIANGLE:
+            return not (
+                _triangle_separates(self, other) or _triangle_separates(other, self)
+            )
+        return None
+
+    def _separated_by(self, other: "ConvexCollider", axis: Tuple[int, int]) -> bool:
+        side, index = axis
+        if side == 0:
+            own, projected = self, other
+        else:
+            own, projected = other, self
+        shape = own._shape
+        if index >= len(shape._axes):
+            return False
+        ax, ay = shape._axes[index]
+        r_min, r_max = shape._axis_ranges[index]
+        p_min, p_max = projected._shape._project(ax, ay)
+        # Offset of the projected collider relative to the own one
+        shift = ax * (projected._ox - own._ox) + ay * (projected._oy - own._oy)
+        return p_max + shift < r_min or p_min + shift > r_max
+
+    def _separating_axis(self, other: "ConvexCollider") -> Union[int, None]:
+        """
+        Run separating axis test on the own axes of the collider only.
+
+        :return: Index of the separating axis or None if not separated
+        :rtype: int or None
+        """
+        # Own projections are cached in the shape so only the other shape is
+        # projected and shifted by the offset between the colliders
+        shape = self._shape
+        project = other._shape._project
+        ranges = shape._axis_ranges
+        dx = other._ox - self._ox
+        dy = other._oy - self._oy
+        for i, (ax, ay) in enumerate(shape._axes):
+            a_min, a_max = ranges[i]
+            b_min, b_max = project(ax, ay)
+            shift = ax * dx + ay * dy
+            if b_max + shift < a_min or b_min + shift > a_max:
+                return i
+        return None
+
+    def _sat(self, other: "ConvexCollider") -> Union[Tuple[int, int], None]:
+        """
+        Run separating axis test against the other convex collider.
+
+        :return: Side (0 for self, 1 for other) and index of the separating
+            axis or None if colliders do collide
+        :rtype: tuple(int, int) or None
+        """
+        index = self._separating_axis(other)
+        if index is not None:
+            return 0, index  # Separating axis found
+        index = other._separating_axis(self)
+        if index is not None:
+            return 1, index
+        return None
+
+    def collide_manifold(self, other) -> Union[Manifold, None]:
+        """
+        Check collision against the other collider and find out how to
+        separate the colliders. Penetration depth and normal are picked from
+        the same projections the collision test does.
+
+        :param other: Other collider to check collision against.
+        :type other: Collider
+        :return: Manifold if collision happens, None otherwise
+        :rtype: Manifold or None
+        """
+        if not self._rect.collide_rect(other._rect):
+            return None  # Bounding boxes don't collide
+
+        if not isinstance(other, ConvexCollider):
+            manifold = other.collide_manifold(self)
+            return None if manifold is None else manifold.flipped()
+
+        result = self._sat_manifold(other)
+        if result is None:
+            return None
+        depth, nx, ny = result
+        return Manifold(Vector2(nx, ny), depth, contact_points(self, other, nx, ny))
 
-        normal_stack = self._normals[:] + other._normals[:]
-        for i, normal in enumerate(normal_stack, 1):
-            a_projections = [normal * v for v in self._vertices]
-            a_range = [min(a_projections), max(a_projections)]
-            b_projections = [normal * v for v in other._vertices]
-            b_range = [min(b_projections), max(b_projections)]
+    def sweep(self, other, dx: float, dy: float) -> Union[SweepHit, None]:
+        """
+        Find when this collider moving by (dx, dy) first touches the other
+        collider. Fast moving colliders can't tunnel through thin colliders
+        like they do when only the end positions are tested.
 
-            if not _overlap(a_range, b_range):
-                return False
-        return True
+        The collider itself isn't moved.
+
+        :param other: Other collider to check collision against.
+        :param dx: Movement along x axis.
+        :param dy: Movement along y axis.
+        :type other: Collider
+        :type dx: float
+        :type dy: float
+        :return: Hit with time of impact in range [0, 1] and contact normal
+            or None if colliders don't touch during the movement
+        :rtype: SweepHit or None
+        """
+        return self._sweep(other, dx, dy, 0.0, 0.0)
+
+    def _sweep(
+        self, other, dx: float, dy: float, ox: float, oy: float
+    ) -> Union[SweepHit, None]:
+        """
+        Sweep test starting from this collider offset by (ox, oy).
+        """
+        if not isinstance(other, ConvexCollider):
+            hit = other._sweep(self, -dx, -dy, -ox, -oy)
+            if hit is None:
+                return None
+            normal = Vector2(-hit.normal.x, -hit.normal.y)
+            return SweepHit(hit.time, normal, other)
+
+        return sweep_convex(self, other, dx, dy, ox, oy)
+
+    def _sat_manifold(
+        self, other: "ConvexCollider"
+    ) -> Union[Tuple[float, float, float], None]:
+        """
+        Run separating axis test against the other convex collider keeping
+        track of the axis with the smallest overlap.
+
+        :return: Depth and unit normal from self to other or None if colliders
+            don't collide
+        :rtype: tuple(float, float, float) or None
+        """
+        best_depth = None
+        best_axis = (0.0, 0.0)
+
+        for own, projected in ((self, other), (other, self)):
+            shape = own._shape
+            project = projected._shape._project
+            ranges = shape._axis_ranges
+            lengths = shape._axis_lengths
+            dx = projected._ox - own._ox
+            dy = projected._oy - own._oy
+            for i, (ax, ay) in enumerate(shape._axes):
+                r_min, r_max = ranges[i]
+                p_min, p_max = project(ax, ay)
+                shift = ax * dx + ay * dy
+                p_min += shift
+                p_max += shift
+                if own is self:
+                    a_min, a_max, b_min, b_max = r_min, r_max, p_min, p_max
+                else:
+                    a_min, a_max, b_min, b_max = p_min, p_max, r_min, r_max
+
+                # Push other forwards or backwards along the axis
+                forward = a_max - b_min
+                backward = b_max - a_min
+                if forward < 0 or backward < 0:
+                    return None  # Separating axis found
+
+                length = lengths[i]
+                if forward <= backward:
+                    depth = forward / length
+                    axis = (ax / length, ay / length)
+                else:
+                    depth = backward / length
+                    axis = (-ax / length, -ay / length)
+                if best_depth is None or depth < best_depth:
+                    best_depth = depth
+                    best_axis = axis
+
+        return best_depth, best_axis[0], best_axis[1]
 
     def _make_bbox(self):
         return [
@@ -164,13 +509,15 @@ class ConvexCollider(Collider):
         :return: True if point is collider, False otherwise
         :rtype: bool
         """
-        vertx = [v.x for v in self._vertices]
-        verty = [v.y for v in self._vertices]
+        vertices = self._shape._vertices
+        vertx = [x for x, _ in vertices]
+        verty = [y for _, y in vertices]
 
-        nvert = len(self._vertices)
+        nvert = len(vertices)
 
-        testx = point[0]
-        testy = point[1]
+        # Test in the local coordinates of the shape
+        testx = point[0] - self._ox
+        testy = point[1] - self._oy
         c = 0
         j = nvert - 1
         for i in range(0, nvert):
@@ -186,15 +533,34 @@ class ConvexCollider(Collider):
         return False
 
     def _move(self, dx: float, dy: float):
-        # Move points and vertices
-        for point, vertex in zip(self.points, self._vertices):
-            point[0] += dx
-            point[1] += dy
-            vertex.x += dx
-            vertex.y += dy
+        # Vertices are local to the shape so only the position moves
+        self._ox += dx
+        self._oy += dy
 
         # Update rect
         super()._move(dx, dy)
 
+    def _place(self, shape: Shape, x: float, y: float):
+        """
+        Set the shape and move its local origin to the position.
+        """
+        self._shape = shape
+        self._ox = x
+        self._oy = y
+        local = shape._rect
+        rect = self._rect
+        rect.x = x + local.x
+        rect.y = y + local.y
+        rect.w = local.w
+        rect.h = local.h
+        self._changed()
+
+    def _transform(self, rotation: float, scale: float):
+        # Transformed shapes are derived from the original shape
+        base = self._shape._base or self._shape
+        self._rotation = rotation
+        self._scale = scale
+        self._place(base.transformed(rotation, scale), self._ox, self._oy)
+
     def __str__(self):
         return f"[{','.join([f'[{x}, {y}]' for x, y in self.points])}]"
@@ -0,0 +1,120 @@
+from typing import List, Tuple, Union
+
+Point = Tuple[float, float]
+
+# Fallback to the separating axis test if GJK doesn't converge in time
+_EXTRA_ITERATIONS = 8
+
+
+def _minkowski_support(a, b, dx: float, dy: float) -> Point:
+    ax, ay = a._support(dx, dy)
+    bx, by = b._support(-dx, -dy)
+    return ax - bx, ay - by
+
+
+def _towards_origin(ex: float, ey: float, px: float, py: float) -> Point:
+    """
+    Perpendicular of edge ``e`` pointing to the same side as ``p``.
+    """
+    nx = -ey
+    ny = ex
+    if nx * px + ny * py < 0:
+        return -nx, -ny
+    return nx, ny
+
+
+def _line_case(simplex: List[Point]) -> Union[Point, None]:
+    # Newest point is the last one
+    bx, by = simplex[0]
+    ax, ay = simplex[1]
+    abx = bx - ax
+    aby = by - ay
+    aox = -ax
+    aoy = -ay
+
+    along = abx * aox + aby * aoy
+    if along < 0:
+        # Origin is behind the newest point
+        del simplex[0]
+        return aox, aoy
+
+    if abx * aoy - aby * aox == 0:
+        if along <= abx * abx + aby * aby:
+            return None  # Origin is on the segment
+        del simplex[0]
+        return aox, aoy
+
+    return _towards_origin(abx, aby, aox, aoy)
+
+
+def _triangle_case(simplex: List[Point]) -> Union[Point, None]:
+    cx, cy = simplex[0]
+    bx, by = simplex[1]
+    ax, ay = simplex[2]
+    abx = bx - ax
+    aby = by - ay
+    acx = cx - ax
+    acy = cy - ay
+    aox = -ax
+    aoy = -ay
+
+    # Normal of ab pointing away from c
+    nx, ny = _towards_origin(abx, aby, -acx, -acy)
+    if nx * aox + ny * aoy > 0:
+        del simplex[0]
+        return _line_case(simplex)
+
+    # Normal of ac pointing away from b
+    nx, ny = _towards_origin(acx, acy, -abx, -aby)
+    if nx * aox + ny * aoy > 0:
+        del simplex[1]
+        return _line_case(simplex)
+
+    return None  # Origin is inside or on the edge of the triangle
+
+
+def gjk_intersect(a, b) -> Union[bool, None]:
+    """
+    Test intersection of two convex colliders with Gilbert-Johnson-Keerthi
+    algorithm. Touching colliders do intersect like in the separating axis
+    test.
+
+    :param a: First collider.
+    :param b: Second collider.
+    :type a: ConvexCollider
+    :type b: ConvexCollider
+    :return: True if colliders intersect, False if not and None if the
+        algorithm didn't converge
+    :rtype: bool or None
+    """
+    dx = b._rect.centerx - a._rect.centerx
+    dy = b._rect.centery - a._rect.centery
+    if dx == 0 and dy == 0:
+        dx = 1.0
+
+    point = _minkowski_support(a, b, dx, dy)
+    if point == (0, 0):
+        return True
+    simplex = [point]
+    dx = -point[0]
+    dy = -point[1]
+
+    iterations = len(a._shape._vertices) + len(b._shape._vertices) + _EXTRA_ITERATIONS
+    for _ in range(iterations):
+        point = _minkowski_support(a, b, dx, dy)
+        if point[0] * dx + point[1] * dy < 0:
+            return False  # Origin is beyond the support point
+        if point in simplex:
+            return False  # No progress, origin can't be enclosed
+        simplex.append(point)
+
+        if len(simplex) == 2:
+            direction = _line_case(simplex)
+        else:
+            direction = _triangle_case(simplex)
+        if direction is None:
+            return True
+        dx, dy = direction
+        if dx == 0 and dy == 0:
+            return True
+    return None
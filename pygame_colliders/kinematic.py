@@ -0,0 +1,98 @@
+from typing import List
+
+from .base import Collider
+from .rect import Rect
+from .sweep import SweepHit
+
+# Distance kept between the moving collider and the surface it hits so that
+# rounding errors don't leave the colliders overlapping
+SKIN_WIDTH = 1e-6
+
+
+def move_and_slide(
+    collider: Collider, dx: float, dy: float, world, max_iterations: int = 4
+) -> List[SweepHit]:
+    """
+    Move collider by (dx, dy) stopping at the colliders of the world and
+    sliding along them with the rest of the movement. The movement is swept
+    so fast colliders don't tunnel through thin ones.
+
+    Each iteration sweeps the remaining movement against the colliders
+    found from the swept area, advances to the earliest hit and removes the
+    part of the remaining movement going into the hit collider. The
+    collider is moved only once after all the iterations.
+
+    Example of usage:
+
+    .. code-block:: python
+
+        hits = move_and_slide(player, velocity_x, velocity_y, world)
+        on_ground = any(hit.normal.y < -0.7 for hit in hits)
+
+    :param collider: Collider to move. Colliders whose collision layers don't
+        match with it are passed through.
+    :param dx: Movement along x axis.
+    :param dy: Movement along y axis.
+    :param world: World or broad phase to find the colliders from.
+    :param max_iterations: Maximum number of sweeps.
+    :type collider: Collider
+    :type dx: float
+    :type dy: float
+    :type world: CollisionWorld
+    :type max_iterations: int
+    :return: Hits in the order they happened
+    :rtype: list(SweepHit)
+    """
+    hits = []
+    ox = 0.0
+    oy = 0.0
+    rect = collider._rect
+
+    for _ in range(max_iterations):
+        if dx == 0 and dy == 0:
+            break
+
+        left = rect.left + ox
+        top = rect.top + oy
+        area = Rect(
+            min(left, left + dx),
+            min(top, top + dy),
+            rect.width + abs(dx),
+            rect.height + abs(dy),
+        )
+
+        earliest = None
+        for other in world.query_rect(area, collider):
+            if other is collider:
+                continue
+            hit = collider._sweep(other, dx, dy, ox, oy)
+            if hit is not None and (earliest is None or hit.time < earliest.time):
+                earliest = hit
+
+        if earliest is None:
+            ox += dx
+            oy += dy
+            break
+        hits.append(earliest)
+
+        # Advance until the hit leaving a skin width from the surface
+        nx = earliest.normal.x
+        ny = earliest.normal.y
+        into = -(nx * dx + ny * dy)
+        time = earliest.time
+        if into > 0:
+            time = max(time - SKIN_WIDTH / into, 0.0)
+        ox += dx * time
+        oy += dy * time
+
+        # Slide with the rest of the movement along the surface
+        dx *= 1 - time
+        dy *= 1 - time
+        into = nx * dx + ny * dy
+        if into < 0:
+            dx -= nx * into
+            dy -= ny * into
+
+    if ox or oy:
+        collider._move(ox, oy)
+    return hits
@@ -0,0 +1,91 @@
+from typing import Dict, Tuple
+
+from .base import Collider
+
+LayerPair = Tuple[int, int]
+
+
+class LayerStats:
+    """
+    Counts candidate pairs rejected by collision layer filtering. Counts are
+    kept per pair of categories so it's easy to see which layers produce
+    most of the culled pairs.
+
+    Example of usage:
+
+    .. code-block:: python
+
+        world = CollisionWorld()
+        ...
+        world.collisions()
+        print(world.layer_stats.culled(ENEMY_BULLET, ENEMY_BULLET))
+
+    """
+
+    def __init__(self):
+        self._culled: Dict[LayerPair, int] = {}
+
+    def record(self, a: Collider, b: Collider):
+        """
+        Record a culled pair.
+
+        :param a: First collider of the pair.
+        :param b: Second collider of the pair.
+        :type a: Collider
+        :type b: Collider
+        """
+        key = (a._category, b._category)
+        if key[0] > key[1]:
+            key = (key[1], key[0])
+        self._culled[key] = self._culled.get(key, 0) + 1
+
+    def culled(self, category_a: int, category_b: int) -> int:
+        """
+        Number of culled pairs between two categories. Order of the
+        categories doesn't matter.
+
+        :param category_a: Category of the first collider.
+        :param category_b: Category of the second collider.
+        :type category_a: int
+        :type category_b: int
+        :return: Number of culled pairs
+        :rtype: int
+        """
+        if category_a > category_b:
+            category_a, category_b = category_b, category_a
+        return self._culled.get((category_a, category_b), 0)
+
+    @property
+    def total(self) -> int:
+        """
+        Total number of culled pairs.
+
+        :getter: the number of culled pairs
+        :type: int
+        """
+        return sum(self._culled.values())
+
+    def as_dict(self) -> Dict[LayerPair, int]:
+        """
+        Culled pair counts keyed by category pairs.
+
+        :return: Copy of the counts
+        :rtype: dict(tuple(int, int), int)
+        """
+        return dict(self._culled)
+
+    def merge(self, other: "LayerStats"):
+        """
+        Add counts of the other statistics to these statistics.
+
+        :param other: Statistics to add.
+        :type other: LayerStats
+        """
+        for key, count in other._culled.items():
+            self._culled[key] = self._culled.get(key, 0) + count
+
+    def reset(self):
+        """
+        Clear all counts.
+        """
+        self._culled = {}
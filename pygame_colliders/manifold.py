@@ -0,0 +1,184 @@
+from math import sqrt
+from typing import List, Tuple
+
+from .vector import Vector2
+
+Point = Tuple[float, float]
+
+# Contact points this far outside the reference edge are still accepted
+_CONTACT_TOLERANCE = 1e-9
+
+
+class Manifold:
+    """
+    Result of a collision test holding the information needed to separate
+    colliding colliders.
+
+    Normal points from the first collider towards the second one. Moving the
+    second collider by ``normal * depth`` (or the first one by the opposite)
+    separates the colliders.
+
+    Example of usage:
+
+    .. code-block:: python
+
+        manifold = collider_a.collide_manifold(collider_b)
+        if manifold is not None:
+            collider_b.x += manifold.normal.x * manifold.depth
+            collider_b.y += manifold.normal.y * manifold.depth
+
+    :param normal: Unit vector of the collision normal.
+    :param depth: Penetration depth along the normal.
+    :param points: Contact points.
+    :type normal: Vector2
+    :type depth: float
+    :type points: list(tuple(float, float))
+    """
+
+    def __init__(self, normal: Vector2, depth: float, points: List[Point]):
+        self._normal = normal
+        self._depth = depth
+        self._points = points
+
+    @property
+    def normal(self) -> Vector2:
+        """
+        Unit vector of the collision normal pointing from the first collider
+        towards the second one.
+
+        :getter: the normal
+        :type: Vector2
+        """
+        return self._normal
+
+    @property
+    def depth(self) -> float:
+        """
+        Penetration depth along the normal.
+
+        :getter: the depth
+        :type: float
+        """
+        return self._depth
+
+    @property
+    def points(self) -> List[Point]:
+        """
+        Contact points of the collision. There are at most two points.
+
+        :getter: the contact points
+        :type: list(tuple(float, float))
+        """
+        return self._points
+
+    def flipped(self) -> "Manifold":
+        """
+        Create manifold for the colliders in the reversed order.
+
+        :return: Manifold with the opposite normal
+        :rtype: Manifold
+        """
+        normal = Vector2(-self._normal.x, -self._normal.y)
+        return Manifold(normal, self._depth, self._points)
+
+    def __repr__(self):
+        return f"Manifold<{self._normal!r}, {self._depth}, {self._points}>"
+
+
+def _best_edge(collider, nx: float, ny: float) -> Tuple[Point, Point, Point]:
+    """
+    Find the edge of the collider most perpendicular to the normal among the
+    edges sharing the vertex furthest to the normal.
+
+    :return: Start, end and the furthest vertex of the edge
+    """
+    vertices = collider._shape._vertices
+    ox = collider._ox
+    oy = collider._oy
+    count = len(vertices)
+    index = collider._support_index(nx, ny)
+    vx, vy = vertices[index]
+    px, py = vertices[index - 1]
+    qx, qy = vertices[(index + 1) % count]
+
+    lx = vx - qx
+    ly = vy - qy
+    rx = vx - px
+    ry = vy - py
+    l_len = sqrt(lx * lx + ly * ly) or 1.0
+    r_len = sqrt(rx * rx + ry * ry) or 1.0
+
+    v = (vx + ox, vy + oy)
+    if (rx * nx + ry * ny) / r_len <= (lx * nx + ly * ny) / l_len:
+        return (px + ox, py + oy), v, v
+    return v, (qx + ox, qy + oy), v
+
+
+def _clip(a: Point, b: Point, nx: float, ny: float, offset: float) -> List[Point]:
+    """
+    Clip segment ab to the half plane where ``n * p >= offset``.
+    """
+    clipped = []
+    da = nx * a[0] + ny * a[1] - offset
+    db = nx * b[0] + ny * b[1] - offset
+    if da >= 0:
+        clipped.append(a)
+    if db >= 0:
+        clipped.append(b)
+    if da * db < 0:
+        t = da / (da - db)
+        clipped.append((a[0] + (b[0] - a[0]) * t, a[1] + (b[1] - a[1]) * t))
+    return clipped
+
+
+def contact_points(a, b, nx: float, ny: float) -> List[Point]:
+    """
+    Find contact points of two colliding convex colliders by clipping the
+    incident edge against the reference edge.
+
+    :param a: First collider.
+    :param b: Second collider.
+    :param nx: x component of the unit normal from a to b.
+    :param ny: y component of the unit normal from a to b.
+    :return: Up to two contact points
+    :rtype: list(tuple(float, float))
+    """
+    edge_a = _best_edge(a, nx, ny)
+    edge_b = _best_edge(b, -nx, -ny)
+
+    def alignment(edge):
+        ex = edge[1][0] - edge[0][0]
+        ey = edge[1][1] - edge[0][1]
+        length = sqrt(ex * ex + ey * ey) or 1.0
+        return abs(ex * nx + ey * ny) / length
+
+    # Reference edge is the one more perpendicular to the normal
+    if alignment(edge_a) <= alignment(edge_b):
+        ref, inc = edge_a, edge_b
+        rnx, rny = nx, ny  # Points out of the reference collider
+    else:
+        ref, inc = edge_b, edge_a
+        rnx, rny = -nx, -ny
+
+    (r1x, r1y), (r2x, r2y), ref_max = ref
+    ex = r2x - r1x
+    ey = r2y - r1y
+    length = sqrt(ex * ex + ey * ey)
+    if length == 0:
+        return [ref_max]
+    ex /= length
+    ey /= length
+
+    points = _clip(inc[0], inc[1], ex, ey, ex * r1x + ey * r1y)
+    if len(points) < 2:
+        return [inc[2]]
+    points = _clip(points[0], points[1], -ex, -ey, -(ex * r2x + ey * r2y))
+    if len(points) < 2:
+        return [inc[2]]
+
+    # Keep points that have penetrated the reference collider
+    face = rnx * ref_max[0] + rny * ref_max[1]
+    points = [p for p in points if rnx * p[0] + rny * p[1] <= face + _CONTACT_TOLERANCE]
+    if not points:
+        return [inc[2]]
+    return points
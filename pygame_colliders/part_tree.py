@@ -0,0 +1,183 @@
+from typing import Iterator, List, Sequence, Tuple, Union
+
+from .rect import Rect
+from .static_tree import (
+    _StaticNode,
+    _node_centerx,
+    _node_centery,
+    _pack,
+    _rect_centerx,
+    _rect_centery,
+)
+
+
+class _PartBox:
+    def __init__(self, index: int, rect: Rect):
+        self.index = index
+        self._rect = rect
+
+
+def _area(node: _StaticNode) -> float:
+    return (node.right - node.left) * (node.bottom - node.top)
+
+
+class PartTree:
+    """
+    Bounding volume hierarchy over the convex parts of a concave shape.
+    The parts never move relative to each other so the tree is packed once
+    in the local coordinates of the shape and shared by all the colliders
+    of the shape. Queries are given in the same local coordinates and
+    return indices of the parts.
+
+    :param rects: Bounding boxes of the parts in local coordinates.
+    :param node_capacity: Maximum number of children in a single node.
+    :type rects: list(Rect)
+    :type node_capacity: int
+    """
+
+    def __init__(self, rects: Sequence[Rect], node_capacity: int = 4):
+        self._root: Union[_StaticNode, None] = None
+
+        if not rects:
+            return
+        boxes = [_PartBox(i, rect) for i, rect in enumerate(rects)]
+        nodes = [
+            _StaticNode(group, True)
+            for group in _pack(boxes, node_capacity, _rect_centerx, _rect_centery)
+        ]
+        while len(nodes) > 1:
+            nodes = [
+                _StaticNode(group, False)
+                for group in _pack(nodes, node_capacity, _node_centerx, _node_centery)
+            ]
+        self._root = nodes[0]
+
+    def query_point(self, x: float, y: float) -> List[int]:
+        """
+        Find parts whose bounding boxes contain the point. Points on the
+        edges of the bounding boxes are contained.
+
+        :param x: Local x coordinate of the point.
+        :param y: Local y coordinate of the point.
+        :type x: float
+        :type y: float
+        :return: Indices of the parts containing the point
+        :rtype: list(int)
+        """
+        found = []
+        if self._root is None:
+            return found
+
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if x < node.left or x > node.right or y < node.top or y > node.bottom:
+                continue
+            if not node.is_leaf:
+                stack.extend(node.children)
+                continue
+            for box in node.children:
+                rect = box._rect
+                if rect.left <= x <= rect.right and rect.top <= y <= rect.bottom:
+                    found.append(box.index)
+        return found
+
+    def query_rect(
+        self, left: float, top: float, right: float, bottom: float
+    ) -> List[int]:
+        """
+        Find parts whose bounding boxes overlap or touch the area.
+
+        :param left: Local left coordinate of the area.
+        :param top: Local top coordinate of the area.
+        :param right: Local right coordinate of the area.
+        :param bottom: Local bottom coordinate of the area.
+        :type left: float
+        :type top: float
+        :type right: float
+        :type bottom: float
+        :return: Indices of the parts overlapping the area
+        :rtype: list(int)
+        """
+        found = []
+        if self._root is None:
+            return found
+
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if (
+                node.left > right
+                or node.right < left
+                or node.top > bottom
+                or node.bottom < top
+            ):
+                continue
+            if not node.is_leaf:
+                stack.extend(node.children)
+                continue
+            for box in node.children:
+                rect = box._rect
+                if (
+                    rect.left <= right
+                    and rect.right >= left
+                    and rect.top <= bottom
+                    and rect.bottom >= top
+                ):
+                    found.append(box.index)
+        return found
+
+    def pairs(
+        self, other: "PartTree", dx: float = 0.0, dy: float = 0.0
+    ) -> Iterator[Tuple[int, int]]:
+        """
+        Find pairs of parts of the two trees whose bounding boxes overlap or
+        touch by descending both trees at the same time. Subtrees that don't
+        overlap are never visited.
+
+        :param other: Tree of the other shape.
+        :param dx: Offset of this tree along x axis in the local coordinates
+            of the other tree.
+        :param dy: Offset of this tree along y axis in the local coordinates
+            of the other tree.
+        :type other: PartTree
+        :type dx: float
+        :type dy: float
+        :return: Iterator of part index pairs, own part first
+        :rtype: iterator(tuple(int, int))
+        """
+        if self._root is None or other._root is None:
+            return
+
+        stack = [(self._root, other._root)]
+        while stack:
+            a, b = stack.pop()
+            if (
+                a.left + dx > b.right
+                or a.right + dx < b.left
+                or a.top + dy > b.bottom
+                or a.bottom + dy < b.top
+            ):
+                continue
+
+            if a.is_leaf and b.is_leaf:
+                for box_a in a.children:
+                    rect_a = box_a._rect
+                    left = rect_a.left + dx
+                    right = rect_a.right + dx
+                    top = rect_a.top + dy
+                    bottom = rect_a.bottom + dy
+                    for box_b in b.children:
+                        rect_b = box_b._rect
+                        if (
+                            left <= rect_b.right
+                            and right >= rect_b.left
+                            and top <= rect_b.bottom
+                            and bottom >= rect_b.top
+                        ):
+                            yield box_a.index, box_b.index
+            elif b.is_leaf or (not a.is_leaf and _area(a) >= _area(b)):
+                # Descend the larger node first
+                stack.extend((child, b) for child in a.children)
+            else:
+                stack.extend((a, child) for child in b.children)
@@ -15,6 +15,8 @@ class Rect:
     :type h: float, int or None
     """
 
+    __slots__ = ("_x", "_y", "_w", "_h")
+
     def __init__(
         self,
         x: Union[List[float], float],
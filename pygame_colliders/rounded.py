@@ -0,0 +1,560 @@
+from math import sqrt
+from typing import Any, Sequence, Tuple, Union
+
+from .base import ALL_LAYERS, DEFAULT_CATEGORY, HAS_PYGAME, Collider
+from .convex import AxisCache, ConvexCollider
+from .manifold import Manifold
+from .rect import Rect
+from .shape import _rotation
+from .sweep import SweepHit, _SLIDE_EPSILON, _swept_rects_overlap
+from .vector import Vector2
+
+if HAS_PYGAME:
+    import pygame
+
+Point = Tuple[float, float]
+Separation = Tuple[float, float, float, float, float]
+
+# Sweeps starting this close to the other collider count as touching
+SWEEP_TOLERANCE = 1e-6
+
+
+def closest_on_segment(
+    px: float, py: float, ax: float, ay: float, bx: float, by: float
+) -> Point:
+    """
+    Find the point of segment ab closest to point p.
+
+    :return: Coordinates of the closest point
+    :rtype: tuple(float, float)
+    """
+    ex = bx - ax
+    ey = by - ay
+    length2 = ex * ex + ey * ey
+    if length2 == 0:
+        return ax, ay
+    t = ((px - ax) * ex + (py - ay) * ey) / length2
+    if t <= 0:
+        return ax, ay
+    if t >= 1:
+        return bx, by
+    return ax + ex * t, ay + ey * t
+
+
+def _cross(ox: float, oy: float, ax: float, ay: float, bx: float, by: float) -> float:
+    return (ax - ox) * (by - oy) - (ay - oy) * (bx - ox)
+
+
+def closest_between_segments(
+    a1x: float,
+    a1y: float,
+    a2x: float,
+    a2y: float,
+    b1x: float,
+    b1y: float,
+    b2x: float,
+    b2y: float,
+) -> Tuple[float, Point, Point]:
+    """
+    Find the closest points of segments a and b.
+
+    :return: Squared distance and the closest points of both segments
+    :rtype: tuple(float, tuple(float, float), tuple(float, float))
+    """
+    d1 = _cross(b1x, b1y, b2x, b2y, a1x, a1y)
+    d2 = _cross(b1x, b1y, b2x, b2y, a2x, a2y)
+    d3 = _cross(a1x, a1y, a2x, a2y, b1x, b1y)
+    d4 = _cross(a1x, a1y, a2x, a2y, b2x, b2y)
+    if d1 * d2 < 0 and d3 * d4 < 0:
+        # Segments cross each other
+        t = d1 / (d1 - d2)
+        point = (a1x + (a2x - a1x) * t, a1y + (a2y - a1y) * t)
+        return 0.0, point, point
+
+    # Otherwise one of the closest points is an end point
+    candidates = (
+        (closest_on_segment(b1x, b1y, a1x, a1y, a2x, a2y), (b1x, b1y)),
+        (closest_on_segment(b2x, b2y, a1x, a1y, a2x, a2y), (b2x, b2y)),
+        ((a1x, a1y), closest_on_segment(a1x, a1y, b1x, b1y, b2x, b2y)),
+        ((a2x, a2y), closest_on_segment(a2x, a2y, b1x, b1y, b2x, b2y)),
+    )
+    best = None
+    for p, q in candidates:
+        dx = q[0] - p[0]
+        dy = q[1] - p[1]
+        distance2 = dx * dx + dy * dy
+        if best is None or distance2 < best[0]:
+            best = (distance2, p, q)
+    return best
+
+
+def _inside_convex(px: float, py: float, vertices: Sequence[Point]) -> bool:
+    # Point on the same side of every edge. Points on the edges are inside.
+    sign = 0.0
+    prev_x, prev_y = vertices[-1]
+    for x, y in vertices:
+        side = (x - prev_x) * (py - prev_y) - (y - prev_y) * (px - prev_x)
+        if side:
+            if sign == 0:
+                sign = side
+            elif (side > 0) != (sign > 0):
+                return False
+        prev_x = x
+        prev_y = y
+    return True
+
+
+def closest_to_polygon(
+    ax: float,
+    ay: float,
+    bx: float,
+    by: float,
+    vertices: Sequence[Point],
+    ox: float = 0.0,
+    oy: float = 0.0,
+) -> Union[Tuple[float, Point, Point], None]:
+    """
+    Find the closest points of segment ab and the convex polygon by testing
+    against the nearest edge. The polygon is given by its local vertices
+    and the position of its local origin so that the vertices aren't moved.
+
+    :return: Squared distance and the closest points of the segment and the
+        polygon or None if the segment is inside or crosses the polygon
+    :rtype: tuple(float, tuple(float, float), tuple(float, float)) or None
+    """
+    # Segment to the local coordinates of the polygon
+    ax -= ox
+    ay -= oy
+    bx -= ox
+    by -= oy
+    if _inside_convex(ax, ay, vertices) or _inside_convex(bx, by, vertices):
+        return None
+
+    best = None
+    prev_x, prev_y = vertices[-1]
+    for x, y in vertices:
+        closest = closest_between_segments(ax, ay, bx, by, prev_x, prev_y, x, y)
+        if closest[0] == 0:
+            return None
+        if best is None or closest[0] < best[0]:
+            best = closest
+        prev_x = x
+        prev_y = y
+    if best is None:
+        return None
+    distance2, (px, py), (qx, qy) = best
+    return distance2, (px + ox, py + oy), (qx + ox, qy + oy)
+
+
+def _ends(ax: float, ay: float, bx: float, by: float) -> Tuple[Point, ...]:
+    if ax == bx and ay == by:
+        return ((ax, ay),)
+    return (ax, ay), (bx, by)
+
+
+def _ray_circle(
+    px: float, py: float, dx: float, dy: float, cx: float, cy: float, r: float
+) -> Union[float, None]:
+    # First time in [0, 1] when point p moving by d is at distance r from
+    # point c. Roots of |p + t * d - c|^2 = r^2.
+    fx = px - cx
+    fy = py - cy
+    b = fx * dx + fy * dy
+    if b >= 0:
+        return None  # Not closing in
+    a = dx * dx + dy * dy
+    discriminant = b * b - a * (fx * fx + fy * fy - r * r)
+    if discriminant < 0:
+        return None
+    t = (-b - sqrt(discriminant)) / a
+    if t > 1:
+        return None
+    return max(t, 0.0)
+
+
+def _ray_capsule(
+    px: float,
+    py: float,
+    dx: float,
+    dy: float,
+    ax: float,
+    ay: float,
+    bx: float,
+    by: float,
+    r: float,
+) -> Union[Tuple[float, float, float], None]:
+    """
+    Find when point p moving by d first touches segment ab grown by radius r.
+    The point is swept against both sides of the segment and the circles at
+    its ends.
+
+    :return: Time in range [0, 1] and unit normal from the segment towards
+        the point or None if the point doesn't touch during the movement
+    :rtype: tuple(float, float, float) or None
+    """
+    best = None
+    ex = bx - ax
+    ey = by - ay
+    length2 = ex * ex + ey * ey
+    if length2:
+        length = sqrt(length2)
+        mx = -ey / length
+        my = ex / length
+        side = (px - ax) * mx + (py - ay) * my
+        if side < 0:
+            mx, my, side = -mx, -my, -side
+        speed = dx * mx + dy * my
+        if speed < 0 and side >= r and side + speed <= r:
+            t = (r - side) / speed
+            u = ((px + dx * t - ax) * ex + (py + dy * t - ay) * ey) / length2
+            if 0 <= u <= 1:
+                best = (t, mx, my)
+
+    for cx, cy in _ends(ax, ay, bx, by):
+        t = _ray_circle(px, py, dx, dy, cx, cy, r)
+        if t is None or (best is not None and t >= best[0]):
+            continue
+        hx = px + dx * t - cx
+        hy = py + dy * t - cy
+        if hx == 0 and hy == 0:
+            hx, hy = -dx, -dy  # Zero radius, point hits the end head on
+        length = sqrt(hx * hx + hy * hy)
+        best = (t, hx / length, hy / length)
+    return best
+
+
+class RoundCollider(Collider):
+    """
+    Base of the colliders made of a line segment grown by a radius. Tests
+    between the round colliders and against convex colliders are done in
+    closed form from the distance to the segment.
+
+    :param start: Start point of the segment.
+    :param end: End point of the segment.
+    :param radius: Distance of the surface from the segment.
+    :type start: tuple(float/int, float/int)
+    :type end: tuple(float/int, float/int)
+    :type radius: float, int
+    """
+
+    __slots__ = ("points", "_radius", "_base")
+
+    def __init__(
+        self,
+        start: Tuple[float, float],
+        end: Tuple[float, float],
+        radius: float,
+        data: Any = None,
+        category: int = DEFAULT_CATEGORY,
+        mask: int = ALL_LAYERS,
+    ):
+        super().__init__(data=data, category=category, mask=mask)
+        if radius < 0:
+            raise ValueError("Radius must not be negative")
+        # Circles have a single point which is both ends of the segment
+        if tuple(start) == tuple(end):
+            self.points = [[start[0], start[1]]]
+        else:
+            self.points = [[start[0], start[1]], [end[0], end[1]]]
+        self._radius = radius
+        # Half of the untransformed segment and radius, kept once transformed
+        self._base: Union[Tuple[float, float, float], None] = None
+        self._setup_rect()
+
+    def _setup_rect(self):
+        (ax, ay), (bx, by) = self.points[0], self.points[-1]
+        r = self._radius
+        left = min(ax, bx) - r
+        top = min(ay, by) - r
+        self._rect = Rect(left, top, max(ax, bx) + r - left, max(ay, by) + r - top)
+
+    @property
+    def radius(self) -> float:
+        """
+        Distance of the surface from the center or the center line.
+
+        :getter: the radius
+        :type: float, int
+        """
+        return self._radius
+
+    def _segment(self, ox: float = 0.0, oy: float = 0.0) -> Tuple[float, ...]:
+        (ax, ay), (bx, by) = self.points[0], self.points[-1]
+        return ax + ox, ay + oy, bx + ox, by + oy
+
+    def collide(self, other, cache: Union[AxisCache, None] = None) -> bool:
+        """
+        Check collision against the other collider.
+
+        :param other: Other collider to check collision against.
+        :param cache: Passed on to concave colliders. See
+            :meth:`ConvexCollider.collide`.
+        :type other: Collider
+        :type cache: dict or None
+        :return: True if collision happens, False otherwise
+        :rtype: bool
+        """
+        if not self._rect.collide_rect(other._rect):
+            return False  # Bounding boxes don't collide
+
+        if isinstance(other, RoundCollider):
+            distance2, _, _ = closest_between_segments(
+                *self._segment(), *other._segment()
+            )
+            reach = self._radius + other._radius
+            return distance2 <= reach * reach
+
+        if isinstance(other, ConvexCollider):
+            closest = closest_to_polygon(
+                *self._segment(), other._shape._vertices, other._ox, other._oy
+            )
+            return closest is None or closest[0] <= self._radius * self._radius
+
+        return other.collide(self, cache)
+
+    def _separation(self, other, ox: float, oy: float) -> Separation:
+        """
+        Find signed distance between this collider offset by (ox, oy) and the
+        other round or convex collider. Distance is negative when colliders
+        overlap.
+
+        :return: Distance, unit normal from self to other and the contact
+            point
+        :rtype: tuple(float, float, float, float, float)
+        """
+        ax, ay, bx, by = self._segment(ox, oy)
+        r = self._radius
+        if isinstance(other, RoundCollider):
+            closest = closest_between_segments(ax, ay, bx, by, *other._segment())
+            reach = r + other._radius
+        else:
+            closest = closest_to_polygon(
+                ax, ay, bx, by, other._shape._vertices, other._ox, other._oy
+            )
+            reach = r
+
+        if closest is not None and closest[0] > 0:
+            distance2, (px, py), (qx, qy) = closest
+            distance = sqrt(distance2)
+            nx = (qx - px) / distance
+            ny = (qy - py) / distance
+            return distance - reach, nx, ny, px + nx * r, py + ny * r
+
+        if isinstance(other, RoundCollider):
+            # Center lines cross. Push apart along the line between centers.
+            cx, cy, dx, dy = other._segment()
+            nx = (cx + dx - ax - bx) / 2
+            ny = (cy + dy - ay - by) / 2
+            length = sqrt(nx * nx + ny * ny)
+            if length == 0:
+                nx, ny, length = 1.0, 0.0, 1.0
+            nx /= length
+            ny /= length
+            return -reach, nx, ny, (ax + bx) / 2, (ay + by) / 2
+
+        # Center line inside the polygon. Use the axis of the smallest
+        # overlap among the polygon edges and the segment normal.
+        axes = [
+            (x / length, y / length, low / length, high / length)
+            for (x, y), (low, high), length in zip(
+                other._axes, other._axis_ranges, other._axis_lengths
+            )
+        ]
+        length = sqrt((bx - ax) ** 2 + (by - ay) ** 2)
+        if length:
+            x = (ay - by) / length
+            y = (bx - ax) / length
+            axes.append((x, y, *other._project(x, y)))
+
+        best_depth = None
+        best_axis = (1.0, 0.0)
+        for x, y, low, high in axes:
+            pa = x * ax + y * ay
+            pb = x * bx + y * by
+            forward = max(pa, pb) + r - low
+            backward = high - min(pa, pb) + r
+            if forward <= backward:
+                depth, axis = forward, (x, y)
+            else:
+                depth, axis = backward, (-x, -y)
+            if best_depth is None or depth < best_depth:
+                best_depth = depth
+                best_axis = axis
+        nx, ny = best_axis
+        px, py = other._support(-nx, -ny)
+        return -best_depth, nx, ny, px, py
+
+    def collide_manifold(self, other) -> Union[Manifold, None]:
+        """
+        Check collision against the other collider and find out how to
+        separate the colliders.
+
+        :param other: Other collider to check collision against.
+        :type other: Collider
+        :return: Manifold if collision happens, None otherwise
+        :rtype: Manifold or None
+        """
+        if not self._rect.collide_rect(other._rect):
+            return None  # Bounding boxes don't collide
+
+        if not isinstance(other, (RoundCollider, ConvexCollider)):
+            manifold = other.collide_manifold(self)
+            return None if manifold is None else manifold.flipped()
+
+        distance, nx, ny, px, py = self._separation(other, 0.0, 0.0)
+        if distance > 0:
+            return None
+        return Manifold(Vector2(nx, ny), -distance, [(px, py)])
+
+    def sweep(self, other, dx: float, dy: float) -> Union[SweepHit, None]:
+        """
+        Find when this collider moving by (dx, dy) first touches the other
+        collider. The time of impact is solved in closed form from the
+        segment and the edges or the segment of the other collider.
+
+        The collider itself isn't moved.
+
+        :param other: Other collider to check collision against.
+        :param dx: Movement along x axis.
+        :param dy: Movement along y axis.
+        :type other: Collider
+        :type dx: float
+        :type dy: float
+        :return: Hit with time of impact in range [0, 1] and contact normal
+            or None if colliders don't touch during the movement
+        :rtype: SweepHit or None
+        """
+        return self._sweep(other, dx, dy, 0.0, 0.0)
+
+    def _sweep(
+        self, other, dx: float, dy: float, ox: float, oy: float
+    ) -> Union[SweepHit, None]:
+        """
+        Sweep test starting from this collider offset by (ox, oy).
+        """
+        if not isinstance(other, (RoundCollider, ConvexCollider)):
+            hit = other._sweep(self, -dx, -dy, -ox, -oy)
+            if hit is None:
+                return None
+            normal = Vector2(-hit.normal.x, -hit.normal.y)
+            return SweepHit(hit.time, normal, other)
+
+        if not _swept_rects_overlap(self, other, dx, dy, ox, oy):
+            return None
+
+        distance, nx, ny, _, _ = self._separation(other, ox, oy)
+        if distance <= SWEEP_TOLERANCE:
+            # Touching already at the start. Report the hit only when moving
+            # deeper so that colliders can slide along.
+            if nx * dx + ny * dy <= _SLIDE_EPSILON * (abs(dx) + abs(dy)):
+                return None
+            return SweepHit(0.0, Vector2(-nx, -ny), other)
+        if dx == 0 and dy == 0:
+            return None
+
+        hit = self._sweep_features(other, dx, dy, ox, oy)
+        if hit is None:
+            return None
+        time, nx, ny = hit
+        return SweepHit(time, Vector2(nx, ny), other)
+
+    def _sweep_features(
+        self, other, dx: float, dy: float, ox: float, oy: float
+    ) -> Union[Tuple[float, float, float], None]:
+        """
+        Find the time of impact in closed form. Ends of the own segment are
+        swept against the other collider grown by the radius, and the ends or
+        the corners of the other collider against the own segment grown by
+        the radius the other way.
+
+        :return: Time of impact and unit normal from the other collider
+            towards this one or None if colliders don't touch
+        :rtype: tuple(float, float, float) or None
+        """
+        ax, ay, bx, by = self._segment(ox, oy)
+        if isinstance(other, RoundCollider):
+            reach = self._radius + other._radius
+            cx, cy, ex, ey = other._segment()
+            segments = [(cx, cy, ex, ey)]
+            corners = _ends(cx, cy, ex, ey)
+        else:
+            reach = self._radius
+            px = other._ox
+            py = other._oy
+            corners = [(x + px, y + py) for x, y in other._shape._vertices]
+            segments = [
+                (*corners[i - 1], *corners[i]) for i in range(len(corners))
+            ]
+
+        best = None
+        for px, py in _ends(ax, ay, bx, by):
+            for segment in segments:
+                hit = _ray_capsule(px, py, dx, dy, *segment, reach)
+                if hit is not None and (best is None or hit[0] < best[0]):
+                    best = hit
+        for px, py in corners:
+            hit = _ray_capsule(px, py, -dx, -dy, ax, ay, bx, by, reach)
+            if hit is not None and (best is None or hit[0] < best[0]):
+                best = (hit[0], -hit[1], -hit[2])
+        return best
+
+    def point_collide(self, point: Tuple[float]) -> bool:
+        """
+        Check if point is within collider.
+
+        :param point: Point to test
+        :type point: Tuple[float/int, float/int]
+        :return: True if point is collider, False otherwise
+        :rtype: bool
+        """
+        px, py = point
+        cx, cy = closest_on_segment(px, py, *self._segment())
+        return (px - cx) ** 2 + (py - cy) ** 2 <= self._radius * self._radius
+
+    def _transform(self, rotation: float, scale: float):
+        # Segment turns around its middle point
+        ax, ay, bx, by = self._segment()
+        mx = (ax + bx) / 2
+        my = (ay + by) / 2
+        if self._base is None:
+            self._base = ((bx - ax) / 2, (by - ay) / 2, self._radius)
+        hx, hy, radius = self._base
+        c, s = _rotation(rotation)
+        hx, hy = (c * hx - s * hy) * scale, (s * hx + c * hy) * scale
+        if len(self.points) == 2:
+            self.points = [[mx - hx, my - hy], [mx + hx, my + hy]]
+        self._radius = radius * scale
+        self._rotation = rotation
+        self._scale = scale
+        self._setup_rect()
+        self._changed()
+
+    def _move(self, dx: float, dy: float):
+        for point in self.points:
+            point[0] += dx
+            point[1] += dy
+
+        # Update rect
+        super()._move(dx, dy)
+
+    if HAS_PYGAME:
+
+        def draw(self, surface, color=(255, 255, 255), width=1):
+            ax, ay, bx, by = self._segment()
+            r = self._radius
+            pygame.draw.circle(surface, color, (ax, ay), r, width)
+            if len(self.points) == 1:
+                return
+            pygame.draw.circle(surface, color, (bx, by), r, width)
+            length = sqrt((bx - ax) ** 2 + (by - ay) ** 2)
+            nx = (ay - by) / length * r
+            ny = (bx - ax) / length * r
+            if width == 0:
+                corners = [(ax + nx, ay + ny), (bx + nx, by + ny)]
+                corners += [(bx - nx, by - ny), (ax - nx, ay - ny)]
+                pygame.draw.polygon(surface, color, corners)
+                return
+            for side in (1, -1):
+                start = (ax + nx * side, ay + ny * side)
+                end = (bx + nx * side, by + ny * side)
+                pygame.draw.line(surface, color, start, end, width)
@@ -0,0 +1,367 @@
+from bisect import bisect_left
+from collections import OrderedDict
+from math import atan2, cos, radians, sin, sqrt
+from typing import Any, List, Sequence, Tuple, Union
+from weakref import WeakValueDictionary
+
+from .rect import Rect
+
+Point = Tuple[float, float]
+
+# Shapes with at least this many vertices find extreme vertices with a
+# binary search instead of scanning all the vertices
+LOG_SUPPORT_THRESHOLD = 32
+
+# Shape classes picked at construction time for the specialized kernels
+_POLYGON = 0
+_AABB = 1
+_TRIANGLE = 2
+
+# Number of rotated and scaled variants remembered per shape
+TRANSFORM_CACHE_SIZE = 8
+
+# Shapes in use, shared by the colliders having the same local vertices
+_SHAPES: "WeakValueDictionary[Tuple[Point, ...], Shape]" = WeakValueDictionary()
+
+
+def _rotation(angle: float) -> Tuple[float, float]:
+    """
+    Cosine and sine of the angle in degrees. Quarter turns are exact so that
+    rotated rectangles stay axis-aligned.
+    """
+    quarter, rest = divmod(angle, 90)
+    if rest == 0:
+        return ((1, 0), (0, 1), (-1, 0), (0, -1))[int(quarter) % 4]
+    angle = radians(angle)
+    return cos(angle), sin(angle)
+
+
+def _transformed(shape: Any, rotation: float, scale: float) -> Any:
+    """
+    Find the rotated and scaled variant of the shape from the cache of the
+    shape or transform the shape around the center of its bounding box.
+    """
+    rotation %= 360
+    if rotation == 0 and scale == 1:
+        return shape
+    key = (rotation, scale)
+    cache = shape._transforms
+    if cache is None:
+        cache = shape._transforms = OrderedDict()
+    transformed = cache.get(key)
+    if transformed is None:
+        rect = shape._rect
+        transformed = shape._transform(rotation, scale, rect.centerx, rect.centery)
+        transformed._base = shape
+        cache[key] = transformed
+        if len(cache) > TRANSFORM_CACHE_SIZE:
+            cache.popitem(last=False)
+    else:
+        cache.move_to_end(key)
+    return transformed
+
+
+class Shape:
+    """
+    Immutable convex polygon in local coordinates. Everything derived from
+    the vertices, like the edge normals, separating axes and their
+    projections, is computed once here and shared by all the colliders of
+    the same shape. Colliders only store the position of the local origin.
+
+    Example of usage:
+
+    .. code-block:: python
+
+        crate = Shape([(0, 0), (16, 0), (16, 16), (0, 16)])
+        crates = [ConvexCollider.from_shape(crate, (x * 20, 0)) for x in range(500)]
+
+    :param vertices: Vertices of the polygon in local coordinates.
+    :type vertices: list(tuple(float, float))
+    """
+
+    def __init__(self, vertices: Sequence[Sequence[float]]):
+        self._vertices: Tuple[Point, ...] = tuple((x, y) for x, y in vertices)
+        self._edges: Tuple[Point, ...] = ()
+        self._normals: Tuple[Point, ...] = ()
+        self._axes: List[Point] = []
+        self._axis_ranges: List[Tuple[float, float]] = []
+        self._axis_lengths: List[float] = []
+        self._support_angles: Union[List[float], None] = None
+        self._support_candidates: List[Tuple[int, ...]] = []
+        self._rect = Rect(0, 0, 0, 0)
+        self._kind = _POLYGON
+        self._winding = 0
+        # Untransformed shape and the transformed variants of this shape
+        self._base: Union[Shape, None] = None
+        self._transforms: Union[OrderedDict, None] = None
+
+        self._setup()
+
+    def _setup(self):
+        self._setup_edges()
+        self._setup_support()
+        self._setup_axes()
+        self._setup_rect()
+        self._setup_kind()
+
+    def _setup_edges(self):
+        vertices = self._vertices
+        self._edges = tuple(
+            (bx - ax, by - ay)
+            for (ax, ay), (bx, by) in zip(vertices, vertices[1:] + vertices[:1])
+        )
+        self._normals = tuple((-ey, ex) for ex, ey in self._edges)
+
+    def _setup_support(self):
+        # Outward edge normals sorted by angle. Extreme vertex to a direction
+        # is shared by the edges whose normals surround the direction.
+        vertices = self._vertices
+        count = len(vertices)
+        if count < LOG_SUPPORT_THRESHOLD:
+            self._support_angles = None
+            self._support_candidates = []
+            return
+
+        cx = sum(x for x, _ in vertices) / count
+        cy = sum(y for _, y in vertices) / count
+        normals = []
+        for i in range(count):
+            j = (i + 1) % count
+            ax, ay = vertices[i]
+            bx, by = vertices[j]
+            nx = ay - by
+            ny = bx - ax
+            if nx == 0 and ny == 0:
+                continue  # Degenerate edge
+            if nx * (ax - cx) + ny * (ay - cy) < 0:
+                nx = -nx
+                ny = -ny
+            normals.append((atan2(ny, nx), i, j))
+        normals.sort()
+
+        self._support_angles = [angle for angle, _, _ in normals]
+        # Neighbouring edges are included as candidates too so rounding of
+        # the angles can't pick a wrong vertex
+        self._support_candidates = [
+            tuple(dict.fromkeys((normals[k - 1][1], normals[k - 1][2], i, j)))
+            for k, (_, i, j) in enumerate(normals)
+        ]
+
+    def _setup_axes(self):
+        # Separating axes without parallel duplicates. Axes are pointed to
+        # the same half plane but not normalized so that integer coordinates
+        # stay exact.
+        axes = []
+        for x, y in self._normals:
+            if x < 0 or (x == 0 and y < 0):
+                x = -x
+                y = -y
+            if x == 0 and y == 0:
+                continue  # Degenerate edge
+            for ax, ay in axes:
+                if ax * y - ay * x == 0:
+                    break
+            else:
+                axes.append((x, y))
+        self._axes = axes
+        self._axis_ranges = [self._project(ax, ay) for ax, ay in axes]
+        self._axis_lengths = [sqrt(ax * ax + ay * ay) for ax, ay in axes]
+
+    def _setup_rect(self):
+        xs = [x for x, _ in self._vertices]
+        ys = [y for _, y in self._vertices]
+        left = min(xs)
+        top = min(ys)
+        self._rect = Rect(left, top, max(xs) - left, max(ys) - top)
+
+    def _setup_kind(self):
+        vertices = self._vertices
+        self._kind = _POLYGON
+        self._winding = 0
+        if len(vertices) == 3:
+            (ax, ay), (bx, by), (cx, cy) = vertices
+            area = (bx - ax) * (cy - ay) - (by - ay) * (cx - ax)
+            if area:
+                self._kind = _TRIANGLE
+                self._winding = 1 if area > 0 else -1
+        elif len(vertices) == 4 and self._rect.w and self._rect.h:
+            # Every vertex in a corner of the bounding box and every edge
+            # along an axis
+            rect = self._rect
+            corners = all(
+                x in (rect.left, rect.right) and y in (rect.top, rect.bottom)
+                for x, y in vertices
+            )
+            if corners and all(ex == 0 or ey == 0 for ex, ey in self._edges):
+                self._kind = _AABB
+
+    @property
+    def vertices(self) -> Tuple[Point, ...]:
+        """
+        Vertices of the polygon in local coordinates.
+
+        :getter: the vertices
+        :type: tuple(tuple(float, float))
+        """
+        return self._vertices
+
+    @property
+    def normals(self) -> Tuple[Point, ...]:
+        """
+        Normals of the edges in local coordinates. Normals are not
+        normalized.
+
+        :getter: the normals
+        :type: tuple(tuple(float, float))
+        """
+        return self._normals
+
+    @property
+    def is_aabb(self) -> bool:
+        """
+        Checks if shape is an axis-aligned rectangle.
+
+        :return: True if axis-aligned rectangle, False otherwise
+        :rtype: bool
+        """
+        return self._kind == _AABB
+
+    @property
+    def is_triangle(self) -> bool:
+        """
+        Checks if shape is a triangle.
+
+        :return: True if triangle, False otherwise
+        :rtype: bool
+        """
+        return self._kind == _TRIANGLE
+
+    def transformed(self, rotation: float = 0, scale: float = 1) -> "Shape":
+        """
+        Rotate and scale the shape around the center of its bounding box.
+        Rotation doesn't change the edges so the normals, separating axes and
+        their projections are transformed instead of computed again. Last
+        ``TRANSFORM_CACHE_SIZE`` variants are remembered by the shape.
+
+        :param rotation: Rotation in degrees. Positive angles turn x axis
+            towards y axis.
+        :param scale: Scale factor, must be positive.
+        :type rotation: float
+        :type scale: float
+        :return: Transformed shape
+        :rtype: Shape
+        """
+        return _transformed(self, rotation, scale)
+
+    def _transform(self, rotation: float, scale: float, px: float, py: float):
+        # Vertices are rotated and scaled around the pivot, edges and normals
+        # only rotated and scaled
+        c, s = _rotation(rotation)
+        sc = c * scale
+        ss = s * scale
+        shape = Shape.__new__(Shape)
+        shape._vertices = tuple(
+            (px + sc * (x - px) - ss * (y - py), py + ss * (x - px) + sc * (y - py))
+            for x, y in self._vertices
+        )
+        shape._edges = tuple((sc * x - ss * y, ss * x + sc * y) for x, y in self._edges)
+        shape._normals = tuple((-y, x) for x, y in shape._edges)
+
+        # Axes keep their lengths. Projection to a rotated axis is the scaled
+        # projection to the original axis measured from the pivot.
+        shape._axes = [(c * x - s * y, s * x + c * y) for x, y in self._axes]
+        shape._axis_ranges = []
+        for (ax, ay), (bx, by), (a_min, a_max) in zip(
+            self._axes, shape._axes, self._axis_ranges
+        ):
+            origin = ax * px + ay * py
+            pivot = bx * px + by * py
+            shape._axis_ranges.append(
+                (pivot + scale * (a_min - origin), pivot + scale * (a_max - origin))
+            )
+        shape._axis_lengths = self._axis_lengths
+        shape._base = None
+        shape._transforms = None
+
+        shape._setup_support()
+        shape._setup_rect()
+        shape._setup_kind()
+        return shape
+
+    def _support_index(self, dx: float, dy: float) -> int:
+        vertices = self._vertices
+        angles = self._support_angles
+        if angles is None:
+            candidates = range(len(vertices))
+        else:
+            k = bisect_left(angles, atan2(dy, dx))
+            if k == len(angles):
+                k = 0
+            candidates = self._support_candidates[k]
+
+        best = candidates[0]
+        x, y = vertices[best]
+        best_dot = dx * x + dy * y
+        for i in candidates:
+            x, y = vertices[i]
+            dot = dx * x + dy * y
+            if dot > best_dot:
+                best = i
+                best_dot = dot
+        return best
+
+    def _support(self, dx: float, dy: float) -> Point:
+        """
+        Find the vertex furthest to the given direction. Takes logarithmic
+        time for shapes with at least ``LOG_SUPPORT_THRESHOLD`` vertices.
+
+        :return: Local coordinates of the vertex
+        :rtype: tuple(float, float)
+        """
+        return self._vertices[self._support_index(dx, dy)]
+
+    def _project(self, ax: float, ay: float) -> Tuple[float, float]:
+        """
+        Project local vertices of the shape to the axis.
+
+        :return: Minimum and maximum of the projection
+        :rtype: tuple(float, float)
+        """
+        if self._support_angles is not None:
+            max_x, max_y = self._support(ax, ay)
+            min_x, min_y = self._support(-ax, -ay)
+            return ax * min_x + ay * min_y, ax * max_x + ay * max_y
+
+        vertices = self._vertices
+        x, y = vertices[0]
+        min_ = max_ = ax * x + ay * y
+        for x, y in vertices:
+            p = ax * x + ay * y
+            if p < min_:
+                min_ = p
+            elif p > max_:
+                max_ = p
+        return min_, max_
+
+    def __repr__(self):
+        return f"Shape<{list(self._vertices)}>"
+
+
+def intern_shape(vertices: Sequence[Sequence[float]]) -> Shape:
+    """
+    Find the shape having the given local vertices or create a new one.
+    Shapes are remembered as long as some collider uses them. Vertices are
+    compared exactly so float vertices that differ only by rounding give
+    different shapes.
+
+    :param vertices: Vertices of the polygon in local coordinates.
+    :type vertices: list(tuple(float, float))
+    :return: Shared shape
+    :rtype: Shape
+    """
+    key = tuple((x, y) for x, y in vertices)
+    shape = _SHAPES.get(key)
+    if shape is None:
+        shape = Shape(key)
+        _SHAPES[key] = shape
+    return shape
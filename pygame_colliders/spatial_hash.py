@@ -0,0 +1,210 @@
+from math import floor
+from typing import Dict, Iterator, List, Tuple, Union
+
+from .base import Collider
+from .layers import LayerStats
+from .rect import Rect
+
+CellRange = Tuple[int, int, int, int]
+
+
+class SpatialHash:
+    """
+    Uniform grid broad phase. Colliders are stored in every cell their
+    bounding box touches so candidate pairs are only generated between
+    colliders sharing a cell.
+
+    Example of usage:
+
+    .. code-block:: python
+
+        grid = SpatialHash(cell_size=64)
+        grid.insert(collider_a)
+        grid.insert(collider_b)
+
+        for a, b in grid.pairs():
+            if a.collide(b):
+                print("Collision detected")
+
+    :param cell_size: Width and height of a single grid cell.
+    :type cell_size: float, int
+    """
+
+    def __init__(self, cell_size: float = 64.0):
+        if cell_size <= 0:
+            raise ValueError("Cell size must be positive")
+        self._cell_size = cell_size
+        self._cells: Dict[Tuple[int, int], List[Collider]] = {}
+        self._ranges: Dict[Collider, CellRange] = {}
+        self._layer_stats = LayerStats()
+
+    @property
+    def cell_size(self) -> float:
+        """
+        Size of a single grid cell.
+
+        :getter: the cell size
+        :type: float, int
+        """
+        return self._cell_size
+
+    @property
+    def layer_stats(self) -> LayerStats:
+        """
+        Statistics of the pairs culled by collision layers.
+
+        :getter: the statistics
+        :type: LayerStats
+        """
+        return self._layer_stats
+
+    def __len__(self) -> int:
+        return len(self._ranges)
+
+    def __contains__(self, collider: Collider) -> bool:
+        return collider in self._ranges
+
+    def __iter__(self) -> Iterator[Collider]:
+        return iter(self._ranges)
+
+    def _cell_range(self, rect: Rect) -> CellRange:
+        size = self._cell_size
+        return (
+            floor(rect.left / size),
+            floor(rect.top / size),
+            floor(rect.right / size),
+            floor(rect.bottom / size),
+        )
+
+    def _add_to_cells(self, collider: Collider, range_: CellRange):
+        x0, y0, x1, y1 = range_
+        cells = self._cells
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                cell = cells.get((cx, cy))
+                if cell is None:
+                    cells[(cx, cy)] = [collider]
+                else:
+                    cell.append(collider)
+
+    def _remove_from_cells(self, collider: Collider, range_: CellRange):
+        x0, y0, x1, y1 = range_
+        cells = self._cells
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                cell = cells[(cx, cy)]
+                cell.remove(collider)
+                if not cell:
+                    del cells[(cx, cy)]
+
+    def insert(self, collider: Collider):
+        """
+        Add collider to the grid.
+
+        :param collider: Collider to add.
+        :type collider: Collider
+        """
+        if collider in self._ranges:
+            return
+        range_ = self._cell_range(collider._rect)
+        self._ranges[collider] = range_
+        self._add_to_cells(collider, range_)
+        collider._broadphases.append(self)
+
+    def remove(self, collider: Collider):
+        """
+        Remove collider from the grid.
+
+        :param collider: Collider to remove.
+        :type collider: Collider
+        """
+        range_ = self._ranges.pop(collider)
+        self._remove_from_cells(collider, range_)
+        collider._broadphases.remove(self)
+
+    def update(self, collider: Collider):
+        """
+        Update cell membership of the collider after it has moved. Called
+        automatically when a collider is moved.
+
+        :param collider: Collider that has moved.
+        :type collider: Collider
+        """
+        old_range = self._ranges[collider]
+        new_range = self._cell_range(collider._rect)
+        if new_range == old_range:
+            return
+        self._remove_from_cells(collider, old_range)
+        self._add_to_cells(collider, new_range)
+        self._ranges[collider] = new_range
+
+    def pairs(self) -> Iterator[Tuple[Collider, Collider]]:
+        """
+        Iterate over pairs of colliders whose bounding boxes overlap.
+
+        Each pair is reported once even if the colliders share many cells.
+        Pairs whose collision layers don't match are skipped.
+
+        :return: Iterator of collider pairs
+        :rtype: iterator(tuple(Collider, Collider))
+        """
+        ranges = self._ranges
+        layer_stats = self._layer_stats
+        for (cx, cy), cell in self._cells.items():
+            count = len(cell)
+            if count < 2:
+                continue
+            for i in range(count - 1):
+                a = cell[i]
+                a_range = ranges[a]
+                for j in range(i + 1, count):
+                    b = cell[j]
+                    b_range = ranges[b]
+                    # Report the pair only from the first cell both share
+                    if cx != max(a_range[0], b_range[0]) or cy != max(
+                        a_range[1], b_range[1]
+                    ):
+                        continue
+                    if not (a._category & b._mask and b._category & a._mask):
+                        layer_stats.record(a, b)
+                        continue
+                    if a._rect.collide_rect(b._rect):
+                        yield a, b
+
+    def query_rect(
+        self, rect: Rect, collider: Union[Collider, None] = None
+    ) -> List[Collider]:
+        """
+        Find colliders whose bounding boxes overlap the given rect.
+
+        When ``collider`` is given, colliders whose collision layers don't
+        match with it are skipped.
+
+        :param rect: Area to search.
+        :param collider: Collider to match the collision layers against.
+        :type rect: Rect
+        :type collider: Collider or None
+        :return: Colliders overlapping the area
+        :rtype: list(Collider)
+        """
+        x0, y0, x1, y1 = self._cell_range(rect)
+        cells = self._cells
+        seen = set()
+        found = []
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                cell = cells.get((cx, cy))
+                if cell is None:
+                    continue
+                for other in cell:
+                    if other in seen:
+                        continue
+                    seen.add(other)
+                    if collider is not None and not (
+                        collider._category & other._mask
+                        and other._category & collider._mask
+                    ):
+                        continue
+                    if rect.collide_rect(other._rect):
+                        found.append(other)
+        return found
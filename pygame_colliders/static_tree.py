@@ -0,0 +1,200 @@
+from math import ceil, sqrt
+from typing import Iterator, List, Sequence, Union
+
+from .base import Collider
+from .layers import LayerStats
+from .rect import Rect
+
+
+class _StaticNode:
+    def __init__(self, children: list, is_leaf: bool):
+        self.children = children
+        self.is_leaf = is_leaf
+        if is_leaf:
+            rects = [collider._rect for collider in children]
+            self.left = min(r.left for r in rects)
+            self.top = min(r.top for r in rects)
+            self.right = max(r.right for r in rects)
+            self.bottom = max(r.bottom for r in rects)
+        else:
+            self.left = min(n.left for n in children)
+            self.top = min(n.top for n in children)
+            self.right = max(n.right for n in children)
+            self.bottom = max(n.bottom for n in children)
+
+    @property
+    def centerx(self) -> float:
+        return (self.left + self.right) / 2.0
+
+    @property
+    def centery(self) -> float:
+        return (self.top + self.bottom) / 2.0
+
+
+def _rect_centerx(collider: Collider) -> float:
+    return collider._rect.centerx
+
+
+def _rect_centery(collider: Collider) -> float:
+    return collider._rect.centery
+
+
+def _node_centerx(node: _StaticNode) -> float:
+    return node.centerx
+
+
+def _node_centery(node: _StaticNode) -> float:
+    return node.centery
+
+
+def _pack(items: list, capacity: int, key_x, key_y) -> List[list]:
+    """
+    Sort-Tile-Recursive packing of items to groups of at most ``capacity``
+    items. Items are sorted to vertical slices by x and each slice by y.
+    """
+    node_count = ceil(len(items) / capacity)
+    slice_count = ceil(sqrt(node_count))
+    slice_size = slice_count * capacity
+
+    groups = []
+    items = sorted(items, key=key_x)
+    for s in range(0, len(items), slice_size):
+        slice_ = sorted(items[s:s + slice_size], key=key_y)
+        for g in range(0, len(slice_), capacity):
+            groups.append(slice_[g:g + capacity])
+    return groups
+
+
+class StaticTree:
+    """
+    Bulk loaded R-tree for colliders that never move, like level geometry.
+    The tree is packed once with Sort-Tile-Recursive algorithm which gives
+    a balanced tree answering area queries in logarithmic time.
+
+    Colliders in the tree are not tracked when they move. Build a new tree if
+    the static geometry changes.
+
+    Example of usage:
+
+    .. code-block:: python
+
+        level = StaticTree(level_colliders)
+
+        for collider in level.query_rect(player._rect):
+            if player.collide(collider):
+                print("Collision detected")
+
+    :param colliders: Colliders to store in the tree.
+    :param node_capacity: Maximum number of children in a single node.
+    :type colliders: list(Collider)
+    :type node_capacity: int
+    """
+
+    def __init__(self, colliders: Sequence[Collider] = (), node_capacity: int = 8):
+        if node_capacity < 2:
+            raise ValueError("Node capacity must be at least 2")
+        self._node_capacity = node_capacity
+        self._colliders: List[Collider] = list(colliders)
+        self._root: Union[_StaticNode, None] = None
+        self._layer_stats = LayerStats()
+        self._build()
+
+    def _build(self):
+        if not self._colliders:
+            self._root = None
+            return
+
+        capacity = self._node_capacity
+        nodes = [
+            _StaticNode(group, True)
+            for group in _pack(self._colliders, capacity, _rect_centerx, _rect_centery)
+        ]
+        while len(nodes) > 1:
+            nodes = [
+                _StaticNode(group, False)
+                for group in _pack(nodes, capacity, _node_centerx, _node_centery)
+            ]
+        self._root = nodes[0]
+
+    @property
+    def layer_stats(self) -> LayerStats:
+        """
+        Statistics of the pairs culled by collision layers.
+
+        :getter: the statistics
+        :type: LayerStats
+        """
+        return self._layer_stats
+
+    @property
+    def height(self) -> int:
+        """
+        Number of levels in the tree.
+
+        :getter: the height
+        :type: int
+        """
+        height = 0
+        node = self._root
+        while node is not None:
+            height += 1
+            node = None if node.is_leaf else node.children[0]
+        return height
+
+    def __len__(self) -> int:
+        return len(self._colliders)
+
+    def __contains__(self, collider: Collider) -> bool:
+        return collider in self._colliders
+
+    def __iter__(self) -> Iterator[Collider]:
+        return iter(self._colliders)
+
+    def query_rect(
+        self, rect: Rect, collider: Union[Collider, None] = None
+    ) -> List[Collider]:
+        """
+        Find colliders whose bounding boxes overlap the given rect.
+
+        When ``collider`` is given, colliders whose collision layers don't
+        match with it are skipped and counted to :attr:`layer_stats`.
+
+        :param rect: Area to search.
+        :param collider: Collider to match the collision layers against.
+        :type rect: Rect
+        :type collider: Collider or None
+        :return: Colliders overlapping the area
+        :rtype: list(Collider)
+        """
+        found = []
+        if self._root is None:
+            return found
+
+        layer_stats = self._layer_stats
+        left = rect.left
+        top = rect.top
+        right = rect.right
+        bottom = rect.bottom
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if (
+                node.left >= right
+                or node.right <= left
+                or node.top >= bottom
+                or node.bottom <= top
+            ):
+                continue
+            if node.is_leaf:
+                for other in node.children:
+                    if collider is not None and not (
+                        collider._category & other._mask
+                        and other._category & collider._mask
+                    ):
+                        layer_stats.record(collider, other)
+                        continue
+                    if rect.collide_rect(other._rect):
+                        found.append(other)
+            else:
+                stack.extend(node.children)
+        return found
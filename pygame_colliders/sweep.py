@@ -0,0 +1,194 @@
+from math import sqrt
+from typing import Union
+
+from .vector import Vector2
+
+# Movement this close to the surface direction counts as sliding along it
+_SLIDE_EPSILON = 1e-9
+
+
+class SweepHit:
+    """
+    Result of a swept collision test.
+
+    :param time: Fraction of the movement in range [0, 1] where the colliders
+        first touch.
+    :param normal: Unit vector of the contact normal pointing from the hit
+        collider towards the moving collider.
+    :param collider: Collider that was hit.
+    :type time: float
+    :type normal: Vector2
+    :type collider: Collider
+    """
+
+    def __init__(self, time: float, normal: Vector2, collider):
+        self._time = time
+        self._normal = normal
+        self._collider = collider
+
+    @property
+    def time(self) -> float:
+        """
+        Fraction of the movement where the colliders first touch. Zero when
+        the colliders were already touching before the movement and the
+        movement goes deeper.
+
+        :getter: the time of impact
+        :type: float
+        """
+        return self._time
+
+    @property
+    def normal(self) -> Vector2:
+        """
+        Unit vector of the contact normal pointing from the hit collider
+        towards the moving collider.
+
+        :getter: the normal
+        :type: Vector2
+        """
+        return self._normal
+
+    @property
+    def collider(self):
+        """
+        Collider that was hit.
+
+        :getter: the collider
+        :type: Collider
+        """
+        return self._collider
+
+    def __repr__(self):
+        return f"SweepHit<{self._time}, {self._normal!r}>"
+
+
+def _swept_rects_overlap(a, b, dx: float, dy: float, ox: float, oy: float) -> bool:
+    ra = a._rect
+    rb = b._rect
+    left = ra.left + ox
+    right = ra.right + ox
+    top = ra.top + oy
+    bottom = ra.bottom + oy
+    return (
+        min(left, left + dx) <= rb.right
+        and max(right, right + dx) >= rb.left
+        and min(top, top + dy) <= rb.bottom
+        and max(bottom, bottom + dy) >= rb.top
+    )
+
+
+def _axis_projections(a, own, projected, axis_range, ax, ay, ox, oy):
+    # Projections of ``a`` and ``b`` to an axis of ``own`` at the start of
+    # the movement. Projections of the shape are local to its position.
+    r_min, r_max = axis_range
+    position = ax * own._ox + ay * own._oy
+    r_min += position
+    r_max += position
+    p_min, p_max = projected._project(ax, ay)
+    shift = ax * ox + ay * oy
+    if own is a:
+        return r_min + shift, r_max + shift, p_min, p_max
+    return p_min + shift, p_max + shift, r_min, r_max
+
+
+def _start_depth(ax, ay, a_min, a_max, b_min, b_max):
+    # Normal from b to a along the axis and the overlap at the start
+    forward = b_max - a_min
+    backward = a_max - b_min
+    length = sqrt(ax * ax + ay * ay)
+    if forward <= backward:
+        return forward / length, (ax / length, ay / length)
+    return backward / length, (-ax / length, -ay / length)
+
+
+def _axis_interval(speed, a_min, a_max, b_min, b_max):
+    # Times when the projections overlap during the movement or None when
+    # they are separated all the time
+    if speed == 0:
+        if a_max < b_min or a_min > b_max:
+            return None
+        return float("-inf"), float("inf")
+    t0 = (b_min - a_max) / speed
+    t1 = (b_max - a_min) / speed
+    if t0 > t1:
+        return t1, t0
+    return t0, t1
+
+
+def _sweep_hit(b, enter, enter_axis, shallow_axis, dx, dy):
+    if enter <= 0 or enter_axis is None:
+        # Touching already at the start. Report the hit only when moving
+        # deeper so that colliders can slide along and leave the contact.
+        nx, ny = shallow_axis
+        if nx * dx + ny * dy >= -_SLIDE_EPSILON * (abs(dx) + abs(dy)):
+            return None
+        return SweepHit(0.0, Vector2(nx, ny), b)
+
+    ax, ay, speed = enter_axis
+    length = sqrt(ax * ax + ay * ay)
+    if speed > 0:
+        return SweepHit(enter, Vector2(-ax / length, -ay / length), b)
+    return SweepHit(enter, Vector2(ax / length, ay / length), b)
+
+
+def sweep_convex(
+    a, b, dx: float, dy: float, ox: float = 0.0, oy: float = 0.0
+) -> Union[SweepHit, None]:
+    """
+    Find when convex collider ``a`` moving by (dx, dy) first touches the
+    convex collider ``b``. Every separating axis gives an interval of time
+    when the projections overlap and the colliders touch when all the
+    intervals do overlap.
+
+    :param a: Moving collider.
+    :param b: Static collider.
+    :param dx: Movement along x axis.
+    :param dy: Movement along y axis.
+    :param ox: Offset of ``a`` along x axis at the start of the movement.
+    :param oy: Offset of ``a`` along y axis at the start of the movement.
+    :type a: ConvexCollider
+    :type b: ConvexCollider
+    :type dx: float
+    :type dy: float
+    :type ox: float
+    :type oy: float
+    :return: Hit or None if colliders don't touch during the movement
+    :rtype: SweepHit or None
+    """
+    if not _swept_rects_overlap(a, b, dx, dy, ox, oy):
+        return None
+
+    enter = float("-inf")
+    leave = float("inf")
+    enter_axis = None
+    # Shallowest axis in case colliders are touching at the start
+    shallow_depth = float("inf")
+    shallow_axis = (0.0, 0.0)
+
+    for own, projected in ((a, b), (b, a)):
+        ranges = own._shape._axis_ranges
+        for i, (ax, ay) in enumerate(own._shape._axes):
+            bounds = _axis_projections(a, own, projected, ranges[i], ax, ay, ox, oy)
+            depth, normal = _start_depth(ax, ay, *bounds)
+            if depth < shallow_depth:
+                shallow_depth = depth
+                shallow_axis = normal
+
+            speed = ax * dx + ay * dy
+            interval = _axis_interval(speed, *bounds)
+            if interval is None:
+                return None  # Separated along the axis all the time
+            t0, t1 = interval
+            if t0 > enter:
+                enter = t0
+                enter_axis = (ax, ay, speed)
+            if t1 < leave:
+                leave = t1
+            if enter > leave:
+                return None
+
+    if enter > 1 or leave < 0:
+        return None
+
+    return _sweep_hit(b, enter, enter_axis, shallow_axis, dx, dy)
@@ -0,0 +1,267 @@
+from typing import Dict, Iterator, List, Set, Tuple, Union
+
+from .base import Collider
+from .layers import LayerStats
+from .rect import Rect
+
+PairKey = Tuple[int, int]
+
+# Maximum endpoints are sorted before minimum endpoints of equal value so
+# that touching bounding boxes don't overlap, same as ``Rect.collide_rect``.
+_MAX = 0
+_MIN = 1
+
+
+class _Endpoint:
+    def __init__(self, collider: Collider, kind: int, value: float):
+        self.collider = collider
+        self.kind = kind
+        self.value = value
+        self.index = 0
+
+
+class SweepAndPrune:
+    """
+    Sort and sweep broad phase. Keeps bounding box endpoints of the colliders
+    sorted on both axes and updates the sorted lists with insertion sort when
+    colliders move. Overlapping pairs are updated when endpoints swap places
+    so frames with little motion cost close to linear time.
+
+    Best suited for scenes where most of the colliders move only a little
+    between the frames, like side-scrollers.
+
+    Example of usage:
+
+    .. code-block:: python
+
+        sap = SweepAndPrune()
+        sap.insert(collider_a)
+        sap.insert(collider_b)
+
+        collider_a.x += 2
+
+        began, ended = sap.pop_changes()
+        for a, b in sap.pairs():
+            if a.collide(b):
+                print("Collision detected")
+
+    """
+
+    def __init__(self):
+        self._x_axis: List[_Endpoint] = []
+        self._y_axis: List[_Endpoint] = []
+        self._endpoints: Dict[Collider, Tuple[_Endpoint, ...]] = {}
+        self._ids: Dict[Collider, int] = {}
+        self._next_id = 0
+        self._pairs: Dict[PairKey, Tuple[Collider, Collider]] = {}
+        self._began: Set[PairKey] = set()
+        self._ended: Dict[PairKey, Tuple[Collider, Collider]] = {}
+        self._layer_stats = LayerStats()
+
+    @property
+    def layer_stats(self) -> LayerStats:
+        """
+        Statistics of the pairs culled by collision layers.
+
+        :getter: the statistics
+        :type: LayerStats
+        """
+        return self._layer_stats
+
+    def __len__(self) -> int:
+        return len(self._endpoints)
+
+    def __contains__(self, collider: Collider) -> bool:
+        return collider in self._endpoints
+
+    def __iter__(self) -> Iterator[Collider]:
+        return iter(self._endpoints)
+
+    def insert(self, collider: Collider):
+        """
+        Add collider to the sweep and prune lists.
+
+        :param collider: Collider to add.
+        :type collider: Collider
+        """
+        if collider in self._endpoints:
+            return
+        self._ids[collider] = self._next_id
+        self._next_id += 1
+
+        rect = collider._rect
+        endpoints = (
+            _Endpoint(collider, _MIN, rect.left),
+            _Endpoint(collider, _MAX, rect.right),
+            _Endpoint(collider, _MIN, rect.top),
+            _Endpoint(collider, _MAX, rect.bottom),
+        )
+        self._endpoints[collider] = endpoints
+
+        axes = (self._x_axis, self._x_axis, self._y_axis, self._y_axis)
+        for endpoint, axis in zip(endpoints, axes):
+            endpoint.index = len(axis)
+            axis.append(endpoint)
+            self._sort_endpoint(axis, endpoint)
+        collider._broadphases.append(self)
+
+    def remove(self, collider: Collider):
+        """
+        Remove collider from the sweep and prune lists.
+
+        :param collider: Collider to remove.
+        :type collider: Collider
+        """
+        endpoints = self._endpoints.pop(collider)
+        for axis, own in ((self._x_axis, endpoints[:2]), (self._y_axis, endpoints[2:])):
+            axis[:] = [e for e in axis if e not in own]
+            for i, endpoint in enumerate(axis):
+                endpoint.index = i
+
+        for key, pair in list(self._pairs.items()):
+            if collider in pair:
+                self._remove_pair(key)
+        del self._ids[collider]
+        collider._broadphases.remove(self)
+
+    def update(self, collider: Collider):
+        """
+        Update the sorted endpoint lists after collider has moved. Called
+        automatically when a collider is moved.
+
+        :param collider: Collider that has moved.
+        :type collider: Collider
+        """
+        rect = collider._rect
+        left, right, top, bottom = self._endpoints[collider]
+        # Endpoints are moved one at a time so that the rest of the list is
+        # sorted while an endpoint is sorted. Otherwise an endpoint could stop
+        # at the already moved endpoint of the same collider.
+        for axis, endpoint, value in (
+            (self._x_axis, left, rect.left),
+            (self._x_axis, right, rect.right),
+            (self._y_axis, top, rect.top),
+            (self._y_axis, bottom, rect.bottom),
+        ):
+            endpoint.value = value
+            self._sort_endpoint(axis, endpoint)
+
+    def _sort_endpoint(self, axis: List[_Endpoint], endpoint: _Endpoint):
+        collider = endpoint.collider
+        value = endpoint.value
+        kind = endpoint.kind
+        i = endpoint.index
+
+        # Move towards the start
+        while i > 0:
+            prev = axis[i - 1]
+            if prev.value < value or (prev.value == value and prev.kind <= kind):
+                break
+            axis[i] = prev
+            prev.index = i
+            if prev.collider is not collider:
+                self._swapped(collider, prev.collider)
+            i -= 1
+
+        # Move towards the end
+        last = len(axis) - 1
+        while i < last:
+            next_ = axis[i + 1]
+            if next_.value > value or (next_.value == value and next_.kind >= kind):
+                break
+            axis[i] = next_
+            next_.index = i
+            if next_.collider is not collider:
+                self._swapped(collider, next_.collider)
+            i += 1
+
+        axis[i] = endpoint
+        endpoint.index = i
+
+    def _swapped(self, a: Collider, b: Collider):
+        if not (a._category & b._mask and b._category & a._mask):
+            self._layer_stats.record(a, b)
+            return
+
+        id_a = self._ids[a]
+        id_b = self._ids[b]
+        if id_a > id_b:
+            a, b = b, a
+            id_a, id_b = id_b, id_a
+        key = (id_a, id_b)
+
+        if a._rect.collide_rect(b._rect):
+            if key not in self._pairs:
+                self._pairs[key] = (a, b)
+                if key in self._ended:
+                    del self._ended[key]
+                else:
+                    self._began.add(key)
+        elif key in self._pairs:
+            self._remove_pair(key)
+
+    def _remove_pair(self, key: PairKey):
+        pair = self._pairs.pop(key)
+        if key in self._began:
+            self._began.remove(key)
+        else:
+            self._ended[key] = pair
+
+    def pairs(self) -> Iterator[Tuple[Collider, Collider]]:
+        """
+        Iterate over pairs of colliders whose bounding boxes overlap. The
+        pairs are maintained incrementally so no search is done. Pairs whose
+        collision layers don't match are never stored.
+
+        :return: Iterator of collider pairs
+        :rtype: iterator(tuple(Collider, Collider))
+        """
+        return iter(list(self._pairs.values()))
+
+    def pop_changes(
+        self,
+    ) -> Tuple[List[Tuple[Collider, Collider]], List[Tuple[Collider, Collider]]]:
+        """
+        Return pairs that started and stopped overlapping since the previous
+        call. Pairs that started and stopped in between are not reported.
+
+        :return: Tuple of began pairs and ended pairs
+        :rtype: tuple(list(tuple(Collider, Collider)), list(tuple(Collider, Collider)))
+        """
+        began = [self._pairs[key] for key in self._began]
+        ended = list(self._ended.values())
+        self._began = set()
+        self._ended = {}
+        return began, ended
+
+    def query_rect(
+        self, rect: Rect, collider: Union[Collider, None] = None
+    ) -> List[Collider]:
+        """
+        Find colliders whose bounding boxes overlap the given rect.
+
+        When ``collider`` is given, colliders whose collision layers don't
+        match with it are skipped.
+
+        :param rect: Area to search.
+        :param collider: Collider to match the collision layers against.
+        :type rect: Rect
+        :type collider: Collider or None
+        :return: Colliders overlapping the area
+        :rtype: list(Collider)
+        """
+        found = []
+        right = rect.right
+        for endpoint in self._x_axis:
+            if endpoint.value >= right:
+                break
+            if endpoint.kind != _MIN:
+                continue
+            other = endpoint.collider
+            if collider is not None and not (
+                collider._category & other._mask and other._category & collider._mask
+            ):
+                continue
+            if rect.collide_rect(other._rect):
+                found.append(other)
+        return found
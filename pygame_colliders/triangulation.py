@@ -0,0 +1,367 @@
+from collections import OrderedDict
+from math import floor, sqrt
+from typing import Any, Dict, Hashable, List, Sequence, Set, Tuple
+
+Point = Sequence[float]
+Triangle = Tuple[Point, Point, Point]
+
+
+class _ReflexGrid:
+    """
+    Uniform grid of the reflex vertices. Only reflex vertices can be inside
+    an ear so the ear test looks up the cells under the ear.
+    """
+
+    def __init__(self, points: Sequence[Point], reflex: Set[int]):
+        self._cells: Dict[Tuple[int, int], Set[int]] = {}
+        xs = [p[0] for p in points]
+        ys = [p[1] for p in points]
+        self._left = min(xs)
+        self._top = min(ys)
+        area = (max(xs) - self._left) * (max(ys) - self._top)
+        # Roughly one reflex vertex per cell
+        self._size = sqrt(area / max(len(reflex), 1)) or 1.0
+        self._points = points
+        for i in reflex:
+            self._cells.setdefault(self._cell(*points[i]), set()).add(i)
+
+    def _cell(self, x: float, y: float) -> Tuple[int, int]:
+        size = self._size
+        return floor((x - self._left) / size), floor((y - self._top) / size)
+
+    def remove(self, i: int):
+        self._cells[self._cell(*self._points[i])].discard(i)
+
+    def query(self, left: float, top: float, right: float, bottom: float):
+        cells = self._cells
+        x0, y0 = self._cell(left, top)
+        x1, y1 = self._cell(right, bottom)
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                cell = cells.get((cx, cy))
+                if cell:
+                    yield from cell
+
+
+def _signed_area(points: Sequence[Point]) -> float:
+    # Twice the area, positive when the vertices turn from x axis towards y
+    area = 0.0
+    for i in range(len(points)):
+        ax, ay = points[i - 1][0], points[i - 1][1]
+        bx, by = points[i][0], points[i][1]
+        area += ax * by - bx * ay
+    return area
+
+
+def _vertex_turn(
+    points: Sequence[Point], prev: List[int], next_: List[int], sign: int, i: int
+) -> float:
+    # Positive for convex vertices, negative for reflex vertices and zero for
+    # collinear vertices
+    p = points[prev[i]]
+    v = points[i]
+    n = points[next_[i]]
+    return sign * ((v[0] - p[0]) * (n[1] - v[1]) - (v[1] - p[1]) * (n[0] - v[0]))
+
+
+def _is_ear(
+    points: Sequence[Point],
+    prev: List[int],
+    next_: List[int],
+    sign: int,
+    grid: _ReflexGrid,
+    i: int,
+) -> bool:
+    a = points[prev[i]]
+    b = points[i]
+    c = points[next_[i]]
+    left = min(a[0], b[0], c[0])
+    top = min(a[1], b[1], c[1])
+    right = max(a[0], b[0], c[0])
+    bottom = max(a[1], b[1], c[1])
+    for r in grid.query(left, top, right, bottom):
+        p = points[r]
+        if p == a or p == b or p == c:
+            continue
+        # Inside or on the edges of the ear
+        if (
+            sign * ((b[0] - a[0]) * (p[1] - a[1]) - (b[1] - a[1]) * (p[0] - a[0]))
+            >= 0
+            and sign * ((c[0] - b[0]) * (p[1] - b[1]) - (c[1] - b[1]) * (p[0] - b[0]))
+            >= 0
+            and sign * ((a[0] - c[0]) * (p[1] - c[1]) - (a[1] - c[1]) * (p[0] - c[0]))
+            >= 0
+        ):
+            return False
+    return True
+
+
+def _unlink(
+    points: Sequence[Point],
+    prev: List[int],
+    next_: List[int],
+    sign: int,
+    reflex: Set[int],
+    grid: _ReflexGrid,
+    i: int,
+):
+    p = prev[i]
+    n = next_[i]
+    next_[p] = n
+    prev[n] = p
+    # Neighbours may turn from reflex to convex but never the other way
+    for j in (p, n):
+        if j in reflex and _vertex_turn(points, prev, next_, sign, j) > 0:
+            reflex.discard(j)
+            grid.remove(j)
+
+
+def triangulate(points: Sequence[Point]) -> List[Triangle]:
+    """
+    Triangulate simple polygon with ear clipping. Vertices are kept in a
+    linked list so clipping an ear costs constant time and only reflex
+    vertices, looked up from a grid, are tested against the ears.
+
+    :param points: Vertices of the polygon in either order.
+    :type points: list(tuple(float, float))
+    :return: Triangles covering the polygon
+    :rtype: list(tuple(point, point, point))
+    """
+    count = len(points)
+    if count < 3:
+        return []
+
+    # Orientation of the polygon from the signed area
+    area = _signed_area(points)
+    if area == 0:
+        return []
+    sign = 1 if area > 0 else -1
+
+    prev = [(i - 1) % count for i in range(count)]
+    next_ = [(i + 1) % count for i in range(count)]
+    # Collinear vertices can block ears like reflex vertices
+    reflex = {
+        i for i in range(count) if _vertex_turn(points, prev, next_, sign, i) <= 0
+    }
+    grid = _ReflexGrid(points, reflex)
+
+    triangles = []
+    remaining = count
+    i = 0
+    stop = i  # Vertex where a full round without clipping ends
+    while remaining > 2:
+        t = _vertex_turn(points, prev, next_, sign, i)
+        if t == 0:
+            # Collinear vertex or a zero width spike adds no area
+            if i in reflex:
+                reflex.discard(i)
+                grid.remove(i)
+            _unlink(points, prev, next_, sign, reflex, grid, i)
+            remaining -= 1
+            i = stop = next_[i]
+            continue
+
+        if t > 0 and _is_ear(points, prev, next_, sign, grid, i):
+            triangles.append((points[prev[i]], points[i], points[next_[i]]))
+            _unlink(points, prev, next_, sign, reflex, grid, i)
+            remaining -= 1
+            i = stop = next_[i]
+            continue
+
+        i = next_[i]
+        if i == stop:
+            break  # No ears left, polygon isn't simple
+    return triangles
+
+
+def _turn(a: Point, b: Point, c: Point) -> float:
+    return (b[0] - a[0]) * (c[1] - b[1]) - (b[1] - a[1]) * (c[0] - b[0])
+
+
+def _stays_convex(
+    points: Sequence[Point], merged: List[int], end: int, sign: int
+) -> bool:
+    # Diagonal can be removed when the merged part is convex. Only the ends
+    # of the removed diagonal, first vertex and ``end``, can turn reflex.
+    count = len(merged)
+    for j in (0, end):
+        p = points[merged[j - 1]]
+        q = points[merged[j]]
+        r = points[merged[(j + 1) % count]]
+        if sign * _turn(p, q, r) < 0:
+            return False
+    return True
+
+
+def merge_triangles(points: Sequence[Point], triangles: List[Triangle]) -> List[list]:
+    """
+    Merge triangles of a polygon to convex parts with Hertel-Mehlhorn
+    algorithm. Diagonals between the triangles are removed one by one when
+    the part left after the removal stays convex. The result has at most
+    four times the parts of the optimal convex decomposition.
+
+    Triangles must be made of the same point objects as the polygon and
+    wound the same way.
+
+    :param points: Vertices of the polygon.
+    :param triangles: Triangulation of the polygon.
+    :type points: list(tuple(float, float))
+    :type triangles: list(tuple(point, point, point))
+    :return: Convex parts as lists of points
+    :rtype: list(list(point))
+    """
+    if not triangles:
+        return []
+
+    # Work with vertex indices so that shared edges can be matched
+    index = {id(p): i for i, p in enumerate(points)}
+    parts = {k: [index[id(p)] for p in t] for k, t in enumerate(triangles)}
+    # Orientation of the polygon, or of the triangles when the area of a
+    # degenerate polygon cancels out
+    area = _signed_area(points) or sum(_turn(*triangle) for triangle in triangles)
+    sign = 1 if area >= 0 else -1
+
+    # Owner of every directed edge. Diagonals are owned in both directions.
+    owners: Dict[Tuple[int, int], int] = {}
+    for k, part in parts.items():
+        for u, v in zip(part, part[1:] + part[:1]):
+            owners[(u, v)] = k
+
+    for u, v in list(owners):
+        k_a = owners.get((u, v))
+        k_b = owners.get((v, u))
+        if k_a is None or k_b is None or k_a == k_b:
+            continue
+
+        # Walk around the first part from v to u and the second from u to v
+        part_a = parts[k_a]
+        part_b = parts[k_b]
+        start_a = part_a.index(v)
+        start_b = part_b.index(u)
+        merged = part_a[start_a:] + part_a[:start_a]
+        merged += (part_b[start_b:] + part_b[:start_b])[1:-1]
+
+        if not _stays_convex(points, merged, merged.index(u), sign):
+            continue
+
+        parts[k_a] = merged
+        del parts[k_b]
+        del owners[(u, v)]
+        del owners[(v, u)]
+        for edge in zip(merged, merged[1:] + merged[:1]):
+            owners[edge] = k_a
+
+    result = []
+    for part in parts.values():
+        # Drop vertices left in the middle of straight edges
+        count = len(part)
+        kept = [
+            points[part[j]]
+            for j in range(count)
+            if _turn(points[part[j - 1]], points[part[j]], points[part[(j + 1) % count]])
+        ]
+        # Parts of degenerate polygons may have no area at all
+        if len(kept) >= 3:
+            result.append(kept)
+    return result
+
+
+class TriangulationCache:
+    """
+    Least recently used cache of the split shapes of concave colliders.
+    Colliders of the same shape at different positions share the entry so
+    creating them again costs linear time instead of a new triangulation.
+
+    Example of usage:
+
+    .. code-block:: python
+
+        cache = TriangulationCache(maxsize=64)
+        for points in level_props:
+            ConcaveCollider(points, triangulation_cache=cache)
+        print(cache.hits, cache.misses)
+
+    :param maxsize: Maximum number of shapes to remember.
+    :type maxsize: int
+    """
+
+    def __init__(self, maxsize: int = 256):
+        if maxsize < 1:
+            raise ValueError("Cache size must be at least 1")
+        self._maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def maxsize(self) -> int:
+        """
+        Maximum number of shapes to remember.
+
+        :getter: the size
+        :type: int
+        """
+        return self._maxsize
+
+    @property
+    def hits(self) -> int:
+        """
+        Number of lookups that found the shape.
+
+        :getter: the number of hits
+        :type: int
+        """
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """
+        Number of lookups that didn't find the shape.
+
+        :getter: the number of misses
+        :type: int
+        """
+        return self._misses
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Any:
+        """
+        Find the split shape and mark the shape as recently used.
+
+        :param key: Key of the shape.
+        :type key: hashable
+        :return: Shape or None if not found
+        :rtype: ConcaveShape or None
+        """
+        shape = self._entries.get(key)
+        if shape is None:
+            self._misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return shape
+
+    def put(self, key: Hashable, shape: Any):
+        """
+        Remember the split shape. The least recently used shape is forgotten
+        when the cache is full.
+
+        :param key: Key of the shape.
+        :param shape: Shape split to convex parts.
+        :type key: hashable
+        :type shape: ConcaveShape
+        """
+        self._entries[key] = shape
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """
+        Forget all shapes and reset the hit and miss counters.
+        """
+        self._entries.clear()
+        self._hits = 0
+        self._misses = 0
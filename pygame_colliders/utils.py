@@ -2,6 +2,7 @@ from typing import List, Tuple, Any
 import math
 
 from pygame_colliders import ConcaveCollider, ConvexCollider
+from pygame_colliders.base import ALL_LAYERS, DEFAULT_CATEGORY
 
 
 def _cross_product_length(a, b, c):
@@ -74,7 +75,12 @@ def _is_concave(points):
     return False
 
 
-def create_collider(points: List[Tuple[float]], data: Any = None):
+def create_collider(
+    points: List[Tuple[float]],
+    data: Any = None,
+    category: int = DEFAULT_CATEGORY,
+    mask: int = ALL_LAYERS,
+):
     """
     Create correct collider type from given set of points.
 
@@ -85,13 +91,15 @@ def create_collider(points: List[Tuple[float]], data: Any = None):
 
     :param points: A list of coordinate pairs that forms given collider.
     :param data: Any data associated with the collider
+    :param category: Collision layer bits the collider belongs to
+    :param mask: Collision layer bits the collider collides with
     :return: Correct collider type
     :rtype: ConvexCollider or ConcaveCollider
     """
     # Try out first concave
     if _is_concave(points):
-        return ConcaveCollider(points, data)
+        return ConcaveCollider(points, data, category, mask)
     elif _is_convex(points):
-        return ConvexCollider(points, data)
+        return ConvexCollider(points, data, category, mask)
     else:
         raise TypeError("Invalid collider data.")
@@ -20,6 +20,8 @@ class Vector2:
     :type y: float, int
     """
 
+    __slots__ = ("_x", "_y")
+
     def __init__(self, x: Union[float, int], y: Union[float, int]):
         self._x = x
         self._y = y
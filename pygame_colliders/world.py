@@ -0,0 +1,245 @@
+from itertools import chain
+from typing import Any, Iterator, List, Sequence, Tuple, Union
+
+from .base import Collider
+from .contacts import ContactCache, ContactCallback
+from .layers import LayerStats
+from .rect import Rect
+from .spatial_hash import SpatialHash
+from .static_tree import StaticTree
+
+
+class CollisionWorld:
+    """
+    Container for colliders that finds colliding pairs without testing every
+    collider against every other one.
+
+    Colliders are registered to a broad phase (by default a uniform
+    :class:`SpatialHash` grid) which keeps track of them when they move. Only
+    pairs whose bounding boxes overlap are passed to the ``collide()`` of the
+    colliders.
+
+    Example of usage:
+
+    .. code-block:: python
+
+        world = CollisionWorld(cell_size=64)
+        world.add(collider_a)
+        world.add(collider_b)
+
+        collider_a.center = (100, 100)
+
+        for a, b in world.collisions():
+            print("Collision detected")
+
+    Any other broad phase, like :class:`AABBTree`, can be used instead of the
+    grid:
+
+    .. code-block:: python
+
+        world = CollisionWorld(broadphase=AABBTree(margin=4))
+
+    Pairs are filtered by the collision layers of the colliders (``category``
+    and ``mask``) before any bounding box or narrow phase test is done.
+
+    Level geometry that never moves should be added with :meth:`add_static`.
+    Static colliders are kept in a separate :class:`StaticTree` and pairs
+    between two static colliders are never generated.
+
+    Game logic interested only in when collisions start and end should call
+    :meth:`step` once per frame. It reports the changes through the callbacks
+    and reuses the results of the pairs that haven't moved:
+
+    .. code-block:: python
+
+        world = CollisionWorld(on_enter=start_hit, on_exit=end_hit)
+        ...
+        world.step()
+
+    :param cell_size: Width and height of a single grid cell.
+    :param broadphase: Broad phase to use instead of the default grid.
+    :param on_enter: Called by :meth:`step` with a pair that started touching.
+    :param on_exit: Called by :meth:`step` with a pair that stopped touching.
+    :param on_stay: Called by :meth:`step` with a pair that kept touching.
+    :type cell_size: float, int
+    :type broadphase: SpatialHash, AABBTree, SweepAndPrune or None
+    :type on_enter: callable(Collider, Collider) or None
+    :type on_exit: callable(Collider, Collider) or None
+    :type on_stay: callable(Collider, Collider) or None
+    """
+
+    def __init__(
+        self,
+        cell_size: float = 64.0,
+        broadphase: Any = None,
+        on_enter: ContactCallback = None,
+        on_exit: ContactCallback = None,
+        on_stay: ContactCallback = None,
+    ):
+        if broadphase is None:
+            broadphase = SpatialHash(cell_size)
+        self._broadphase = broadphase
+        self._static = StaticTree()
+        self._contacts = ContactCache(on_enter, on_exit, on_stay)
+
+    def __len__(self) -> int:
+        return len(self._broadphase) + len(self._static)
+
+    def __contains__(self, collider: Collider) -> bool:
+        return collider in self._broadphase or collider in self._static
+
+    def __iter__(self) -> Iterator[Collider]:
+        return chain(self._broadphase, self._static)
+
+    def add(self, collider: Collider):
+        """
+        Add collider to the world.
+
+        :param collider: Collider to add.
+        :type collider: Collider
+        """
+        self._broadphase.insert(collider)
+
+    def remove(self, collider: Collider):
+        """
+        Remove collider from the world. Removing a static collider bulk
+        loads the static tree again without it.
+
+        :param collider: Collider to remove.
+        :type collider: Collider
+        """
+        if collider not in self._broadphase and collider in self._static:
+            self._set_static([c for c in self._static if c is not collider])
+        else:
+            self._broadphase.remove(collider)
+        self._contacts.remove(collider)
+
+    def add_static(self, colliders: Sequence[Collider]):
+        """
+        Add colliders that never move to the world. The static tree is bulk
+        loaded again with all the static colliders so add the static geometry
+        in as few calls as possible.
+
+        :param colliders: Colliders to add.
+        :type colliders: list(Collider)
+        """
+        self._set_static(list(self._static) + list(colliders))
+
+    def clear_static(self):
+        """
+        Remove all static colliders from the world.
+        """
+        for collider in self._static:
+            self._contacts.remove(collider)
+        self._set_static([])
+
+    def _set_static(self, colliders: List[Collider]):
+        # Statistics of the culled pairs are kept over the rebuilds
+        static = StaticTree(colliders)
+        static.layer_stats.merge(self._static.layer_stats)
+        self._static = static
+
+    @property
+    def layer_stats(self) -> LayerStats:
+        """
+        Statistics of the pairs culled by collision layers in the world.
+
+        :getter: copy of the combined statistics
+        :type: LayerStats
+        """
+        stats = LayerStats()
+        stats.merge(self._broadphase.layer_stats)
+        stats.merge(self._static.layer_stats)
+        return stats
+
+    def reset_layer_stats(self):
+        """
+        Clear statistics of the culled pairs.
+        """
+        self._broadphase.layer_stats.reset()
+        self._static.layer_stats.reset()
+
+    def candidate_pairs(self) -> Iterator[Tuple[Collider, Collider]]:
+        """
+        Iterate over pairs of colliders whose bounding boxes overlap. Pairs
+        may or may not collide. In pairs between a moving and a static
+        collider the static collider is always the second one.
+
+        :return: Iterator of collider pairs
+        :rtype: iterator(tuple(Collider, Collider))
+        """
+        yield from self._broadphase.pairs()
+        if not len(self._static):
+            return
+        for collider in self._broadphase:
+            for static in self._static.query_rect(collider._rect, collider):
+                yield collider, static
+
+    def collisions(self) -> List[Tuple[Collider, Collider]]:
+        """
+        Find all pairs of colliders that do collide.
+
+        :return: Colliding pairs
+        :rtype: list(tuple(Collider, Collider))
+        """
+        return [(a, b) for a, b in self.candidate_pairs() if a.collide(b)]
+
+    def step(
+        self,
+    ) -> Tuple[List[Tuple[Collider, Collider]], List[Tuple[Collider, Collider]]]:
+        """
+        Find collisions and report the pairs that started or stopped touching
+        since the previous step through the callbacks. Pairs where neither
+        collider has moved reuse the result of the previous step.
+
+        :return: Tuple of pairs that started and stopped touching
+        :rtype: tuple(list(tuple(Collider, Collider)), list(tuple(Collider, Collider)))
+        """
+        return self._contacts.update(self.candidate_pairs())
+
+    @property
+    def contacts(self) -> List[Tuple[Collider, Collider]]:
+        """
+        Pairs that were touching on the latest :meth:`step`.
+
+        :getter: the touching pairs
+        :type: list(tuple(Collider, Collider))
+        """
+        return self._contacts.contacts
+
+    def query_rect(
+        self, rect: Rect, collider: Union[Collider, None] = None
+    ) -> List[Collider]:
+        """
+        Find colliders whose bounding boxes overlap the given rect.
+
+        When ``collider`` is given, colliders whose collision layers don't
+        match with it are skipped.
+
+        :param rect: Area to search.
+        :param collider: Collider to match the collision layers against.
+        :type rect: Rect
+        :type collider: Collider or None
+        :return: Colliders overlapping the area
+        :rtype: list(Collider)
+        """
+        return self._broadphase.query_rect(rect, collider) + self._static.query_rect(
+            rect, collider
+        )
+
+    def query_collider(self, collider: Collider) -> List[Collider]:
+        """
+        Find colliders in the world colliding with the given collider. The
+        collider itself and colliders on non-matching collision layers are
+        never reported.
+
+        :param collider: Collider to test. Doesn't need to be in the world.
+        :type collider: Collider
+        :return: Colliding colliders
+        :rtype: list(Collider)
+        """
+        return [
+            other
+            for other in self.query_rect(collider._rect, collider)
+            if other is not collider and collider.collide(other)
+        ]
@@ -0,0 +1,97 @@
+import random
+
+from pygame_colliders import AABBTree, CollisionWorld, ConvexCollider, Rect
+
+
+def _square(x, y, size=2):
+    return ConvexCollider([(x, y), (x + size, y), (x + size, y + size), (x, y + size)])
+
+
+def _brute_force_pairs(colliders):
+    pairs = set()
+    for i, a in enumerate(colliders):
+        for b in colliders[i + 1:]:
+            if a._rect.collide_rect(b._rect):
+                pairs.add(frozenset((a, b)))
+    return pairs
+
+
+def test_tree_pairs_match_brute_force():
+    rnd = random.Random(42)
+    colliders = [_square(rnd.uniform(0, 100), rnd.uniform(0, 100), rnd.uniform(1, 10)) for _ in range(80)]
+    tree = AABBTree(margin=1)
+    for collider in colliders:
+        tree.insert(collider)
+
+    pairs = {frozenset(pair) for pair in tree.pairs()}
+
+    assert pairs == _brute_force_pairs(colliders)
+    assert len(pairs) == len(list(tree.pairs()))
+
+
+def test_tree_tracks_moves():
+    rnd = random.Random(7)
+    colliders = [_square(rnd.uniform(0, 50), rnd.uniform(0, 50)) for _ in range(40)]
+    tree = AABBTree(margin=0.5)
+    for collider in colliders:
+        tree.insert(collider)
+
+    for _ in range(5):
+        for collider in colliders:
+            collider.topleft = (rnd.uniform(0, 50), rnd.uniform(0, 50))
+
+    pairs = {frozenset(pair) for pair in tree.pairs()}
+
+    assert pairs == _brute_force_pairs(colliders)
+
+
+def test_tree_small_move_keeps_leaf():
+    tree = AABBTree(margin=4)
+    collider = _square(0, 0)
+    tree.insert(collider)
+    leaf = tree._leaves[collider]
+    bounds = (leaf.left, leaf.top, leaf.right, leaf.bottom)
+
+    collider.topleft = (1, 1)
+
+    assert (leaf.left, leaf.top, leaf.right, leaf.bottom) == bounds
+
+
+def test_tree_is_balanced():
+    tree = AABBTree(margin=0)
+    for i in range(256):
+        tree.insert(_square(i * 3, 0))
+
+    assert tree.height <= 16
+
+
+def test_tree_remove():
+    tree = AABBTree()
+    colliders = [_square(i, i) for i in range(10)]
+    for collider in colliders:
+        tree.insert(collider)
+    for collider in colliders[::2]:
+        tree.remove(collider)
+
+    assert len(tree) == 5
+    assert set(tree.query_rect(Rect(-1, -1, 20, 20))) == set(colliders[1::2])
+
+
+def test_tree_query_rect():
+    tree = AABBTree()
+    a = _square(0, 0)
+    b = _square(10, 10)
+    tree.insert(a)
+    tree.insert(b)
+
+    assert tree.query_rect(Rect(9, 9, 2, 2)) == [b]
+
+
+def test_world_with_tree():
+    world = CollisionWorld(broadphase=AABBTree())
+    a = _square(0, 0)
+    b = _square(1, 1)
+    world.add(a)
+    world.add(b)
+
+    assert len(world.collisions()) == 1
@@ -36,3 +36,42 @@ def test_move_convex():
     collider.center = (13, 23)
 
     assert collider.center == (13, 23)
+
+
+def test_move_increases_version():
+    poly_points = [(3, 3), (5, 3), (5, 4), (4, 4), (4, 5), (5, 5), (5, 6), (3, 6)]
+
+    collider = ConcaveCollider(poly_points)
+    version = collider.version
+
+    collider.x += 1
+    assert collider.version > version
+
+    version = collider.version
+    collider.topleft = collider.topleft
+    assert collider.version == version
+
+
+def test_move_convex_keeps_shape():
+    collider = ConvexCollider([(4.5, 3.5), (6, 2), (6, 4)])
+    shape = collider.shape
+
+    collider.topleft = (100, 200)
+
+    assert collider.shape is shape
+    assert collider.points == [[100, 201.5], [101.5, 200], [101.5, 202]]
+
+
+def test_move_concave_creates_parts_when_used():
+    poly_points = [(3, 3), (5, 3), (5, 4), (4, 4), (4, 5), (5, 5), (5, 6), (3, 6)]
+
+    collider = ConcaveCollider(poly_points)
+    collider.topleft = (103, 203)
+    collider.topleft = (13, 23)
+
+    # Parts aren't kept by the collider
+    assert collider._part(0) is not collider._part(0)
+    assert collider.point_collide((13.5, 23.5)) is True
+    assert collider.point_collide((3.5, 3.5)) is False
+    assert collider.points[0] == [13, 23]
+    assert all(part.left >= 13 and part.top >= 23 for part in collider._colliders)
@@ -1,4 +1,4 @@
-from pygame_colliders import ConcaveCollider, ConvexCollider
+from pygame_colliders import ConcaveCollider, ConvexCollider, Shape
 
 
 def test_no_collision():
@@ -61,6 +61,42 @@ def test_point_not_collide():
     assert poly.point_collide(point) is False
 
 
+def test_concave_point_collide():
+    poly = ConcaveCollider([(3, 3), (5, 3), (5, 4), (4, 4), (4, 5), (5, 5), (5, 6), (3, 6)])
+
+    assert poly.point_collide((3.5, 4.5)) is True
+    assert poly.point_collide((4.5, 3.5)) is True
+    assert poly.point_collide((4.5, 4.5)) is False  # Inside the opening
+    assert poly.point_collide((6, 4.5)) is False
+
+    poly.x += 10
+    assert poly.point_collide((3.5, 4.5)) is False
+    assert poly.point_collide((13.5, 4.5)) is True
+
+
+def _saw(teeth):
+    # Teeth pointing up from a base, 2 vertices per tooth
+    points = [(0, 12)]
+    for i in range(teeth):
+        points += [(i * 2, 10), (i * 2 + 1, 0)]
+    points += [(teeth * 2, 10), (teeth * 2, 12)]
+    return ConcaveCollider(points)
+
+
+def test_concave_point_collide_tests_few_parts(monkeypatch):
+    saw = _saw(250)
+    tested = []
+    original = ConvexCollider.point_collide
+    monkeypatch.setattr(
+        ConvexCollider, "point_collide", lambda c, p: tested.append(p) or original(c, p)
+    )
+
+    assert saw.point_collide((101, 5)) is True
+    assert saw.point_collide((102, 5)) is False
+    assert len(saw._colliders) > 250
+    assert len(tested) < 10
+
+
 def test_concave_convex_collision():
     poly_a_points = [(3, 3), (5, 3), (5, 4), (4, 4), (4, 5), (5, 5), (5, 6), (3, 6)]
     poly_b_points = [(4.5, 3.5), (6, 2), (6, 4)]
@@ -99,3 +135,100 @@ def test_concave_concave_collision():
     poly_b = ConcaveCollider(poly_b_points)
 
     assert poly_a.collide(poly_b) is True
+
+
+def test_rectangle_axes_are_deduplicated():
+    rect = ConvexCollider([(13, 10), (13, 3), (6, 3), (6, 10)])
+
+    assert len(rect._axes) == 2
+
+
+def test_hexagon_axes_are_deduplicated():
+    hexagon = ConvexCollider([(0, 1), (1, 0), (2, 0), (3, 1), (2, 2), (1, 2)])
+
+    assert len(hexagon._axes) == 3
+
+
+def test_collision_after_move_uses_shifted_projections():
+    poly_a = ConvexCollider([(13, 10), (13, 3), (6, 3), (6, 10)])
+    poly_b = ConvexCollider([(14, 18), (15, 11), (10, 13)])
+    assert poly_a.collide(poly_b) is False
+
+    poly_a.topleft = (9, 9)
+
+    assert poly_a.collide(poly_b) is True
+    assert poly_b.collide(poly_a) is True
+
+
+def test_separating_axis_cache():
+    poly_a = ConvexCollider([(0, 0), (4, 0), (2.1, 2.1), (0, 4)])
+    # Own shape so that counting the projections doesn't touch shared shapes
+    poly_b = ConvexCollider.from_shape(Shape([(2, 2), (2, 0), (0, 2)]), (2, 2))
+    cache = {}
+
+    assert poly_a.collide(poly_b, cache) is False
+    assert cache[(id(poly_a), id(poly_b))] is not None
+
+    projections = []
+    shape = poly_b.shape
+    project = shape._project
+    shape._project = lambda ax, ay: projections.append((ax, ay)) or project(ax, ay)
+
+    assert poly_a.collide(poly_b, cache) is False
+    assert len(projections) == 1
+
+
+def test_separating_axis_cache_with_collision():
+    poly_a = ConvexCollider([(0, 0), (4, 0), (2.1, 2.1), (0, 4)])
+    poly_b = ConvexCollider([(4, 4), (4, 2), (2, 4)])
+    cache = {}
+    poly_a.collide(poly_b, cache)
+
+    poly_b.topleft = (1, 1)
+
+    assert poly_a.collide(poly_b, cache) is True
+
+
+def test_concave_separating_axis_cache():
+    poly_a = ConcaveCollider([(3, 3), (5, 3), (5, 4), (4, 4), (4, 5), (5, 5), (5, 6), (3, 6)])
+    poly_b = ConvexCollider([(4.5, 4.2), (4.9, 4.2), (4.9, 4.8)])
+    cache = {}
+
+    assert poly_a.collide(poly_b, cache) is False
+    assert poly_b.collide(poly_a, cache) is False
+
+    poly_b.topleft = (4.5, 3.5)
+
+    assert poly_a.collide(poly_b, cache) is True
+
+
+def test_shape_classification():
+    assert ConvexCollider([(0, 0), (4, 0), (4, 2), (0, 2)]).is_aabb is True
+    assert ConvexCollider([(0, 0), (0, 2), (4, 2), (4, 0)]).is_aabb is True
+    assert ConvexCollider([(0, 0), (4, 0), (5, 2), (0, 2)]).is_aabb is False
+    assert ConvexCollider([(0, 0), (4, 0), (0, 4)]).is_triangle is True
+    assert ConvexCollider([(0, 0), (2, 2), (4, 4)]).is_triangle is False
+
+
+def test_aabb_fast_paths():
+    box = ConvexCollider([(0, 0), (4, 0), (4, 4), (0, 4)])
+    slope = ConvexCollider([(3, 6), (6, 3), (6, 6)])
+
+    assert box.collide(ConvexCollider([(3, 3), (6, 3), (6, 6), (3, 6)])) is True
+    assert box.collide(slope) is False
+    assert slope.collide(box) is False
+
+    slope.x -= 2
+    assert box.collide(slope) is True
+    assert slope.collide(box) is True
+
+
+def test_triangle_fast_path():
+    tri_a = ConvexCollider([(0, 0), (4, 0), (0, 4)])
+    tri_b = ConvexCollider([(4, 4), (2, 4), (4, 2)])
+
+    assert tri_a.collide(tri_b) is False
+
+    tri_b.topleft = (1, 1)  # Touching at the hypotenuse
+    assert tri_a.collide(tri_b) is True
+    assert tri_b.collide(tri_a) is True
@@ -0,0 +1,107 @@
+from pygame_colliders import CollisionWorld, ContactCache, ConvexCollider
+
+
+def _square(x, y, size=2):
+    return ConvexCollider([(x, y), (x + size, y), (x + size, y + size), (x, y + size)])
+
+
+class _Recorder:
+    def __init__(self):
+        self.events = []
+
+    def enter(self, a, b):
+        self.events.append(("enter", {a, b}))
+
+    def exit(self, a, b):
+        self.events.append(("exit", {a, b}))
+
+    def stay(self, a, b):
+        self.events.append(("stay", {a, b}))
+
+
+def test_enter_stay_exit():
+    recorder = _Recorder()
+    world = CollisionWorld(cell_size=4, on_enter=recorder.enter, on_exit=recorder.exit, on_stay=recorder.stay)
+    a = _square(0, 0)
+    b = _square(10, 0)
+    world.add(a)
+    world.add(b)
+
+    world.step()
+    assert recorder.events == []
+
+    a.x = 9
+    world.step()
+    a.x = 9.5
+    world.step()
+    a.x = 0
+    world.step()
+
+    assert recorder.events == [("enter", {a, b}), ("stay", {a, b}), ("exit", {a, b})]
+    assert world.contacts == []
+
+
+def test_exit_when_still_overlapping_bounding_boxes():
+    triangle = ConvexCollider([(0, 0), (4, 0), (0, 4)])
+    square = _square(1, 1)
+    world = CollisionWorld(cell_size=4)
+    world.add(triangle)
+    world.add(square)
+
+    entered, exited = world.step()
+    assert len(entered) == 1
+
+    # Bounding boxes still overlap but polygons don't
+    square.topleft = (2.5, 2.5)
+    entered, exited = world.step()
+
+    assert entered == []
+    assert [set(pair) for pair in exited] == [{triangle, square}]
+
+
+def test_unmoved_pairs_reuse_result():
+    cache = ContactCache()
+    a = _square(0, 0)
+    b = _square(1, 1)
+
+    cache.update([(a, b)])
+    assert cache.narrow_phase_tests == 1
+
+    entered, exited = cache.update([(b, a)])
+    assert cache.narrow_phase_tests == 0
+    assert (entered, exited) == ([], [])
+
+    b.x = 0.5
+    cache.update([(a, b)])
+    assert cache.narrow_phase_tests == 1
+    assert len(cache.contacts) == 1
+
+
+def test_removed_collider_is_forgotten():
+    recorder = _Recorder()
+    world = CollisionWorld(cell_size=4, on_exit=recorder.exit)
+    a = _square(0, 0)
+    b = _square(1, 1)
+    world.add(a)
+    world.add(b)
+    world.step()
+
+    world.remove(b)
+    world.step()
+
+    assert recorder.events == []
+    assert world.contacts == []
+
+
+def test_idle_pair_skips_narrow_phase_after_move_back():
+    cache = ContactCache()
+    a = _square(0, 0)
+    b = _square(1, 1)
+    cache.update([(a, b)])
+
+    # Moving away and back still changes the version
+    a.x = 5
+    a.x = 0
+    cache.update([(a, b)])
+
+    assert cache.narrow_phase_tests == 1
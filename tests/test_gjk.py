@@ -0,0 +1,82 @@
+import math
+
+import pytest
+
+from pygame_colliders import ConcaveCollider, ConvexCollider
+
+SHAPE_PAIRS = [
+    ([(13, 10), (13, 3), (6, 3), (6, 10)], [(14, 18), (15, 11), (10, 13)]),
+    ([(13, 20), (13, 13), (6, 13), (6, 20)], [(13, 13), (8, 9), (7, 15)]),
+    ([(11, 10), (11, 3), (4, 3), (4, 10)], [(13, 13), (8, 9), (7, 15)]),
+    ([(0, 0), (4, 0), (0, 4)], [(4, 4), (4, 2), (2, 4)]),
+    ([(0, 0), (4, 0), (0, 4)], [(2, 2), (4, 2), (2, 4)]),  # Touching edges
+    ([(0, 0), (4, 0), (0, 4)], [(1, 1), (3, 1), (1, 3)]),
+]
+
+
+def _ngon(n, cx, cy, r):
+    return [(cx + r * math.cos(2 * math.pi * i / n), cy + r * math.sin(2 * math.pi * i / n)) for i in range(n)]
+
+
+@pytest.mark.parametrize("points_a,points_b", SHAPE_PAIRS)
+def test_gjk_matches_sat(points_a, points_b):
+    for offset in range(-3, 4):
+        moved_b = [(x + offset, y - offset) for x, y in points_b]
+        sat = ConvexCollider(points_a, engine="sat").collide(ConvexCollider(moved_b, engine="sat"))
+        gjk = ConvexCollider(points_a, engine="gjk").collide(ConvexCollider(moved_b, engine="gjk"))
+
+        assert sat is gjk
+
+
+def test_gjk_large_polygons():
+    a = ConvexCollider(_ngon(48, 0, 0, 10))
+    b = ConvexCollider(_ngon(48, 19, 0, 10))
+    c = ConvexCollider(_ngon(48, 14.2, 14.2, 10))
+
+    assert a.engine == "gjk"
+    assert a.collide(b) is True
+    assert a.collide(c) is False
+
+
+def test_engine_selection():
+    assert ConvexCollider([(0, 0), (4, 0), (0, 4)]).engine == "sat"
+    assert ConvexCollider(_ngon(60, 0, 0, 10)).engine == "gjk"
+    assert ConvexCollider(_ngon(60, 0, 0, 10), engine="sat").engine == "sat"
+
+    with pytest.raises(ValueError):
+        ConvexCollider([(0, 0), (4, 0), (0, 4)], engine="epa")
+
+
+def test_gjk_against_concave():
+    concave = ConcaveCollider([(3, 3), (5, 3), (5, 4), (4, 4), (4, 5), (5, 5), (5, 6), (3, 6)])
+    inside_notch = ConvexCollider(_ngon(16, 4.6, 4.5, 0.3))
+    overlapping = ConvexCollider(_ngon(16, 5.2, 3.5, 0.3))
+
+    assert concave.collide(inside_notch) is False
+    assert concave.collide(overlapping) is True
+
+
+@pytest.mark.parametrize("n", [32, 33, 64])
+def test_log_support_matches_linear_scan(n):
+    collider = ConvexCollider(_ngon(n, 3, -2, 10))
+    assert collider._support_angles is not None
+
+    for i in range(360):
+        dx = math.cos(math.radians(i))
+        dy = math.sin(math.radians(i))
+        best = max(dx * v.x + dy * v.y for v in collider._vertices)
+        x, y = collider._support(dx, dy)
+
+        assert dx * x + dy * y == best
+
+
+def test_log_support_on_axis_aligned_box():
+    # Many collinear vertices along the sides
+    points = [(x, 0) for x in range(10)] + [(10, y) for y in range(10)]
+    points += [(x, 10) for x in range(10, 0, -1)] + [(0, y) for y in range(10, 0, -1)]
+    collider = ConvexCollider(points)
+
+    assert collider._project(1, 0) == (0, 10)
+    assert collider._project(0, 1) == (0, 10)
+    assert collider._project(1, 1) == (0, 20)
+    assert collider._project(-1, 1) == (-10, 10)
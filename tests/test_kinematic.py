@@ -0,0 +1,75 @@
+import pytest
+
+from pygame_colliders import (
+    CollisionWorld,
+    ConcaveCollider,
+    ConvexCollider,
+    move_and_slide,
+)
+
+
+def _box(x, y, w, h):
+    return ConvexCollider([(x, y), (x + w, y), (x + w, y + h), (x, y + h)])
+
+
+def test_move_and_slide_free_movement():
+    world = CollisionWorld(cell_size=16)
+    player = _box(0, 0, 2, 2)
+    world.add(player)
+
+    hits = move_and_slide(player, 5, 3, world)
+
+    assert hits == []
+    assert player.topleft == pytest.approx((5, 3))
+
+
+def test_move_and_slide_along_floor():
+    world = CollisionWorld(cell_size=16)
+    player = _box(0, 0, 2, 2)
+    world.add(player)
+    world.add_static([_box(-50, 4, 100, 2)])
+
+    hits = move_and_slide(player, 6, 6, world)
+
+    # Falls to the floor and slides the rest of the way along it
+    assert len(hits) == 1
+    assert hits[0].normal.xy == pytest.approx((0, -1))
+    assert player.topleft == pytest.approx((6, 2))
+    assert player.version == 1
+
+
+def test_move_and_slide_into_corner():
+    world = CollisionWorld(cell_size=16)
+    player = _box(0, 0, 2, 2)
+    corner = ConcaveCollider([(-10, 4), (5, 4), (5, -10), (7, -10), (7, 6), (-10, 6)])
+    world.add(player)
+    world.add(corner)
+
+    hits = move_and_slide(player, 10, 10, world)
+
+    assert len(hits) == 2
+    assert player.topleft == pytest.approx((3, 2))
+
+
+def test_move_and_slide_thin_wall():
+    world = CollisionWorld(cell_size=16)
+    bullet = _box(0, 0, 1, 1)
+    world.add(bullet)
+    world.add(_box(50, -10, 0.5, 20))
+
+    move_and_slide(bullet, 100, 0, world)
+
+    assert bullet.x == pytest.approx(49)
+
+
+def test_move_and_slide_skips_other_layers():
+    world = CollisionWorld(cell_size=16)
+    player = _box(0, 0, 2, 2)
+    player.mask = 0x0001
+    ghost = _box(4, -10, 2, 20)
+    ghost.category = 0x0002
+    world.add(player)
+    world.add(ghost)
+
+    assert move_and_slide(player, 10, 0, world) == []
+    assert player.x == pytest.approx(10)
@@ -0,0 +1,87 @@
+import pytest
+
+from pygame_colliders import (
+    AABBTree,
+    CollisionWorld,
+    ConvexCollider,
+    SpatialHash,
+    SweepAndPrune,
+    create_collider,
+)
+
+PLAYER = 0x01
+ENEMY = 0x02
+ENEMY_BULLET = 0x04
+
+
+def _square(x, y, category, mask, size=2):
+    return ConvexCollider(
+        [(x, y), (x + size, y), (x + size, y + size), (x, y + size)],
+        category=category,
+        mask=mask,
+    )
+
+
+def test_default_layers_collide():
+    a = create_collider([(0, 0), (2, 0), (2, 2), (0, 2)])
+    b = create_collider([(1, 1), (3, 1), (3, 3), (1, 3)])
+
+    assert a.can_collide(b) is True
+
+
+def test_mask_rejects_category():
+    bullet = _square(0, 0, ENEMY_BULLET, PLAYER)
+    enemy = _square(1, 1, ENEMY, PLAYER | ENEMY)
+    player = _square(1, 1, PLAYER, ENEMY | ENEMY_BULLET)
+
+    assert bullet.can_collide(enemy) is False
+    assert bullet.can_collide(player) is True
+    # Both colliders have to accept each other
+    assert enemy.can_collide(player) is True
+    player.mask = ENEMY_BULLET
+    assert enemy.can_collide(player) is False
+
+
+@pytest.mark.parametrize("broadphase", [SpatialHash(4), AABBTree(), SweepAndPrune()])
+def test_broadphase_culls_pairs(broadphase):
+    world = CollisionWorld(broadphase=broadphase)
+    bullets = [_square(i * 0.1, 0, ENEMY_BULLET, PLAYER) for i in range(4)]
+    player = _square(0, 0, PLAYER, ENEMY_BULLET)
+    for collider in bullets + [player]:
+        world.add(collider)
+
+    pairs = world.collisions()
+
+    assert len(pairs) == 4
+    assert all(player in pair for pair in pairs)
+    assert world.layer_stats.culled(ENEMY_BULLET, ENEMY_BULLET) > 0
+    assert world.layer_stats.culled(PLAYER, ENEMY_BULLET) == 0
+
+    world.reset_layer_stats()
+    assert world.layer_stats.total == 0
+
+
+def test_changing_layers_updates_broadphase():
+    world = CollisionWorld(broadphase=SweepAndPrune())
+    a = _square(0, 0, PLAYER, PLAYER)
+    b = _square(1, 1, ENEMY, ENEMY)
+    world.add(a)
+    world.add(b)
+    assert world.collisions() == []
+
+    b.category = PLAYER
+    b.mask = PLAYER
+
+    assert len(world.collisions()) == 1
+
+
+def test_static_culling():
+    world = CollisionWorld()
+    wall = _square(0, 0, ENEMY, ENEMY)
+    player = _square(1, 1, PLAYER, PLAYER)
+    world.add_static([wall])
+    world.add(player)
+
+    assert world.collisions() == []
+    assert world.query_collider(player) == []
+    assert world.layer_stats.culled(PLAYER, ENEMY) == 2
@@ -0,0 +1,71 @@
+import random
+
+import pytest
+
+from pygame_colliders import ConcaveCollider, ConvexCollider
+
+
+def _box(x, y, w, h):
+    return ConvexCollider([(x, y), (x + w, y), (x + w, y + h), (x, y + h)])
+
+
+def test_box_manifold():
+    a = _box(0, 0, 4, 4)
+    b = _box(3, 1, 4, 2)
+
+    manifold = a.collide_manifold(b)
+
+    assert manifold.depth == pytest.approx(1)
+    assert manifold.normal.xy == pytest.approx((1, 0))
+    assert sorted(manifold.points) == [(3, 1), (3, 3)]
+
+
+def test_manifold_separates_colliders():
+    a = _box(0, 0, 4, 4)
+    b = ConvexCollider([(3, 5), (5, 2), (7, 5)])
+
+    manifold = a.collide_manifold(b)
+    b.x += manifold.normal.x * (manifold.depth + 1e-6)
+    b.y += manifold.normal.y * (manifold.depth + 1e-6)
+
+    assert manifold.depth > 0
+    assert a.collide(b) is False
+
+
+def test_reversed_manifold():
+    a = _box(0, 0, 4, 4)
+    b = _box(1, 3, 2, 4)
+
+    manifold = b.collide_manifold(a)
+
+    assert manifold.depth == pytest.approx(1)
+    assert manifold.normal.xy == pytest.approx((0, -1))
+
+
+def test_no_manifold_without_collision():
+    a = _box(0, 0, 4, 4)
+    b = _box(5, 0, 4, 4)
+
+    assert a.collide_manifold(b) is None
+
+
+def test_manifold_matches_collide():
+    rnd = random.Random(2)
+    for _ in range(500):
+        a = ConvexCollider([(rnd.uniform(0, 10), rnd.uniform(0, 10)) for _ in range(3)])
+        b = ConvexCollider([(rnd.uniform(0, 10), rnd.uniform(0, 10)) for _ in range(3)])
+
+        assert (a.collide_manifold(b) is not None) is a.collide(b)
+
+
+def test_concave_manifold():
+    concave = ConcaveCollider([(3, 3), (5, 3), (5, 4), (4, 4), (4, 5), (5, 5), (5, 6), (3, 6)])
+    convex = _box(4.8, 2, 2, 1.5)
+
+    manifold = concave.collide_manifold(convex)
+    flipped = convex.collide_manifold(concave)
+
+    assert manifold.depth == pytest.approx(0.2)
+    assert manifold.normal.xy == pytest.approx((1, 0))
+    assert flipped.normal.xy == pytest.approx((-1, 0))
+    assert concave.collide_manifold(_box(4.5, 4.2, 0.4, 0.4)) is None
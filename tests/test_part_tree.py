@@ -0,0 +1,67 @@
+import random
+
+from pygame_colliders import ConcaveCollider, ConvexCollider, Rect
+
+
+def _saw(x, y, teeth):
+    points = [(x, y + 12)]
+    for i in range(teeth):
+        points += [(x + i * 2, y + 10), (x + i * 2 + 1, y)]
+    points += [(x + teeth * 2, y + 10), (x + teeth * 2, y + 12)]
+    return ConcaveCollider(points)
+
+
+def _brute_force(a, b):
+    return any(pa.collide(pb) for pa in a._colliders for pb in b._colliders)
+
+
+def test_query_rect_after_move():
+    saw = _saw(0, 0, 50)
+
+    saw.topleft = (1000, 500)
+
+    found = saw._query_parts(Rect(1040.2, 504, 0.6, 1))
+    assert found
+    assert all(p._rect.left <= 1040.8 and p._rect.right >= 1040.2 for p in found)
+    assert saw._query_parts(Rect(40.2, 4, 0.6, 1)) == []
+
+
+def test_tree_is_shared_by_shape():
+    a = _saw(0, 0, 20)
+    b = _saw(300, -40, 20)
+
+    assert a.shape is b.shape
+    assert a.shape.parts == tuple(p.shape for p in b._colliders)
+
+
+def test_concave_concave_matches_brute_force():
+    random.seed(3)
+    a = _saw(0, 0, 30)
+    b = _saw(0, 0, 20)
+    b.topleft = (15.5, 9)
+    for _ in range(200):
+        b.topleft = (random.uniform(-45, 65), random.uniform(-13, 13))
+        assert a.collide(b) is _brute_force(a, b)
+        assert b.collide(a) is _brute_force(a, b)
+
+
+def test_concave_concave_tests_few_pairs():
+    a = _saw(0, 0, 150)
+    b = _saw(0, 0, 150)
+    b.topleft = (290.5, 11.5)  # Only a few teeth of b reach the base of a
+
+    pairs = list(a._part_pairs(b))
+
+    assert a.collide(b) is True
+    assert len(pairs) * 50 < len(a._colliders) * len(b._colliders)
+
+
+def test_concave_convex_uses_tree():
+    saw = _saw(0, 0, 150)
+    box = ConvexCollider([(100.1, 1), (100.6, 1), (100.6, 2), (100.1, 2)])
+
+    assert saw.collide(box) is False
+    assert len(saw._query_parts(box._rect)) < 10
+
+    box.x += 1
+    assert saw.collide(box) is True
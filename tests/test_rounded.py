@@ -0,0 +1,162 @@
+import pytest
+
+from pygame_colliders import (
+    CapsuleCollider,
+    CircleCollider,
+    CollisionWorld,
+    ConcaveCollider,
+    ConvexCollider,
+    move_and_slide,
+)
+
+
+def _box(x, y, w, h):
+    return ConvexCollider([(x, y), (x + w, y), (x + w, y + h), (x, y + h)])
+
+
+def test_circle_rect():
+    circle = CircleCollider((10, 20), 3)
+
+    assert circle.topleft == (7, 17)
+    assert circle.size == (6, 6)
+    assert circle.center == (10, 20)
+
+
+def test_circle_circle():
+    a = CircleCollider((0, 0), 2)
+
+    assert a.collide(CircleCollider((3, 0), 1.5)) is True
+    assert a.collide(CircleCollider((3, 3), 1.5)) is False
+    assert a.collide(CircleCollider((3, 2.5), 1.5)) is False
+
+
+def test_circle_polygon_nearest_edge():
+    box = _box(0, 0, 10, 10)
+
+    assert CircleCollider((12, 5), 2.5).collide(box) is True
+    assert box.collide(CircleCollider((12, 5), 1.5)) is False
+    # Bounding boxes overlap near the corner but the circle doesn't
+    assert CircleCollider((12, 12), 2.5).collide(box) is False
+    assert CircleCollider((5, 5), 1).collide(box) is True  # Inside
+
+
+def test_capsule_tests():
+    capsule = CapsuleCollider((0, 0), (10, 0), 1)
+
+    assert capsule.collide(CircleCollider((5, 2.5), 1)) is False
+    assert capsule.collide(CircleCollider((5, 1.5), 1)) is True
+    assert capsule.collide(CapsuleCollider((5, -5), (5, 5), 0.5)) is True
+    assert capsule.collide(CapsuleCollider((12, -5), (12, 5), 0.5)) is False
+    assert capsule.collide(_box(4, 0.5, 2, 2)) is True
+    assert capsule.collide(_box(10.8, 0.8, 2, 2)) is False
+
+
+def test_round_concave():
+    c_shape = ConcaveCollider(
+        [(0, 0), (6, 0), (6, 2), (2, 2), (2, 4), (6, 4), (6, 6), (0, 6)]
+    )
+
+    # Inside the opening of the C
+    assert CircleCollider((4.5, 3), 0.5).collide(c_shape) is False
+    assert c_shape.collide(CircleCollider((4.5, 3), 0.5)) is False
+    assert CircleCollider((4.5, 3), 1.2).collide(c_shape) is True
+    assert c_shape.collide(CapsuleCollider((1, 3), (5, 3), 0.1)) is True
+
+
+def test_round_point_collide():
+    capsule = CapsuleCollider((0, 0), (10, 0), 1)
+
+    assert capsule.point_collide((5, 0.9)) is True
+    assert capsule.point_collide((10.5, 0.5)) is True
+    assert capsule.point_collide((11, 1)) is False
+
+
+def test_round_move():
+    capsule = CapsuleCollider((0, 0), (0, 10), 2)
+
+    capsule.x += 5
+
+    assert capsule.start == (5, 0)
+    assert capsule.end == (5, 10)
+    assert capsule.topleft == (3, -2)
+    assert capsule.version == 1
+
+
+def test_circle_manifold():
+    box = _box(0, 0, 10, 10)
+
+    manifold = box.collide_manifold(CircleCollider((11, 5), 2))
+    assert manifold.normal.xy == pytest.approx((1, 0))
+    assert manifold.depth == pytest.approx(1)
+
+    manifold = CircleCollider((5, 9), 2).collide_manifold(box)
+    assert manifold.normal.xy == pytest.approx((0, -1))
+    assert manifold.depth == pytest.approx(3)
+
+    manifold = CircleCollider((0, 0), 2).collide_manifold(CircleCollider((3, 0), 2))
+    assert manifold.normal.xy == pytest.approx((1, 0))
+    assert manifold.depth == pytest.approx(1)
+    assert manifold.points == [pytest.approx((2, 0))]
+
+
+def test_circle_sweep():
+    bullet = CircleCollider((0, 0), 1)
+    wall = _box(50, -10, 0.5, 20)
+
+    hit = bullet.sweep(wall, 100, 0)
+    assert hit.time == pytest.approx(0.49)
+    assert hit.normal.xy == pytest.approx((-1, 0))
+
+    hit = wall.sweep(bullet, -100, 0)
+    assert hit.time == pytest.approx(0.49)
+    assert hit.normal.xy == pytest.approx((1, 0))
+
+    assert bullet.sweep(wall, 10, 0) is None
+
+
+def test_circle_sweep_angled_approach():
+    a = CircleCollider((-1.53, -0.55), 1.28)
+    b = CircleCollider((3.35, -2.18), 1.59)
+
+    hit = a.sweep(b, 21.0, 5.75)
+
+    # Root of |a + t * d - b| = ra + rb
+    assert hit.time == pytest.approx(0.185907, abs=1e-6)
+    assert hit.normal.xy == pytest.approx((-0.340055, 0.940406), abs=1e-6)
+
+
+def test_capsule_sweep_hits_corner():
+    capsule = CapsuleCollider((0, 0), (0, 4), 1)
+
+    # Side of the capsule hits the corner of the box
+    hit = capsule.sweep(_box(10, 3, 4, 4), 20, 0)
+    assert hit.time == pytest.approx(0.45)
+    assert hit.normal.xy == pytest.approx((-1, 0))
+
+    # Round end of the capsule hits the corner
+    hit = capsule.sweep(_box(10, 4.6, 4, 4), 20, 0)
+    assert hit.time == pytest.approx(0.46)
+    assert hit.normal.xy == pytest.approx((-0.8, -0.6))
+
+    hit = _box(10, 4.6, 4, 4).sweep(capsule, -20, 0)
+    assert hit.time == pytest.approx(0.46)
+    assert hit.normal.xy == pytest.approx((0.8, 0.6))
+
+    assert capsule.sweep(_box(10, 6, 4, 4), 20, 0) is None
+
+
+def test_circle_move_and_slide():
+    world = CollisionWorld(cell_size=16)
+    ball = CircleCollider((0, 0), 1)
+    world.add(ball)
+    world.add_static([_box(-50, 4, 100, 2)])
+
+    hits = move_and_slide(ball, 6, 6, world)
+
+    assert len(hits) == 1
+    assert ball.center == pytest.approx((6, 3))
+
+
+def test_negative_radius():
+    with pytest.raises(ValueError):
+        CircleCollider((0, 0), -1)
@@ -0,0 +1,74 @@
+from pygame_colliders import (
+    CapsuleCollider,
+    CircleCollider,
+    ConcaveCollider,
+    ConcaveShape,
+    ConvexCollider,
+    Shape,
+    Vector2,
+)
+
+CRATE = [(0, 0), (16, 0), (16, 16), (0, 16)]
+C_SHAPE = [(3, 3), (5, 3), (5, 4), (4, 4), (4, 5), (5, 5), (5, 6), (3, 6)]
+
+
+def test_translated_colliders_share_shape():
+    a = ConvexCollider(CRATE)
+    b = ConvexCollider([(x + 100, y - 40) for x, y in CRATE])
+
+    assert a.shape is b.shape
+    assert b.shape.vertices == ((0, 0), (16, 0), (16, 16), (0, 16))
+    assert b.points == [[100, -40], [116, -40], [116, -24], [100, -24]]
+    assert b.topleft == (100, -40)
+
+
+def test_collider_from_shape():
+    crate = Shape(CRATE)
+    a = ConvexCollider.from_shape(crate, (10, 5), data="a")
+    b = ConvexCollider.from_shape(crate, (20, 5))
+
+    assert a.shape is crate
+    assert a.data == "a"
+    assert a.is_aabb
+    assert (a.x, a.y, a.w, a.h) == (10, 5, 16, 16)
+    assert a.collide(b) is True
+
+    b.x += 7
+    assert a.collide(b) is False
+    assert crate.vertices == tuple(CRATE)
+
+
+def test_concave_colliders_share_shape():
+    a = ConcaveCollider(C_SHAPE)
+    b = ConcaveCollider([(x - 50, y + 20) for x, y in C_SHAPE])
+    c = ConcaveCollider.from_shape(a.shape, (50, 50))
+
+    assert a.shape is b.shape is c.shape
+    assert [p.shape for p in c._colliders] == list(a.shape.parts)
+    assert c.topleft == (50, 50)
+    assert c.point_collide((50.5, 50.5)) is True
+    assert c.point_collide((51.5, 51.5)) is False
+
+
+def test_concave_shape_without_collider():
+    shape = ConcaveShape([(0, 0), (2, 0), (2, 1), (1, 1), (1, 2), (0, 2)], decomposition="convex")
+
+    assert len(shape.parts) == 2
+    assert all(isinstance(part, Shape) for part in shape.parts)
+
+
+def test_colliders_have_no_instance_dict():
+    colliders = [
+        ConvexCollider(CRATE),
+        ConcaveCollider(C_SHAPE),
+        CircleCollider((0, 0), 1),
+        CapsuleCollider((0, 0), (4, 0), 1),
+    ]
+
+    for collider in colliders:
+        assert not hasattr(collider, "__dict__")
+        assert not hasattr(collider._rect, "__dict__")
+    assert not hasattr(Vector2(1, 2), "__dict__")
+
+    collider = ConvexCollider(CRATE, data={"hp": 3})
+    assert collider.data["hp"] == 3
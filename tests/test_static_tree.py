@@ -0,0 +1,69 @@
+import random
+
+from pygame_colliders import CollisionWorld, ConvexCollider, Rect, StaticTree
+
+
+def _square(x, y, size=2):
+    return ConvexCollider([(x, y), (x + size, y), (x + size, y + size), (x, y + size)])
+
+
+def test_static_tree_query_matches_linear_scan():
+    rnd = random.Random(11)
+    colliders = [_square(rnd.uniform(0, 500), rnd.uniform(0, 500), rnd.uniform(1, 20)) for _ in range(500)]
+    tree = StaticTree(colliders, node_capacity=4)
+
+    for _ in range(50):
+        area = Rect(rnd.uniform(0, 500), rnd.uniform(0, 500), rnd.uniform(1, 60), rnd.uniform(1, 60))
+        expected = {c for c in colliders if area.collide_rect(c._rect)}
+
+        assert set(tree.query_rect(area)) == expected
+
+
+def test_static_tree_is_balanced():
+    colliders = [_square(x * 3, y * 3) for x in range(32) for y in range(32)]
+    tree = StaticTree(colliders, node_capacity=4)
+
+    assert len(tree) == 1024
+    assert tree.height == 5
+
+
+def test_static_tree_empty():
+    tree = StaticTree()
+
+    assert len(tree) == 0
+    assert tree.height == 0
+    assert tree.query_rect(Rect(0, 0, 10, 10)) == []
+
+
+def test_world_static_pairs():
+    world = CollisionWorld(cell_size=4)
+    wall_a = _square(0, 0, size=4)
+    wall_b = _square(2, 2, size=4)
+    player = _square(5, 5)
+    world.add_static([wall_a, wall_b])
+    world.add(player)
+
+    pairs = world.collisions()
+
+    # Overlapping static colliders are never paired
+    assert pairs == [(player, wall_b)]
+    assert len(world) == 3
+    assert world.query_collider(player) == [wall_b]
+
+
+def test_world_remove_static():
+    world = CollisionWorld(cell_size=4)
+    wall_a = _square(0, 0, size=4)
+    wall_b = _square(2, 2, size=4)
+    player = _square(5, 5)
+    world.add_static([wall_a, wall_b])
+    world.add(player)
+    world.step()
+
+    world.remove(wall_b)
+
+    assert wall_b not in world
+    assert len(world) == 2
+    assert world.collisions() == []
+    assert world.contacts == []
+    assert world.query_rect(Rect(0, 0, 8, 8)) == [player, wall_a]
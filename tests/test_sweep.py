@@ -0,0 +1,74 @@
+import pytest
+
+from pygame_colliders import ConcaveCollider, ConvexCollider
+
+
+def _box(x, y, w, h):
+    return ConvexCollider([(x, y), (x + w, y), (x + w, y + h), (x, y + h)])
+
+
+def test_sweep_through_thin_wall():
+    bullet = _box(0, 0, 1, 1)
+    wall = _box(50, -10, 0.5, 20)
+
+    hit = bullet.sweep(wall, 100, 0)
+
+    # End position alone misses the wall
+    bullet.x += 100
+    assert bullet.collide(wall) is False
+
+    assert hit.time == pytest.approx(0.49)
+    assert hit.normal.xy == pytest.approx((-1, 0))
+    assert hit.collider is wall
+
+
+def test_sweep_miss():
+    bullet = _box(0, 0, 1, 1)
+    wall = _box(50, 5, 0.5, 20)
+
+    assert bullet.sweep(wall, 100, 0) is None
+    assert bullet.sweep(wall, 10, 0) is None
+
+
+def test_sweep_diagonal_onto_slope():
+    ball = _box(0, 0, 1, 1)
+    slope = ConvexCollider([(0, 10), (10, 0), (10, 10)])
+
+    hit = ball.sweep(slope, 10, 10)
+
+    assert 0 < hit.time < 1
+    assert hit.normal.xy == pytest.approx((-(0.5 ** 0.5), -(0.5 ** 0.5)))
+
+    ball.x += 10 * hit.time
+    ball.y += 10 * hit.time
+    assert ball.collide(slope) is True
+
+
+def test_sweep_touching_at_start():
+    box = _box(0, 0, 1, 1)
+    floor = _box(-10, 1, 20, 1)
+
+    hit = box.sweep(floor, 0, 1)
+
+    assert hit.time == 0
+    assert hit.normal.xy == pytest.approx((0, -1))
+    # Sliding along or leaving the surface isn't blocked
+    assert box.sweep(floor, 5, 0) is None
+    assert box.sweep(floor, 0, -1) is None
+
+
+def test_sweep_concave():
+    concave = ConcaveCollider([(3, 3), (5, 3), (5, 4), (4, 4), (4, 5), (5, 5), (5, 6), (3, 6)])
+    box = _box(10, 3.2, 0.5, 0.5)
+
+    hit = box.sweep(concave, -10, 0)
+    reverse = concave.sweep(box, 10, 0)
+
+    assert hit.time == pytest.approx(0.5)
+    assert hit.normal.xy == pytest.approx((1, 0))
+    assert hit.collider is concave
+    assert reverse.time == pytest.approx(0.5)
+    assert reverse.normal.xy == pytest.approx((-1, 0))
+    # Passing through the notch of C
+    notch = _box(10, 4.25, 0.5, 0.5)
+    assert notch.sweep(concave, -5.5, 0) is None
@@ -0,0 +1,166 @@
+import random
+
+from pygame_colliders import CollisionWorld, ConvexCollider, Rect, SweepAndPrune
+
+
+def _square(x, y, size=2):
+    return ConvexCollider([(x, y), (x + size, y), (x + size, y + size), (x, y + size)])
+
+
+def _brute_force_pairs(colliders):
+    pairs = set()
+    for i, a in enumerate(colliders):
+        for b in colliders[i + 1:]:
+            if a._rect.collide_rect(b._rect):
+                pairs.add(frozenset((a, b)))
+    return pairs
+
+
+def test_sap_pairs_match_brute_force():
+    rnd = random.Random(3)
+    colliders = [_square(rnd.uniform(0, 60), rnd.uniform(0, 60), rnd.uniform(1, 8)) for _ in range(60)]
+    sap = SweepAndPrune()
+    for collider in colliders:
+        sap.insert(collider)
+
+    assert {frozenset(pair) for pair in sap.pairs()} == _brute_force_pairs(colliders)
+
+    for _ in range(10):
+        for collider in colliders:
+            collider.x += rnd.uniform(-3, 3)
+            collider.y += rnd.uniform(-1, 1)
+
+        assert {frozenset(pair) for pair in sap.pairs()} == _brute_force_pairs(colliders)
+
+
+def _assert_sorted(sap):
+    for axis in (sap._x_axis, sap._y_axis):
+        keys = [(e.value, e.kind) for e in axis]
+        assert keys == sorted(keys)
+        assert [e.index for e in axis] == list(range(len(axis)))
+
+
+def test_sap_large_moves_match_brute_force():
+    rnd = random.Random(7)
+    colliders = [_square(rnd.randint(0, 30), rnd.randint(0, 30), rnd.randint(1, 6)) for _ in range(40)]
+    sap = SweepAndPrune()
+    for collider in colliders:
+        sap.insert(collider)
+
+    for _ in range(50):
+        for collider in rnd.sample(colliders, 10):
+            collider.x += rnd.randint(-20, 20)
+            collider.y += rnd.randint(-20, 20)
+
+        _assert_sorted(sap)
+        assert {frozenset(pair) for pair in sap.pairs()} == _brute_force_pairs(colliders)
+        left, top = rnd.randint(-10, 40), rnd.randint(-10, 40)
+        area = Rect(left, top, rnd.randint(1, 20), rnd.randint(1, 20))
+        expected = {c for c in colliders if area.collide_rect(c._rect)}
+        assert set(sap.query_rect(area)) == expected
+
+
+def test_sap_move_past_own_endpoint():
+    sap = SweepAndPrune()
+    a = _square(0, 0)
+    b = _square(5, 0)
+    sap.insert(a)
+    sap.insert(b)
+
+    a.x = 5.5
+
+    _assert_sorted(sap)
+    assert len(list(sap.pairs())) == 1
+    assert set(sap.query_rect(Rect(6, 0, 1, 1))) == {a, b}
+
+
+def test_sap_ties_after_moves():
+    sap = SweepAndPrune()
+    boxes = [(6, 6, 1, 1), (0, 2, 2, 3), (2, 4, 2, 1)]
+    colliders = [ConvexCollider([(x, y), (x + w, y), (x + w, y + h), (x, y + h)]) for x, y, w, h in boxes]
+    for collider in colliders:
+        sap.insert(collider)
+    moved = colliders[2]
+
+    moved.y += 2
+    moved.x += 1
+    moved.y += 1
+
+    _assert_sorted(sap)
+    assert {frozenset(pair) for pair in sap.pairs()} == _brute_force_pairs(colliders)
+
+
+def test_sap_touching_is_not_overlapping():
+    sap = SweepAndPrune()
+    a = _square(0, 0)
+    b = _square(2, 0)
+    sap.insert(a)
+    sap.insert(b)
+
+    assert list(sap.pairs()) == []
+
+    b.x = 1.5
+
+    assert len(list(sap.pairs())) == 1
+
+
+def test_sap_changes():
+    sap = SweepAndPrune()
+    a = _square(0, 0)
+    b = _square(10, 0)
+    sap.insert(a)
+    sap.insert(b)
+    assert sap.pop_changes() == ([], [])
+
+    a.x = 9
+    began, ended = sap.pop_changes()
+    assert [set(pair) for pair in began] == [{a, b}]
+    assert ended == []
+
+    a.x = 0
+    began, ended = sap.pop_changes()
+    assert began == []
+    assert [set(pair) for pair in ended] == [{a, b}]
+
+    # Overlap that starts and ends between the calls isn't reported
+    a.x = 9
+    a.x = 0
+    assert sap.pop_changes() == ([], [])
+
+
+def test_sap_remove():
+    sap = SweepAndPrune()
+    a = _square(0, 0)
+    b = _square(1, 1)
+    sap.insert(a)
+    sap.insert(b)
+
+    sap.remove(a)
+    b.x = 0
+
+    assert list(sap.pairs()) == []
+    assert len(sap) == 1
+    assert a._broadphases == []
+
+
+def test_sap_query_rect():
+    sap = SweepAndPrune()
+    a = _square(0, 0)
+    b = _square(10, 10)
+    sap.insert(a)
+    sap.insert(b)
+
+    assert sap.query_rect(Rect(9, 9, 2, 2)) == [b]
+
+
+def test_world_with_sap():
+    world = CollisionWorld(broadphase=SweepAndPrune())
+    a = _square(0, 0)
+    b = _square(5, 5)
+    world.add(a)
+    world.add(b)
+    assert world.collisions() == []
+
+    b.topleft = (1, 1)
+
+    assert len(world.collisions()) == 1
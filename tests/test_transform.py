@@ -0,0 +1,139 @@
+import math
+import random
+
+import pytest
+
+from pygame_colliders import (
+    CapsuleCollider,
+    CircleCollider,
+    CollisionWorld,
+    ConcaveCollider,
+    ConvexCollider,
+    TriangulationCache,
+)
+
+C_SHAPE = [(3, 3), (5, 3), (5, 4), (4, 4), (4, 5), (5, 5), (5, 6), (3, 6)]
+
+
+def _rotated(points, angle, scale, cx, cy):
+    c = math.cos(math.radians(angle)) * scale
+    s = math.sin(math.radians(angle)) * scale
+    return [(cx + c * (x - cx) - s * (y - cy), cy + s * (x - cx) + c * (y - cy)) for x, y in points]
+
+
+def test_quarter_turn_keeps_rectangle_axis_aligned():
+    collider = ConvexCollider([(0, 0), (8, 0), (8, 2), (0, 2)])
+
+    collider.rotation = 90
+
+    assert collider.is_aabb
+    assert collider.rotation == 90
+    assert (collider.x, collider.y, collider.w, collider.h) == (3, -3, 2, 8)
+    assert collider.center == (4, 1)
+
+
+def test_rotated_convex_matches_rotated_points():
+    random.seed(5)
+    points = [(0, 0), (5, 1), (6, 4), (2, 6)]
+    others = [ConvexCollider([(x, y), (x + 1, y), (x, y + 1)]) for x in range(-3, 10) for y in range(-3, 10)]
+    for _ in range(20):
+        angle = random.uniform(-180, 180)
+        scale = random.uniform(0.5, 2)
+        collider = ConvexCollider(points)
+        collider.topleft = (1, 1)
+        collider.rotation = angle
+        collider.scale = scale
+        expected = ConvexCollider(_rotated([(x + 1, y + 1) for x, y in points], angle, scale, 4, 4))
+
+        assert collider.points == [pytest.approx(p) for p in expected.points]
+        assert collider.center == pytest.approx(expected.center)
+        for other in others:
+            if collider.collide(other) is not expected.collide(other) and not _near(collider, other):
+                pytest.fail(f"Rotation {angle} scale {scale} differs against {other}")
+
+
+def _near(a, b):
+    # Touching within rounding
+    manifold = a.collide_manifold(b) or b.collide_manifold(a)
+    return manifold is not None and manifold.depth < 1e-9
+
+
+def test_rotated_colliders_share_shape():
+    a = ConvexCollider([(0, 0), (4, 0), (4, 1), (0, 1)])
+    b = ConvexCollider([(10, 10), (14, 10), (14, 11), (10, 11)])
+    shape = a.shape
+
+    a.rotation = b.rotation = 30
+
+    assert a.shape is b.shape
+    assert a.shape is not shape
+    assert not a.is_aabb
+
+    a.rotation = 0
+    assert a.shape is shape
+
+
+def test_invalid_scale():
+    collider = ConvexCollider([(0, 0), (4, 0), (0, 4)])
+
+    with pytest.raises(ValueError):
+        collider.scale = 0
+
+
+def test_rotated_concave_reuses_triangulation():
+    cache = TriangulationCache()
+    collider = ConcaveCollider(C_SHAPE, triangulation_cache=cache)
+    parts = len(collider._colliders)
+
+    collider.rotation = 90
+
+    assert (cache.hits, cache.misses) == (0, 1)
+    assert len(collider._colliders) == parts
+    assert collider.shape.triangulation == "indexed_ear_clipping"
+    assert (collider.x, collider.y, collider.w, collider.h) == (2.5, 3.5, 3, 2)
+    # Notch of the C opens downwards after the quarter turn
+    assert collider.point_collide((4, 5.2)) is False
+    assert collider.point_collide((4, 4)) is True
+    assert collider.collide(ConvexCollider([(3.8, 5), (4.2, 5), (4, 5.4)])) is False
+    assert collider.collide(ConvexCollider([(2.6, 5), (3, 5), (2.8, 5.4)])) is True
+
+
+def test_rotated_concave_after_move():
+    collider = ConcaveCollider(C_SHAPE)
+
+    collider.topleft = (100, 100)
+    collider.rotation = 180
+    collider.scale = 2
+
+    # Notch opens to the left after the half turn
+    assert (collider.x, collider.y, collider.w, collider.h) == (99, 98.5, 4, 6)
+    assert collider.point_collide((100, 101.5)) is False
+    assert collider.point_collide((102, 101.5)) is True
+    assert all(part.left >= 99 for part in collider._colliders)
+
+
+def test_rotated_round_colliders():
+    circle = CircleCollider((5, 5), 2)
+    capsule = CapsuleCollider((0, 0), (4, 0), 1)
+
+    circle.scale = 2
+    capsule.rotation = 90
+
+    assert circle.radius == 4
+    assert circle.center == (5, 5)
+    assert capsule.start == pytest.approx((2, -2))
+    assert capsule.end == pytest.approx((2, 2))
+    assert (capsule.w, capsule.h) == pytest.approx((2, 6))
+
+
+def test_world_sees_rotated_collider():
+    world = CollisionWorld(cell_size=4)
+    bar = ConvexCollider([(0, 0), (20, 0), (20, 2), (0, 2)])
+    box = ConvexCollider([(9, 8), (11, 8), (11, 10), (9, 10)])
+    world.add(bar)
+    world.add(box)
+    assert world.collisions() == []
+
+    bar.rotation = 90
+
+    assert len(world.collisions()) == 1
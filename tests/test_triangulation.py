@@ -0,0 +1,154 @@
+import math
+
+import pytest
+
+from pygame_colliders import ConcaveCollider, ConvexCollider, TriangulationCache
+from pygame_colliders.triangulation import triangulate
+
+
+def _area(points):
+    return abs(
+        sum(
+            points[i][0] * points[i - 1][1] - points[i - 1][0] * points[i][1]
+            for i in range(len(points))
+        )
+        / 2
+    )
+
+
+def _star(count):
+    points = []
+    for i in range(count):
+        angle = 2 * math.pi * i / count
+        radius = 10 + (i % 2) * 5
+        points.append((math.cos(angle) * radius, math.sin(angle) * radius))
+    return points
+
+
+@pytest.mark.parametrize(
+    "points",
+    [
+        [(3, 3), (5, 3), (5, 4), (4, 4), (4, 5), (5, 5), (5, 6), (3, 6)],
+        [(0, 0), (2, 0), (4, 0), (4, 4), (0, 4)],  # Collinear vertex
+        [(0, 0), (0, 4), (2, 4), (2, 2), (4, 2), (4, 0)],  # Clockwise
+        _star(200),
+    ],
+)
+def test_triangulation_covers_polygon(points):
+    triangles = triangulate(points)
+
+    assert len(triangles) <= len(points) - 2
+    assert sum(_area(t) for t in triangles) == pytest.approx(_area(points))
+
+
+def test_triangulation_engines_agree():
+    points = _star(60)
+    fast = ConcaveCollider(points)
+    original = ConcaveCollider(points, triangulation="ear_clipping")
+
+    assert fast.triangulation == "indexed_ear_clipping"
+    assert len(fast._colliders) == len(original._colliders)
+    for point in ((0, 0), (12, 0), (0, 14), (14.5, 0), (20, 20)):
+        assert fast.point_collide(point) is original.point_collide(point)
+
+
+def test_unknown_triangulation():
+    with pytest.raises(ValueError):
+        ConcaveCollider([(0, 0), (4, 0), (0, 4)], triangulation="magic")
+
+
+def test_convex_decomposition_l_shape():
+    points = [(0, 0), (4, 0), (4, 2), (2, 2), (2, 4), (0, 4)]
+
+    assert len(ConcaveCollider(points)._colliders) == 4
+    collider = ConcaveCollider(points, decomposition="convex")
+    assert collider.decomposition == "convex"
+    assert len(collider._colliders) == 2
+    assert sum(_area(c.points) for c in collider._colliders) == pytest.approx(12)
+
+
+@pytest.mark.parametrize("triangulation", ["ear_clipping", "indexed_ear_clipping"])
+@pytest.mark.parametrize(
+    "points",
+    [
+        [(1, 2), (3, 0), (3, 2), (1, 2), (1, 1), (1, 0)],
+        [(0, 0), (0, 0), (1, 0), (3, 0), (2, 0)],
+    ],
+)
+def test_convex_decomposition_degenerate(triangulation, points):
+    collider = ConcaveCollider(
+        points,
+        triangulation=triangulation,
+        decomposition="convex",
+        triangulation_cache=None,
+    )
+
+    for part in collider._colliders:
+        assert len(part.points) >= 3
+        assert _area(part.points) > 0
+
+
+@pytest.mark.parametrize("triangulation", ["ear_clipping", "indexed_ear_clipping"])
+def test_convex_decomposition_collisions(triangulation):
+    points = [(3, 3), (5, 3), (5, 4), (4, 4), (4, 5), (5, 5), (5, 6), (3, 6)]
+    triangles = ConcaveCollider(points, triangulation=triangulation)
+    convex = ConcaveCollider(
+        points, triangulation=triangulation, decomposition="convex"
+    )
+
+    assert len(convex._colliders) < len(triangles._colliders)
+    probe = ConvexCollider([(0, 0), (0.5, 0), (0, 0.5)])
+    for x in range(20):
+        for y in range(20):
+            probe.topleft = (x * 0.2 + 2, y * 0.2 + 2)
+            assert convex.collide(probe) is triangles.collide(probe)
+
+
+def test_unknown_decomposition():
+    with pytest.raises(ValueError):
+        ConcaveCollider([(0, 0), (4, 0), (0, 4)], decomposition="magic")
+
+
+def _c_shape(x, y):
+    points = [(3, 3), (5, 3), (5, 4), (4, 4), (4, 5), (5, 5), (5, 6), (3, 6)]
+    return [(px + x, py + y) for px, py in points]
+
+
+def test_triangulation_cache_shares_translated_shapes():
+    cache = TriangulationCache()
+    first = ConcaveCollider(_c_shape(0, 0), triangulation_cache=cache)
+    second = ConcaveCollider(_c_shape(100, -20), triangulation_cache=cache)
+
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert len(cache) == 1
+    assert len(second._colliders) == len(first._colliders)
+    assert second.point_collide((103.5, -15.5)) is True
+    assert second.point_collide((104.5, -15.5)) is False
+
+    ConcaveCollider(_c_shape(0, 0), decomposition="convex", triangulation_cache=cache)
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_triangulation_cache_evicts_least_recently_used():
+    cache = TriangulationCache(maxsize=2)
+    square = [(0, 0), (2, 0), (2, 2), (0, 2)]
+    triangle = [(0, 0), (2, 0), (0, 2)]
+
+    ConcaveCollider(square, triangulation_cache=cache)
+    ConcaveCollider(triangle, triangulation_cache=cache)
+    ConcaveCollider(square, triangulation_cache=cache)
+    ConcaveCollider(_c_shape(0, 0), triangulation_cache=cache)  # Evicts triangle
+    ConcaveCollider(square, triangulation_cache=cache)
+    ConcaveCollider(triangle, triangulation_cache=cache)
+
+    assert len(cache) == 2
+    assert (cache.hits, cache.misses) == (2, 4)
+
+    cache.clear()
+    assert (len(cache), cache.hits, cache.misses) == (0, 0, 0)
+
+
+def test_triangulation_cache_disabled():
+    collider = ConcaveCollider(_c_shape(0, 0), triangulation_cache=None)
+
+    assert len(collider._colliders) == 6
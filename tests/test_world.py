@@ -0,0 +1,82 @@
+from pygame_colliders import CollisionWorld, ConcaveCollider, ConvexCollider, Rect
+
+
+def _square(x, y, size=2):
+    return ConvexCollider([(x, y), (x + size, y), (x + size, y + size), (x, y + size)])
+
+
+def test_world_add_remove():
+    world = CollisionWorld(cell_size=4)
+    collider = _square(0, 0)
+
+    world.add(collider)
+    assert collider in world
+    assert len(world) == 1
+
+    world.remove(collider)
+    assert collider not in world
+    assert len(world) == 0
+
+
+def test_world_collisions():
+    world = CollisionWorld(cell_size=4)
+    a = _square(0, 0)
+    b = _square(1, 1)
+    c = _square(20, 20)
+    for collider in (a, b, c):
+        world.add(collider)
+
+    pairs = world.collisions()
+
+    assert len(pairs) == 1
+    assert set(pairs[0]) == {a, b}
+
+
+def test_world_pair_reported_once_across_cells():
+    world = CollisionWorld(cell_size=1)
+    a = _square(0, 0, size=5)
+    b = _square(1, 1, size=5)
+    world.add(a)
+    world.add(b)
+
+    assert len(list(world.candidate_pairs())) == 1
+
+
+def test_world_tracks_moves():
+    world = CollisionWorld(cell_size=4)
+    a = _square(0, 0)
+    b = _square(20, 20)
+    world.add(a)
+    world.add(b)
+
+    assert world.collisions() == []
+
+    a.topleft = (19, 19)
+
+    assert len(world.collisions()) == 1
+
+    a.topleft = (0, 0)
+
+    assert world.collisions() == []
+
+
+def test_world_concave_collisions():
+    world = CollisionWorld(cell_size=2)
+    concave = ConcaveCollider([(3, 3), (5, 3), (5, 4), (4, 4), (4, 5), (5, 5), (5, 6), (3, 6)])
+    inside_notch = ConvexCollider([(4.5, 4.2), (4.9, 4.2), (4.9, 4.8)])
+    overlapping = ConvexCollider([(4.5, 3.5), (6, 2), (6, 4)])
+    for collider in (concave, inside_notch, overlapping):
+        world.add(collider)
+
+    assert world.query_collider(concave) == [overlapping]
+
+
+def test_world_query_rect():
+    world = CollisionWorld(cell_size=4)
+    a = _square(0, 0)
+    b = _square(10, 10)
+    world.add(a)
+    world.add(b)
+
+    assert world.query_rect(Rect(-1, -1, 3, 3)) == [a]
+    assert world.query_rect(Rect(30, 30, 3, 3)) == []